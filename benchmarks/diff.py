@@ -0,0 +1,85 @@
+"""
+Measure diffing two exports of a project with 30000 communication objects.
+
+Run with `python -m benchmarks.diff` from the repository root. The synthetic
+project is parsed once and compared to a modified copy that doesn't share any
+entry with it - 1 % of the communication objects are relinked, 0.2 % of the
+group addresses get another DPT and 0.1 % are removed.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+import tempfile
+import timeit
+
+from benchmarks.synthetic_project import ProjectSize, write_knxproj
+from xknxproject import XKNXProj
+from xknxproject.diff import ProjectIndex, diff_projects
+from xknxproject.models import KNXProject
+
+# 750 application programs with 40 ComObjects each - one device per program
+SIZE = ProjectSize(
+    group_addresses=30000,
+    areas=8,
+    lines_per_area=8,
+    devices=750,
+    com_objects_per_device=40,
+    manufacturers=25,
+    application_programs_per_manufacturer=30,
+    com_objects_per_application_program=40,
+    parameters_per_application_program=10,
+    master_data_manufacturers=30,
+    rooms=200,
+)
+
+
+def modify(project: KNXProject) -> KNXProject:
+    """Return a modified deep copy of a project."""
+    modified: KNXProject = json.loads(json.dumps(project))
+    for index, com_object in enumerate(modified["communication_objects"].values()):
+        if index % 100 == 0:
+            com_object["group_address_links"].append("GA-1")
+    group_addresses = modified["group_addresses"]
+    for index, identifier in enumerate(list(group_addresses)):
+        if index % 500 == 0:
+            group_addresses[identifier]["dpt_type"] = {"main": 9, "sub": 1}
+        elif index % 1000 == 1:
+            del group_addresses[identifier]
+    return modified
+
+
+def main() -> None:
+    """Print the time needed to diff the projects and to fingerprint all entries."""
+    with tempfile.TemporaryDirectory() as directory:
+        path = Path(directory) / "diff.knxproj"
+        write_knxproj(path, SIZE)
+        project = XKNXProj(path).parse()
+    modified = modify(project)
+
+    project_diff = diff_projects(project, modified)
+    print(
+        f"{len(project['communication_objects'])} communication objects, "
+        f"{len(project['group_addresses'])} group addresses"
+    )
+    for section, section_diff in project_diff.sections.items():
+        print(
+            f"  {section:<24}{len(section_diff.added):>6} added"
+            f"{len(section_diff.removed):>6} removed{len(section_diff.changed):>6} changed"
+        )
+    for name, statement in (
+        ("diff_projects", lambda: diff_projects(project, modified)),
+        (
+            "fingerprints",
+            lambda: [
+                ProjectIndex(project).fingerprints(section)
+                for section in ("communication_objects", "group_addresses")
+            ],
+        ),
+    ):
+        best = min(timeit.repeat(statement, number=1, repeat=5))
+        print(f"{name:<16}{best * 1000:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
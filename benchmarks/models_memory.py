@@ -0,0 +1,112 @@
+"""Measure the memory footprint of the intermediate project models.
+
+Run with `python -m benchmarks.models_memory [COUNT]` from the repository root.
+Each model is compared to an equivalent object keeping its attributes in a
+per-instance `__dict__`, the layout these models used before they were slotted.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+import sys
+import tracemalloc
+from types import SimpleNamespace
+from typing import Any
+
+from xknxproject.models import (
+    ComObjectInstanceRef,
+    DeviceInstance,
+    XMLArea,
+    XMLGroupAddress,
+    XMLLine,
+)
+
+AREA = XMLArea(1, "Area", None, [])
+LINE = XMLLine(1, None, "Line", "MT-0", [], AREA)
+
+
+def com_object_instance_ref(index: int) -> ComObjectInstanceRef:
+    """Create a ComObjectInstanceRef with all flags set."""
+    return ComObjectInstanceRef(
+        identifier=None,
+        ref_id=f"O-{index}_R-{index}",
+        text=None,
+        function_text=None,
+        read_flag=True,
+        write_flag=False,
+        communication_flag=True,
+        transmit_flag=None,
+        update_flag=False,
+        read_on_init_flag=None,
+        datapoint_type=None,
+        description=None,
+        links=None,
+    )
+
+
+def device_instance(index: int) -> DeviceInstance:
+    """Create a DeviceInstance."""
+    return DeviceInstance(
+        identifier=f"P-0001-0_DI-{index}",
+        address=str(index),
+        name="Device",
+        last_modified="",
+        hardware_ref="M-0001_H-1",
+        hardware_program_ref="M-0001_H-1_HP-1",
+        line=LINE,
+        manufacturer="M-0001",
+    )
+
+
+def group_address(index: int) -> XMLGroupAddress:
+    """Create a XMLGroupAddress."""
+    return XMLGroupAddress(
+        "Main", "Middle", "GA", f"P-0001-0_GA-{index}", str(index), "", "DPST-1-1"
+    )
+
+
+def unslotted(factory: Callable[[int], Any]) -> Callable[[int], Any]:
+    """Copy the public attributes of a model into a `__dict__` based object."""
+
+    def create(index: int) -> SimpleNamespace:
+        model = factory(index)
+        return SimpleNamespace(
+            **{
+                name: getattr(model, name)
+                for name in dir(model)
+                if not name.startswith("_") and not callable(getattr(model, name))
+            }
+        )
+
+    return create
+
+
+def measure(factory: Callable[[int], Any], count: int) -> float:
+    """Return the traced bytes per object created by factory."""
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    objects = [factory(index) for index in range(count)]
+    after = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del objects
+    return (after - before) / count
+
+
+def main() -> None:
+    """Print the per-object memory of each model."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    print(f"{'model':<22}{'__dict__':>12}{'slotted':>12}{'saved':>10}")
+    for name, factory in (
+        ("ComObjectInstanceRef", com_object_instance_ref),
+        ("DeviceInstance", device_instance),
+        ("XMLGroupAddress", group_address),
+    ):
+        baseline = measure(unslotted(factory), count)
+        slotted = measure(factory, count)
+        print(
+            f"{name:<22}{baseline:>10.0f} B{slotted:>10.0f} B"
+            f"{1 - slotted / baseline:>10.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,116 @@
+"""
+Compare resolving ComObjectInstanceRef ref ids per instance to the batch stage.
+
+Run with `python -m benchmarks.ref_ids [DEVICES]` from the repository root.
+Every device has 50 ComObjectInstanceRefs of one of 10 application programs,
+half of them referencing a module instance like in projects using modules.
+"""
+from __future__ import annotations
+
+import re
+import sys
+import timeit
+
+from xknxproject.models import ComObjectInstanceRef, DeviceInstance, XMLArea, XMLLine
+from xknxproject.util import Interner
+from xknxproject.xml import XMLParser
+
+LINE = XMLLine(1, None, "Line", "MT-0", [], XMLArea(1, "Area", None, []))
+
+
+def create_devices(count: int) -> list[DeviceInstance]:
+    """Create devices with unresolved ComObjectInstanceRefs."""
+    devices = []
+    for index in range(count):
+        device = DeviceInstance(
+            identifier=f"P-0001-0_DI-{index}",
+            address=str(index % 255 + 1),
+            name="",
+            last_modified="",
+            hardware_ref="M-0001_H-1",
+            hardware_program_ref="M-0001_H-1_HP-1",
+            line=LINE,
+            manufacturer="M-0001",
+        )
+        device.application_program_ref = f"M-0001_A-{index % 10}"
+        device.com_object_instance_refs = [
+            ComObjectInstanceRef(
+                identifier=None,
+                ref_id=(
+                    f"MD-1_M-1_MI-{index % 4 + 1}_O-3-{number}_R-{number}"
+                    if number % 2
+                    else f"O-{number}_R-{number}"
+                ),
+                text=None,
+                function_text=None,
+                read_flag=None,
+                write_flag=None,
+                communication_flag=None,
+                transmit_flag=None,
+                update_flag=None,
+                read_on_init_flag=None,
+                datapoint_type=None,
+                description=None,
+                links=["GA-1"],
+            )
+            for number in range(50)
+        ]
+        devices.append(device)
+    return devices
+
+
+def resolve_per_instance(devices: list[DeviceInstance]) -> None:
+    """Resolve ref ids like before the batch stage - re.sub for every instance."""
+    interner = Interner()
+    for device in devices:
+        for com_object in device.com_object_instance_refs:
+            ref_id = re.sub(r"(M-\d+?_MI-\d+?_)", "", com_object.ref_id)
+            com_object.ref_id = interner(f"{device.application_program_ref}_{ref_id}")
+
+
+def resolve_batch(devices: list[DeviceInstance]) -> None:
+    """Resolve ref ids with the batch stage of XMLParser."""
+    parser = XMLParser(None)  # type: ignore[arg-type]
+    parser.devices = devices
+    parser._resolve_com_object_ref_ids()  # pylint: disable=protected-access
+
+
+def main() -> None:
+    """Print the time of each way to resolve the ref ids."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    expected = create_devices(count)
+    resolve_per_instance(expected)
+    print(f"{'method':<16}{'time':>12}   ({count * 50} ComObjectInstanceRefs)")
+    for name, resolve in (
+        ("per instance", resolve_per_instance),
+        ("batch", resolve_batch),
+    ):
+        devices = create_devices(count)
+        resolve(devices)
+        assert [
+            com_object.ref_id
+            for device in devices
+            for com_object in device.com_object_instance_refs
+        ] == [
+            com_object.ref_id
+            for device in expected
+            for com_object in device.com_object_instance_refs
+        ]
+        best = min(
+            timeit.repeat(
+                "resolve(devices)",
+                setup="devices = create_devices(count)",
+                globals={
+                    "resolve": resolve,
+                    "create_devices": create_devices,
+                    "count": count,
+                },
+                number=1,
+                repeat=5,
+            )
+        )
+        print(f"{name:<16}{best * 1000:>9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Compare the binary KNXProject serialization to json.
+
+Run with `python -m benchmarks.serialization [COPIES]` from the repository root.
+The ETS6 test project is parsed and its sections are replicated COPIES times
+with distinct keys to get a project of realistic size. The copies compress far
+better than a real project does.
+
+The run fails if the binary format loads slower than `json.loads`. With 2000
+copies it is about a fifth of the size of JSON and loads in about 70 % of the
+time of `json.loads` - e.g. 1333 kB loaded in 80 ms against 6929 kB in 115 ms.
+Dumping takes about twice the time of `json.dumps` - cache entries are written
+once and loaded many times.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable
+from functools import partial
+import json
+from pathlib import Path
+import sys
+import timeit
+from typing import Any
+
+from xknxproject import XKNXProj, serialization
+from xknxproject.models import KNXProject
+
+TEST_PROJECT = (
+    Path(__file__).parent.parent / "test" / "resources" / "testprojekt-ets6.knxproj"
+)
+
+
+def replicate(project: KNXProject, copies: int) -> KNXProject:
+    """Return a project holding every section entry `copies` times."""
+    enlarged: dict[str, Any] = {"version": project["version"]}
+    for section, entries in project.items():
+        if isinstance(entries, dict):
+            enlarged[section] = {
+                f"{key}_{copy}": json.loads(json.dumps(value))
+                for copy in range(copies)
+                for key, value in entries.items()
+            }
+    return enlarged  # type: ignore[return-value]
+
+
+def measure(function: Callable[[], Any]) -> float:
+    """Return the best time of a few runs in milliseconds."""
+    return min(timeit.repeat(function, number=1, repeat=5)) * 1000
+
+
+def main() -> None:
+    """Print size, dump and load time of each format."""
+    copies = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    project = replicate(XKNXProj(TEST_PROJECT, "test").parse(), copies)
+
+    formats: dict[str, tuple[Callable[[Any], Any], Callable[[Any], Any]]] = {
+        "json": (json.dumps, json.loads),
+        "binary": (serialization.dumps, serialization.loads),
+        "binary compressed": (
+            lambda project: serialization.dumps(project, compress=True),
+            serialization.loads,
+        ),
+    }
+    print(f"{'format':<20}{'size':>12}{'dump':>12}{'load':>12}")
+    load_times: dict[str, float] = {}
+    for name, (dump, load) in formats.items():
+        data = dump(project)
+        assert load(data) == project
+        load_times[name] = measure(partial(load, data))
+        print(
+            f"{name:<20}{len(data) / 1024:>9.0f} kB"
+            f"{measure(partial(dump, project)):>9.1f} ms"
+            f"{load_times[name]:>9.1f} ms"
+        )
+    assert load_times["binary"] <= load_times["json"], "binary loads slower than json"
+
+
+if __name__ == "__main__":
+    main()
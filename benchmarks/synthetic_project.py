@@ -0,0 +1,482 @@
+"""
+Generate synthetic .knxproj files of configurable size.
+
+Run with `python -m benchmarks.synthetic_project FILE [options]` from the
+repository root, or use `write_knxproj` from benchmarks.
+
+The archives hold everything the parser reads: 0.xml and project.xml - in a
+password protected archive if a password is given (ZipCrypto for ETS5, AES
+for ETS6 like ETS does) - knx_master.xml and a Hardware.xml and application
+programs for every manufacturer. Devices are spread evenly over lines,
+manufacturers and application programs and link their communication objects
+to the group addresses in turn.
+"""
+from __future__ import annotations
+
+import argparse
+from dataclasses import dataclass, fields
+import io
+from pathlib import Path
+import struct
+from typing import Final
+from zipfile import ZIP_DEFLATED, ZipFile
+import zlib
+
+import pyzipper
+
+from xknxproject.zip.extractor import _generate_ets6_zip_password
+
+PROJECT_ID: Final = "P-0B1E"
+_NAMESPACES: Final = {
+    False: "http://knx.org/xml/project/20",
+    True: "http://knx.org/xml/project/21",
+}
+_TOOL_VERSIONS: Final = {False: "ETS5", True: "ETS6"}
+_DATAPOINT_TYPES: Final = ("DPST-1-1", "DPST-5-1", "DPST-9-1", None)
+
+
+@dataclass(frozen=True)
+class ProjectSize:
+    """Number of entities of a synthetic project."""
+
+    group_addresses: int = 1000
+    areas: int = 2
+    lines_per_area: int = 4
+    devices: int = 100
+    com_objects_per_device: int = 10
+    manufacturers: int = 4
+    application_programs_per_manufacturer: int = 2
+    # ComObjects of an application program - only the first
+    # `com_objects_per_device` are used by devices
+    com_objects_per_application_program: int = 40
+    # padding elements of an application program not needed by the parser
+    parameters_per_application_program: int = 500
+    # manufacturers listed in knx_master.xml - at least `manufacturers`
+    master_data_manufacturers: int = 600
+    rooms: int = 20
+    # ComObjectInstanceRefs referencing a module instance - stripped when
+    # resolving their ref ids
+    module_instances: bool = False
+
+    def __post_init__(self) -> None:
+        """Validate the size."""
+        if self.group_addresses > 0xFFFF:
+            raise ValueError("At most 65535 group addresses are supported")
+        if self.devices > self.areas * self.lines_per_area * 255:
+            raise ValueError("At most 255 devices per line are supported")
+        if self.com_objects_per_device > self.com_objects_per_application_program:
+            raise ValueError("Devices can't use more ComObjects than a program has")
+
+
+def write_knxproj(
+    path: Path, size: ProjectSize, ets6: bool = False, password: str | None = None
+) -> None:
+    """Write a synthetic .knxproj file."""
+    manufacturers = [f"M-{index + 1:04X}" for index in range(size.manufacturers)]
+    project_files = {
+        "0.xml": _project_xml(size, ets6, manufacturers),
+        "project.xml": _project_information_xml(ets6),
+    }
+    with ZipFile(path, mode="w", compression=ZIP_DEFLATED) as archive:
+        if password is None:
+            for name, data in project_files.items():
+                archive.writestr(f"{PROJECT_ID}/{name}", data)
+        elif ets6:
+            archive.writestr(
+                f"{PROJECT_ID}.zip",
+                _aes_archive(project_files, _generate_ets6_zip_password(password)),
+            )
+        else:
+            archive.writestr(
+                f"{PROJECT_ID}.zip",
+                _zip_crypto_archive(project_files, password.encode("utf-8")),
+            )
+        archive.writestr(f"{PROJECT_ID}.signature", bytes(172))
+        archive.writestr("knx_master.xml", _master_data_xml(size, ets6))
+        for manufacturer in manufacturers:
+            archive.writestr(f"{manufacturer}.signature", bytes(172))
+            archive.writestr(
+                f"{manufacturer}/Hardware.xml",
+                _hardware_xml(size, ets6, manufacturer),
+            )
+            for program in range(size.application_programs_per_manufacturer):
+                application_program_ref = _application_program_ref(
+                    manufacturer, program
+                )
+                archive.writestr(
+                    f"{manufacturer}/{application_program_ref}.xml",
+                    _application_program_xml(size, ets6, application_program_ref),
+                )
+
+
+def _header(ets6: bool) -> str:
+    """Return the XML declaration and the opening root element."""
+    return (
+        '<?xml version="1.0" encoding="utf-8"?>\n'
+        f'<KNX xmlns="{_NAMESPACES[ets6]}" CreatedBy="{_TOOL_VERSIONS[ets6]}">\n'
+    )
+
+
+def _hardware_ref(manufacturer: str, program: int) -> str:
+    """Return the Hardware Id of an application program."""
+    return f"{manufacturer}_H-SYN.2D{program}"
+
+
+def _application_program_ref(manufacturer: str, program: int) -> str:
+    """Return the ApplicationProgram Id."""
+    return f"{manufacturer}_A-5{program:03X}-10-0000"
+
+
+def _com_object_id(size: ProjectSize, number: int) -> str:
+    """Return the ComObject id - without application program ref."""
+    if size.module_instances and number % 2:
+        return f"MD-1_O-3-{number}"
+    return f"O-{number}"
+
+
+def _com_object_instance_ref_id(size: ProjectSize, number: int, module: int) -> str:
+    """Return the RefId of a ComObjectInstanceRef - module instances are resolved by the parser."""
+    com_object_id = _com_object_id(size, number)
+    if com_object_id.startswith("MD-"):
+        com_object_id = com_object_id.replace("_", f"_M-1_MI-{module}_", 1)
+    return f"{com_object_id}_R-{number}"
+
+
+def _project_xml(size: ProjectSize, ets6: bool, manufacturers: list[str]) -> bytes:
+    """Return 0.xml."""
+    lines = size.areas * size.lines_per_area
+    programs = size.application_programs_per_manufacturer
+    parts = [
+        _header(ets6),
+        f'<Project Id="{PROJECT_ID}"><Installations>'
+        '<Installation Name="" BCUKey="4294967295"><Topology>\n',
+    ]
+    puid = 0
+    for area in range(size.areas):
+        parts.append(
+            f'<Area Id="{PROJECT_ID}-0_A-{area}" Address="{area}" Name="Area {area}">\n'
+        )
+        for line_in_area in range(size.lines_per_area):
+            line = area * size.lines_per_area + line_in_area
+            parts.append(
+                f'<Line Id="{PROJECT_ID}-0_L-{line}" Address="{line_in_area}" Name="Line {line}"'
+                + ("" if ets6 else ' MediumTypeRefId="MT-0"')
+                + ">\n"
+            )
+            if ets6:
+                parts.append(
+                    f'<Segment Id="{PROJECT_ID}-0_S-{line}" Number="0" MediumTypeRefId="MT-0">\n'
+                )
+            for device in range(line, size.devices, lines):
+                manufacturer = manufacturers[device % len(manufacturers)]
+                program = device // len(manufacturers) % programs
+                hardware_ref = _hardware_ref(manufacturer, program)
+                puid += 1
+                parts.append(
+                    f'<DeviceInstance Id="{PROJECT_ID}-0_DI-{device}" Address="{device // lines + 1}" '
+                    f'Name="Device {device}" ProductRefId="{hardware_ref}_P-SYN.2D{program}" '
+                    f'Hardware2ProgramRefId="{hardware_ref}_HP-5{program:03X}-10-0000" '
+                    f'LastModified="2023-01-01T00:00:00Z" Puid="{puid}">\n'
+                    "<ComObjectInstanceRefs>\n"
+                )
+                for number in range(size.com_objects_per_device):
+                    group_address = (
+                        device * size.com_objects_per_device + number
+                    ) % size.group_addresses + 1
+                    parts.append(
+                        f'<ComObjectInstanceRef RefId="{_com_object_instance_ref_id(size, number, device % 4 + 1)}" '
+                        f'Text="Channel {number}" Links="GA-{group_address}" />\n'
+                    )
+                parts.append("</ComObjectInstanceRefs>\n</DeviceInstance>\n")
+            if ets6:
+                parts.append("</Segment>\n")
+            parts.append("</Line>\n")
+        parts.append("</Area>\n")
+    parts.append("</Topology>\n<Locations>\n")
+
+    parts.append(f'<Space Type="Building" Id="{PROJECT_ID}-0_BP-1" Name="Building">\n')
+    for room in range(size.rooms):
+        parts.append(
+            f'<Space Type="Room" Id="{PROJECT_ID}-0_R-{room}" Name="Room {room}">\n'
+        )
+        for device in range(room, size.devices, size.rooms):
+            parts.append(f'<DeviceInstanceRef RefId="{PROJECT_ID}-0_DI-{device}" />\n')
+        parts.append("</Space>\n")
+    parts.append("</Space>\n</Locations>\n<GroupAddresses><GroupRanges>\n")
+
+    for main in range((size.group_addresses + 2047) // 2048):
+        parts.append(f'<GroupRange Name="Main {main}">\n')
+        for middle in range(8):
+            first = main * 2048 + middle * 256
+            if first >= size.group_addresses:
+                break
+            parts.append(f'<GroupRange Name="Middle {main}/{middle}">\n')
+            for index in range(first, min(first + 256, size.group_addresses)):
+                dpt = _DATAPOINT_TYPES[index % len(_DATAPOINT_TYPES)]
+                parts.append(
+                    f'<GroupAddress Id="{PROJECT_ID}-0_GA-{index + 1}" Address="{index + 1}" '
+                    f'Name="Group address {index + 1}"'
+                    + (f' DatapointType="{dpt}"' if dpt else "")
+                    + " />\n"
+                )
+            parts.append("</GroupRange>\n")
+        parts.append("</GroupRange>\n")
+    parts.append(
+        "</GroupRanges></GroupAddresses>\n</Installation></Installations></Project>\n</KNX>\n"
+    )
+    return "".join(parts).encode("utf-8")
+
+
+def _project_information_xml(ets6: bool) -> bytes:
+    """Return project.xml."""
+    return (
+        f'{_header(ets6)}<Project Id="{PROJECT_ID}">'
+        '<ProjectInformation Name="Synthetic" GroupAddressStyle="ThreeLevel" />'
+        "</Project>\n</KNX>\n"
+    ).encode("utf-8")
+
+
+def _master_data_xml(size: ProjectSize, ets6: bool) -> bytes:
+    """Return knx_master.xml - ETS6 is detected from its first two lines."""
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n',
+        f'<KNX xmlns="{_NAMESPACES[ets6]}">\n<MasterData Id="MD-1">\n<DatapointTypes>\n',
+    ]
+    for main, name, subs in ((1, "1.xxx", 10), (5, "5.xxx", 6), (9, "9.xxx", 30)):
+        parts.append(f'<DatapointType Id="DPT-{main}" Number="{main}" Name="{name}">\n')
+        parts.append("<DatapointSubtypes>\n")
+        for sub in range(1, subs + 1):
+            parts.append(
+                f'<DatapointSubtype Id="DPST-{main}-{sub}" Number="{sub}" Name="DPT_{main}_{sub}" />\n'
+            )
+        parts.append("</DatapointSubtypes>\n</DatapointType>\n")
+    parts.append(
+        "</DatapointTypes>\n<MediumTypes>\n"
+        '<MediumType Id="MT-0" Number="0" Name="TP" Text="Twisted Pair" />\n'
+        '<MediumType Id="MT-5" Number="5" Name="IP" Text="KNXnet/IP" />\n'
+        "</MediumTypes>\n<Manufacturers>\n"
+    )
+    for index in range(max(size.master_data_manufacturers, size.manufacturers)):
+        parts.append(
+            f'<Manufacturer Id="M-{index + 1:04X}" KnxManufacturerId="{index + 1}" '
+            f'Name="Manufacturer {index + 1}" />\n'
+        )
+    parts.append("</Manufacturers>\n</MasterData>\n</KNX>\n")
+    return "".join(parts).encode("utf-8")
+
+
+def _hardware_xml(size: ProjectSize, ets6: bool, manufacturer: str) -> bytes:
+    """Return the Hardware.xml of a manufacturer."""
+    parts = [
+        _header(ets6),
+        f'<ManufacturerData><Manufacturer RefId="{manufacturer}"><Hardware>\n',
+    ]
+    for program in range(size.application_programs_per_manufacturer):
+        hardware_ref = _hardware_ref(manufacturer, program)
+        parts.append(
+            f'<Hardware Id="{hardware_ref}" Name="Actuator {program}">\n'
+            f'<Products><Product Id="{hardware_ref}_P-SYN.2D{program}" Text="Actuator {program} product" /></Products>\n'
+            f'<Hardware2Programs><Hardware2Program Id="{hardware_ref}_HP-5{program:03X}-10-0000">'
+            f'<ApplicationProgramRef RefId="{_application_program_ref(manufacturer, program)}" />'
+            "</Hardware2Program></Hardware2Programs>\n</Hardware>\n"
+        )
+    parts.append("</Hardware></Manufacturer></ManufacturerData>\n</KNX>\n")
+    return "".join(parts).encode("utf-8")
+
+
+def _application_program_xml(
+    size: ProjectSize, ets6: bool, application_program_ref: str
+) -> bytes:
+    """Return an application program."""
+    parts = [
+        _header(ets6),
+        "<ManufacturerData><Manufacturer><ApplicationPrograms>\n"
+        f'<ApplicationProgram Id="{application_program_ref}" Name="Synthetic">\n'
+        "<Static><Parameters>\n",
+    ]
+    for parameter in range(size.parameters_per_application_program):
+        parts.append(
+            f'<Parameter Id="{application_program_ref}_P-{parameter}" Name="Parameter {parameter}" '
+            f'ParameterType="{application_program_ref}_PT-Percent" Text="Parameter {parameter}" Value="0" />\n'
+        )
+    parts.append("</Parameters>\n<ComObjectTable>\n")
+    com_object_ids = [
+        _com_object_id(size, number)
+        for number in range(size.com_objects_per_application_program)
+    ]
+    flags = ("Enabled", "Disabled")
+    for number, com_object_id in enumerate(com_object_ids):
+        parts.append(
+            f'<ComObject Id="{application_program_ref}_{com_object_id}" Name="Object {number}" '
+            f'Text="Object {number}" Number="{number}" FunctionText="Function {number % 8}" '
+            f'ObjectSize="1 Bit" ReadFlag="{flags[number % 2]}" WriteFlag="Enabled" '
+            f'CommunicationFlag="Enabled" TransmitFlag="{flags[(number + 1) % 2]}" '
+            'UpdateFlag="Disabled" ReadOnInitFlag="Disabled" DatapointType="DPST-1-1" />\n'
+        )
+    parts.append("</ComObjectTable>\n<ComObjectRefs>\n")
+    for number, com_object_id in enumerate(com_object_ids):
+        parts.append(
+            f'<ComObjectRef Id="{application_program_ref}_{com_object_id}_R-{number}" '
+            f'RefId="{application_program_ref}_{com_object_id}"'
+            + (' DatapointType="DPST-1-8"' if number % 3 == 0 else "")
+            + " />\n"
+        )
+    parts.append(
+        "</ComObjectRefs>\n</Static>\n</ApplicationProgram>\n"
+        "</ApplicationPrograms></Manufacturer></ManufacturerData>\n</KNX>\n"
+    )
+    return "".join(parts).encode("utf-8")
+
+
+def _aes_archive(files: dict[str, bytes], password: bytes) -> bytes:
+    """Return a ZIP archive encrypted with AES like ETS6 writes it."""
+    buffer = io.BytesIO()
+    with pyzipper.AESZipFile(
+        buffer, mode="w", compression=ZIP_DEFLATED, encryption=pyzipper.WZ_AES
+    ) as archive:
+        archive.setpassword(password)
+        for name, data in files.items():
+            archive.writestr(name, data)
+    return buffer.getvalue()
+
+
+def _zip_crypto_archive(files: dict[str, bytes], password: bytes) -> bytes:
+    """
+    Return a ZIP archive encrypted with ZipCrypto like ETS5 writes it.
+
+    `zipfile` can only read such archives so the records are written here.
+    """
+    buffer = io.BytesIO()
+    central_directory = []
+    # flags: encrypted, UTF-8 names - date: 1980-01-01
+    flags, method, time, date = 0x0801, 8, 0, 0x21
+    for name, data in files.items():
+        crc = zlib.crc32(data)
+        compressor = zlib.compressobj(wbits=-15)
+        compressed = compressor.compress(data) + compressor.flush()
+        # 12 byte encryption header - its last byte checks the password
+        encrypted = _ZipCrypto(password).encrypt(
+            bytes(11) + bytes([crc >> 24]) + compressed
+        )
+        encoded_name = name.encode("utf-8")
+        offset = buffer.tell()
+        buffer.write(
+            struct.pack(
+                "<4s5H3L2H",
+                b"PK\x03\x04",
+                20,
+                flags,
+                method,
+                time,
+                date,
+                crc,
+                len(encrypted),
+                len(data),
+                len(encoded_name),
+                0,
+            )
+        )
+        buffer.write(encoded_name)
+        buffer.write(encrypted)
+        central_directory.append(
+            struct.pack(
+                "<4s6H3L5H2L",
+                b"PK\x01\x02",
+                20,
+                20,
+                flags,
+                method,
+                time,
+                date,
+                crc,
+                len(encrypted),
+                len(data),
+                len(encoded_name),
+                0,
+                0,
+                0,
+                0,
+                0,
+                offset,
+            )
+            + encoded_name
+        )
+    directory_offset = buffer.tell()
+    for record in central_directory:
+        buffer.write(record)
+    buffer.write(
+        struct.pack(
+            "<4s4H2LH",
+            b"PK\x05\x06",
+            0,
+            0,
+            len(central_directory),
+            len(central_directory),
+            buffer.tell() - directory_offset,
+            directory_offset,
+            0,
+        )
+    )
+    return buffer.getvalue()
+
+
+def _crc_table() -> list[int]:
+    """Return the CRC-32 table of the ZipCrypto key updates."""
+    table = []
+    for crc in range(256):
+        for _ in range(8):
+            crc = crc >> 1 ^ 0xEDB88320 if crc & 1 else crc >> 1
+        table.append(crc)
+    return table
+
+
+class _ZipCrypto:
+    """Traditional PKWARE encryption - the inverse of zipfile's decrypter."""
+
+    _CRC_TABLE: Final = _crc_table()
+
+    def __init__(self, password: bytes) -> None:
+        """Initialize the keys with the password."""
+        self._keys = [0x12345678, 0x23456789, 0x34567890]
+        for byte in password:
+            self._update_keys(byte)
+
+    def _update_keys(self, byte: int) -> None:
+        """Update the keys with a plain text byte."""
+        key0, key1, key2 = self._keys
+        key0 = key0 >> 8 ^ self._CRC_TABLE[(key0 ^ byte) & 0xFF]
+        key1 = ((key1 + (key0 & 0xFF)) * 134775813 + 1) & 0xFFFFFFFF
+        key2 = key2 >> 8 ^ self._CRC_TABLE[(key2 ^ key1 >> 24) & 0xFF]
+        self._keys = [key0, key1, key2]
+
+    def encrypt(self, data: bytes) -> bytes:
+        """Encrypt data continuing the key stream."""
+        encrypted = bytearray(len(data))
+        for index, byte in enumerate(data):
+            temp = self._keys[2] | 2
+            encrypted[index] = byte ^ ((temp * (temp ^ 1)) >> 8 & 0xFF)
+            self._update_keys(byte)
+        return bytes(encrypted)
+
+
+def main() -> None:
+    """Write a synthetic .knxproj file of the size given by the arguments."""
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("file", type=Path)
+    parser.add_argument("--ets6", action="store_true")
+    parser.add_argument("--password")
+    for field in fields(ProjectSize):
+        option = f"--{field.name.replace('_', '-')}"
+        if field.type == "bool":
+            parser.add_argument(option, action="store_true")
+        else:
+            parser.add_argument(option, type=int, default=field.default)
+    args = parser.parse_args()
+    size = ProjectSize(
+        **{field.name: getattr(args, field.name) for field in fields(ProjectSize)}
+    )
+    write_knxproj(args.file, size, ets6=args.ets6, password=args.password)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,169 @@
+"""
+Benchmark every stage of `XKNXProj.parse` over synthetic projects of growing size.
+
+Run with `python -m pytest benchmarks --benchmark-group-by=group` from the
+repository root - pytest-benchmark is required. Benchmarks of a stage are
+grouped so its timings for all sizes and archive kinds are listed together:
+a stage scaling linearly grows with the size factor, a quadratic one with
+its square.
+
+Sizes are selected with the environment variable
+`XKNXPROJECT_BENCHMARK_SIZES` - a comma separated list of `SIZES` keys,
+"small,medium" by default. The synthetic archives are generated once per
+session.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterator
+import os
+from pathlib import Path
+
+import pytest
+
+from benchmarks.synthetic_project import PROJECT_ID, ProjectSize, write_knxproj
+from xknxproject import XKNXProj
+from xknxproject.xml import STAGE_DEPENDENCIES, XMLParser
+from xknxproject.zip import (
+    KNXProjContents,
+    clear_zip_password_cache,
+    derive_zip_password,
+    extract,
+)
+from xknxproject.zip.extractor import _is_ets6_project
+
+pytest.importorskip("pytest_benchmark")
+
+PASSWORD = "benchmark"
+# every size is 10 times `small` except for the manufacturers and programs
+SIZES = {
+    "small": ProjectSize(
+        group_addresses=500, devices=50, rooms=10, module_instances=True
+    ),
+    "medium": ProjectSize(
+        group_addresses=5000,
+        areas=4,
+        lines_per_area=8,
+        devices=500,
+        rooms=100,
+        module_instances=True,
+    ),
+    "large": ProjectSize(
+        group_addresses=50000,
+        areas=16,
+        lines_per_area=16,
+        devices=5000,
+        rooms=1000,
+        module_instances=True,
+    ),
+}
+# (ETS6, password protected)
+ARCHIVE_KINDS = {
+    "ets5": (False, False),
+    "ets5-protected": (False, True),
+    "ets6": (True, False),
+    "ets6-protected": (True, True),
+}
+SELECTED_SIZES = os.environ.get("XKNXPROJECT_BENCHMARK_SIZES", "small,medium").split(
+    ","
+)
+
+
+@pytest.fixture(
+    scope="session",
+    params=[
+        (size, kind)
+        for size in SIZES
+        if size in SELECTED_SIZES
+        for kind in ARCHIVE_KINDS
+    ],
+    ids=lambda param: "-".join(param),
+)
+def archive(request, tmp_path_factory) -> tuple[Path, str | None]:
+    """Write a synthetic archive - return its path and password."""
+    size, kind = request.param
+    ets6, protected = ARCHIVE_KINDS[kind]
+    password = PASSWORD if protected else None
+    path = tmp_path_factory.mktemp("projects") / f"{size}-{kind}.knxproj"
+    write_knxproj(path, SIZES[size], ets6=ets6, password=password)
+    return path, password
+
+
+@pytest.fixture
+def contents(archive) -> Iterator[KNXProjContents]:
+    """Provide the extracted contents of the archive."""
+    path, password = archive
+    with extract(path, password) as knx_proj_contents:
+        yield knx_proj_contents
+
+
+def test_archive(archive, contents):
+    """Test the archive is read as its kind and parses to the synthetic entities."""
+    path, password = archive
+    size, kind = path.stem.split("-", 1)
+    ets6, protected = ARCHIVE_KINDS[kind]
+    assert _is_ets6_project(contents.root) is ets6
+    assert (f"{PROJECT_ID}.zip" in contents.root.namelist()) is protected
+
+    project = XKNXProj(path, password).parse()
+    assert len(project["devices"]) == SIZES[size].devices
+    assert len(project["group_addresses"]) == SIZES[size].group_addresses
+
+
+def test_key_derivation(benchmark, archive):
+    """Benchmark deriving the password of the protected project archive."""
+    path, password = archive
+    if password is None:
+        pytest.skip("archive is not protected")
+    benchmark.group = "key_derivation"
+    benchmark.pedantic(
+        derive_zip_password,
+        args=(path, password),
+        setup=clear_zip_password_cache,
+        rounds=5,
+    )
+
+
+def test_extract(benchmark, archive):
+    """Benchmark opening the archive - the key derivation is cached."""
+    path, password = archive
+    benchmark.group = "extract"
+
+    def open_archive() -> None:
+        with extract(path, password):
+            pass
+
+    benchmark(open_archive)
+
+
+@pytest.mark.parametrize("stage", list(STAGE_DEPENDENCIES))
+def test_load_stage(benchmark, contents, stage):
+    """Benchmark a load stage of XMLParser - the stages it depends on are run before."""
+    benchmark.group = stage
+
+    def create_parser() -> tuple[tuple[XMLParser], dict[str, object]]:
+        parser = XMLParser(contents)
+        parser.load(STAGE_DEPENDENCIES[stage])
+        return (parser,), {}
+
+    benchmark.pedantic(
+        lambda parser: parser.load([stage]), setup=create_parser, rounds=5
+    )
+
+
+def test_conversion(benchmark, contents):
+    """Benchmark converting the loaded models to a KNXProject."""
+    benchmark.group = "conversion"
+
+    def create_parser() -> tuple[tuple[XMLParser], dict[str, object]]:
+        parser = XMLParser(contents)
+        parser.load()
+        return (parser,), {}
+
+    benchmark.pedantic(lambda parser: parser.parse(), setup=create_parser, rounds=5)
+
+
+def test_parse(benchmark, archive):
+    """Benchmark a complete parse."""
+    path, password = archive
+    benchmark.group = "parse"
+    benchmark.pedantic(XKNXProj(path, password).parse, rounds=3)
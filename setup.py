@@ -37,6 +37,12 @@ setup(
     package_data={"xknxproject": ["py.typed"]},
     include_package_data=True,
     install_requires=REQUIRES,
+    extras_require={
+        "lxml": ["lxml>=4.9.0"],
+        "numpy": ["numpy>=1.21.0"],
+        "arrow": ["pyarrow>=8.0.0"],
+    },
+    entry_points={"console_scripts": ["xknxproject=xknxproject.cli:main"]},
     keywords="knx eib ets ets5 ets6",
     zip_safe=False,
 )
@@ -0,0 +1,127 @@
+"""Test the application program cache."""
+import os
+from test import RESOURCES_PATH
+from zipfile import ZipInfo
+
+import pytest
+
+from xknxproject import XKNXProj, serialization
+from xknxproject.__version__ import __version__
+from xknxproject.cache import ApplicationProgramCache
+from xknxproject.loader import ApplicationProgramLoader
+from xknxproject.zip import extract
+
+xknx_test_project_protected_ets6 = RESOURCES_PATH / "testprojekt-ets6.knxproj"
+application_program_ref = "M-0083_A-0139-22-F35B-O0072"
+
+
+def test_parse_with_application_program_cache(tmp_path):
+    """Test parsing a project with a cold and a warm cache."""
+    expected = XKNXProj(xknx_test_project_protected_ets6, "test").parse()
+    cache = ApplicationProgramCache(tmp_path)
+    knxproj = XKNXProj(
+        xknx_test_project_protected_ets6, "test", application_program_cache=cache
+    )
+
+    assert knxproj.parse() == expected
+    assert (cache.hits, cache.misses) == (0, 3)
+    assert len(list(tmp_path.iterdir())) == 3
+
+    assert knxproj.parse() == expected
+    assert (cache.hits, cache.misses) == (3, 3)
+
+
+def test_cache_validation(tmp_path):
+    """Test cache entries are only used for the same ZIP entry."""
+    cache = ApplicationProgramCache(tmp_path)
+    with extract(xknx_test_project_protected_ets6, "test") as knx_project_contents:
+        zip_info = knx_project_contents.root.getinfo(
+            f"M-0083/{application_program_ref}.xml"
+        )
+        tables = ApplicationProgramLoader.load_tables(
+            knx_project_contents.root_path / zip_info.filename, None
+        )
+
+    assert cache.get(application_program_ref, zip_info) is None
+    cache.set(application_program_ref, zip_info, tables)
+    assert cache.get(application_program_ref, zip_info) == tables
+
+    changed_info = ZipInfo(zip_info.filename)
+    changed_info.CRC = zip_info.CRC ^ 1
+    changed_info.file_size = zip_info.file_size
+    assert cache.get(application_program_ref, changed_info) is None
+
+    cache.clear()
+    assert cache.get(application_program_ref, zip_info) is None
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        b"not a cache entry",
+        serialization.dumps_value([__version__, [], []], compress=True),
+        serialization.dumps_value(
+            {
+                "version": __version__,
+                "com_object_refs": [{"identifier": "O-1", "__class__": "os"}],
+                "com_objects": [],
+            },
+            compress=True,
+        ),
+        serialization.dumps_value(
+            {
+                "version": __version__,
+                "com_object_refs": [],
+                "com_objects": [{"identifier": ["unhashable"]}],
+            },
+            compress=True,
+        ),
+    ],
+    ids=["garbage", "no tables", "unknown field", "unhashable identifier"],
+)
+def test_cache_invalid_entry(tmp_path, payload):
+    """Test entries not decoding to the tables are misses."""
+    cache = ApplicationProgramCache(tmp_path)
+    zip_info = ZipInfo(f"M-0083/{application_program_ref}.xml")
+    zip_info.CRC = zip_info.file_size = 0
+    cache.set(application_program_ref, zip_info, ({}, {}))
+    assert cache.get(application_program_ref, zip_info) == ({}, {})
+
+    empty_tables = serialization.dumps_value(
+        {"version": __version__, "com_object_refs": [], "com_objects": []},
+        compress=True,
+    )
+    (entry_path,) = tmp_path.glob(f"*{cache.suffix}")
+    header = entry_path.read_bytes()[: -len(empty_tables)]
+    entry_path.write_bytes(header + payload)
+    assert cache.get(application_program_ref, zip_info) is None
+
+
+def test_cache_eviction(tmp_path):
+    """Test least recently used entries are evicted."""
+    zip_info = ZipInfo("M-0001/M-0001_A-0001.xml")
+    zip_info.CRC = 0
+    cache = ApplicationProgramCache(tmp_path, max_size=0)
+    cache.set("M-0001_A-0001", zip_info, ({}, {}))
+    assert cache.get("M-0001_A-0001", zip_info) is None
+
+    cache.max_size = 1024
+    cache.set("M-0001_A-0001", zip_info, ({}, {}))
+    cache.set("M-0001_A-0002", zip_info, ({}, {}))
+    for path in tmp_path.iterdir():
+        os.utime(path, (0, 0))
+    cache.max_size = (tmp_path / "M-0001_A-0001.xkap").stat().st_size
+    assert cache.get("M-0001_A-0001", zip_info) == ({}, {})
+    cache.evict()
+    assert [path.name for path in tmp_path.iterdir()] == ["M-0001_A-0001.xkap"]
+
+
+def test_cache_unsafe_ref(tmp_path):
+    """Test a ref not of the form of application program refs stays in the cache directory."""
+    zip_info = ZipInfo("M-0001/M-0001_A-0001.xml")
+    zip_info.CRC = 0
+    cache = ApplicationProgramCache(tmp_path / "cache")
+    cache.set("../../outside", zip_info, ({}, {}))
+
+    assert cache.get("../../outside", zip_info) == ({}, {})
+    assert [path.parent for path in tmp_path.rglob("*.xkap")] == [tmp_path / "cache"]
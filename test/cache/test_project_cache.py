@@ -0,0 +1,62 @@
+"""Test the project result cache."""
+import asyncio
+import shutil
+from test import RESOURCES_PATH
+from unittest.mock import patch
+
+import pytest
+
+from xknxproject import XKNXProj
+from xknxproject.cache import ProjectCache
+from xknxproject.zip import derive_zip_password
+
+xknx_test_project_protected_ets6 = RESOURCES_PATH / "testprojekt-ets6.knxproj"
+xknx_test_project_ets5 = RESOURCES_PATH / "xknx_test_project_no_password.knxproj"
+
+
+def test_parse_with_project_cache(tmp_path):
+    """Test a cached project is returned without parsing."""
+    cache = ProjectCache(tmp_path / "cache")
+    knxproj = XKNXProj(xknx_test_project_protected_ets6, "test", project_cache=cache)
+
+    expected = knxproj.parse()
+    assert (cache.hits, cache.misses) == (0, 1)
+
+    with patch("xknxproject.xknxproj.extract") as extract_mock:
+        assert knxproj.parse() == expected
+    extract_mock.assert_not_called()
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_project_cache_unknown_section(tmp_path):
+    """Test unknown sections are rejected with a warm cache like without one."""
+    cache = ProjectCache(tmp_path / "cache")
+    knxproj = XKNXProj(xknx_test_project_protected_ets6, "test", project_cache=cache)
+    knxproj.parse()
+
+    with pytest.raises(ValueError):
+        knxproj.parse(include={"group_addresses", "unknown"})
+    with pytest.raises(ValueError):
+        asyncio.run(knxproj.parse_async(include={"group_addresses", "unknown"}))
+    assert knxproj.parse(include={"group_addresses"})["group_addresses"]
+
+
+def test_project_cache_key(tmp_path):
+    """Test the cache key changes with archive, password, version and cache."""
+    archive = tmp_path / "project.knxproj"
+    shutil.copy(xknx_test_project_protected_ets6, archive)
+    cache = ProjectCache(tmp_path / "cache")
+    key = cache.key(archive, "test")
+
+    assert cache.key(archive, "test") == key
+    assert ProjectCache(tmp_path / "cache").key(archive, "test") == key
+    assert cache.key(archive, None, derive_zip_password(archive, "test")) == key
+    assert cache.key(archive, "other") != key
+    assert cache.key(archive, None) != key
+    # the secret of another cache directory
+    assert ProjectCache(tmp_path / "other").key(archive, "test") != key
+    with patch("xknxproject.cache.project_cache.__version__", "0.0.0"):
+        assert cache.key(archive, "test") != key
+
+    shutil.copy(xknx_test_project_ets5, archive)
+    assert cache.key(archive, "test") != key
@@ -2,9 +2,24 @@
 import json
 from test import STUBS_PATH
 
+import pytest
+
+from xknxproject.loader import xml_backend
 from xknxproject.models import KNXProject
 
 
+@pytest.fixture(autouse=True, params=["etree", "lxml"])
+def xml_backend_fixture(request, monkeypatch):
+    """Run every test with each XML backend - lxml is skipped if not installed."""
+    if request.param == "lxml":
+        pytest.importorskip("lxml")
+        backend = xml_backend.LxmlBackend()
+    else:
+        backend = xml_backend.ElementTreeBackend()
+    monkeypatch.setattr(xml_backend, "BACKEND", backend)
+    return backend
+
+
 def assert_stub(to_be_verified: KNXProject, stub_name: str) -> None:
     """Assert input matched loaded stub file."""
     stub_path = STUBS_PATH / stub_name
@@ -0,0 +1,69 @@
+"""Test application program loader."""
+from pathlib import Path
+from test import RESOURCES_PATH
+
+from xknxproject.instrumentation import Instrumentation
+from xknxproject.loader import ApplicationProgramLoader
+from xknxproject.zip import extract
+
+xknx_test_project_protected_ets6 = RESOURCES_PATH / "testprojekt-ets6.knxproj"
+APPLICATION_PROGRAM = "M-0048/M-0048_A-4947-12-DCA9.xml"
+
+
+def test_load_tables_all():
+    """Test loading all ComObjectRefs and ComObjects."""
+    with extract(xknx_test_project_protected_ets6, "test") as knx_project_contents:
+        com_object_refs, com_objects = ApplicationProgramLoader.load_tables(
+            knx_project_contents.root_path / APPLICATION_PROGRAM, None
+        )
+
+    assert len(com_object_refs) == 328
+    assert len(com_objects) == 254
+    com_object_ref = next(iter(com_object_refs.values()))
+    assert com_object_ref.ref_id in com_objects
+
+
+def test_load_tables_used():
+    """Test only used ComObjectRefs are loaded and reading stops once they are found."""
+    with extract(xknx_test_project_protected_ets6, "test") as knx_project_contents:
+        path = knx_project_contents.root_path / APPLICATION_PROGRAM
+        all_refs, all_com_objects = ApplicationProgramLoader.load_tables(path, None)
+        used_ids = set(list(all_refs)[:3])
+
+        instrumentation = Instrumentation()
+        with instrumentation.stage("used") as used_metrics:
+            com_object_refs, com_objects = ApplicationProgramLoader.load_tables(
+                path, used_ids
+            )
+        with instrumentation.stage("all") as all_metrics:
+            ApplicationProgramLoader.load_tables(path, None)
+
+    assert com_object_refs == {key: all_refs[key] for key in used_ids}
+    assert com_objects == {
+        ref.ref_id: all_com_objects[ref.ref_id] for ref in com_object_refs.values()
+    }
+    assert used_metrics.bytes_decompressed < all_metrics.bytes_decompressed
+    assert used_metrics.elements_parsed < all_metrics.elements_parsed
+
+    assert ApplicationProgramLoader.load_tables(path, set()) == ({}, {})
+
+
+def test_load_tables_stops_after_application_program(tmp_path: Path):
+    """Test reading stops at the end of the ApplicationProgram."""
+    path = tmp_path / "application_program.xml"
+    path.write_text(
+        '<KNX xmlns="http://knx.org/xml/project/21"><ManufacturerData>'
+        '<Manufacturer RefId="M-0083"><ApplicationPrograms>'
+        '<ApplicationProgram Id="M-0083_A-0001"><Static><ComObjects>'
+        '<ComObject Id="M-0083_A-0001_O-1" Name="Switch" ObjectSize="1 Bit"/>'
+        "</ComObjects><ComObjectRefs>"
+        '<ComObjectRef Id="M-0083_A-0001_O-1_R-1" RefId="M-0083_A-0001_O-1"/>'
+        "</ComObjectRefs></Static></ApplicationProgram>"
+        # not well-formed - fails the parse if it is read
+        + "<!-- " + "x" * 1_000_000 + " --></Broken>",
+        encoding="utf-8",
+    )
+    com_object_refs, com_objects = ApplicationProgramLoader.load_tables(path, None)
+
+    assert list(com_object_refs) == ["M-0083_A-0001_O-1_R-1"]
+    assert list(com_objects) == ["M-0083_A-0001_O-1"]
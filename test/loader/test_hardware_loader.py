@@ -0,0 +1,32 @@
+"""Test hardware loader."""
+from test import RESOURCES_PATH
+
+from xknxproject.loader import HardwareLoader
+from xknxproject.zip import extract
+
+xknx_test_project_protected_ets5 = RESOURCES_PATH / "xknx_test_project.knxproj"
+
+
+def test_load_hardware():
+    """Test loading all hardware of a Hardware.xml."""
+    with extract(xknx_test_project_protected_ets5, "test") as knx_project_contents:
+        hardware_file = knx_project_contents.root_path / "M-0083" / "Hardware.xml"
+        hardware_list = HardwareLoader.load(hardware_file)
+
+    assert len(hardware_list) == 1
+    hardware = hardware_list[0]
+    assert hardware.identifier == "M-0083_H-136-5-O0072"
+    assert hardware.application_program_refs == {
+        "M-0083_H-136-5-O0072_HP-0139-22-F35B-O0072": "M-0083_A-0139-22-F35B-O0072"
+    }
+
+
+def test_load_hardware_filtered():
+    """Test loading only referenced hardware of a Hardware.xml."""
+    with extract(xknx_test_project_protected_ets5, "test") as knx_project_contents:
+        hardware_file = knx_project_contents.root_path / "M-0083" / "Hardware.xml"
+        assert HardwareLoader.load(hardware_file, {"M-0083_H-136-5-O0072"}) == (
+            HardwareLoader.load(hardware_file)
+        )
+        assert HardwareLoader.load(hardware_file, {"M-0083_H-0-0"}) == []
+        assert HardwareLoader.load(hardware_file, set()) == []
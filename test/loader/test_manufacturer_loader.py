@@ -0,0 +1,25 @@
+"""Test KNX master data loader."""
+from test import RESOURCES_PATH
+
+from xknxproject.loader import ManufacturerLoader, ProjectLoader
+from xknxproject.zip import extract
+
+xknx_test_project_protected_ets6 = RESOURCES_PATH / "testprojekt-ets6.knxproj"
+
+
+def test_load_master_data():
+    """Test loading manufacturer names."""
+    with extract(xknx_test_project_protected_ets6, "test") as knx_project_contents:
+        _, _, devices, _ = ProjectLoader.load(knx_project_contents)
+        master_data = ManufacturerLoader.load(
+            knx_project_contents.root_path / "knx_master.xml", devices
+        )
+
+    assert master_data.manufacturer_names == {
+        "M-0008": "GIRA Giersiepen",
+        "M-0048": "Theben AG",
+        "M-0083": "MDT technologies",
+    }
+    assert {device.manufacturer_name for device in devices} == set(
+        master_data.manufacturer_names.values()
+    )
@@ -0,0 +1,97 @@
+"""Test project loader."""
+import io
+
+from xknxproject.loader import ProjectLoader
+from xknxproject.models import SpaceType
+
+PROJECT_0_XML = b"""<?xml version="1.0" encoding="utf-8"?>
+<KNX xmlns="http://knx.org/xml/project/21">
+  <Project Id="P-0001">
+    <ProjectInformation Name="Test" />
+    <Installations>
+      <Installation Name="">
+        <Locations>
+          <Space Type="Building" Id="P-0001-0_BP-1" Name="House">
+            <Space Type="Room" Id="P-0001-0_BP-2" Name="Kitchen">
+              <DeviceInstanceRef RefId="P-0001-0_DI-2" />
+              <DeviceInstanceRef RefId="P-0001-0_DI-3" />
+            </Space>
+            <DeviceInstanceRef RefId="P-0001-0_DI-1" />
+          </Space>
+        </Locations>
+        <Topology>
+          <Area Id="P-0001-0_A-1" Address="1" Name="Area">
+            <Line Id="P-0001-0_L-1" Address="1" Name="Line" MediumTypeRefId="MT-5">
+              <Segment Id="P-0001-0_S-1" Number="0" MediumTypeRefId="MT-0">
+                <DeviceInstance Id="P-0001-0_DI-1" Address="1" Name="Actuator" ProductRefId="M-0083_H-1_P-1" Hardware2ProgramRefId="M-0083_H-1_HP-1">
+                  <ComObjectInstanceRefs>
+                    <ComObjectInstanceRef RefId="O-1_R-1" Links="GA-1 GA-2" ReadFlag="Enabled" />
+                    <ComObjectInstanceRef RefId="O-2_R-2" />
+                  </ComObjectInstanceRefs>
+                  <AdditionalAddresses>
+                    <Address Address="10" />
+                  </AdditionalAddresses>
+                </DeviceInstance>
+                <DeviceInstance Id="P-0001-0_DI-3" Name="Power supply" ProductRefId="M-0083_H-2_P-2" />
+                <DeviceInstance Id="P-0001-0_DI-2" Address="2" Name="Sensor" ProductRefId="M-0083_H-3_P-3" />
+              </Segment>
+            </Line>
+          </Area>
+          <UnassignedDevices>
+            <DeviceInstance Id="P-0001-0_DI-4" Address="3" ProductRefId="M-0083_H-3_P-3" />
+          </UnassignedDevices>
+        </Topology>
+        <GroupAddresses>
+          <GroupRanges>
+            <GroupRange Id="P-0001-0_GR-1" Name="Main">
+              <GroupRange Id="P-0001-0_GR-2" Name="Middle">
+                <GroupAddress Id="P-0001-0_GA-1" Address="2049" Name="Switch" DatapointType="DPST-1-1" />
+                <GroupAddress Id="P-0001-0_GA-2" Address="2050" Name="Status" />
+              </GroupRange>
+            </GroupRange>
+          </GroupRanges>
+        </GroupAddresses>
+      </Installation>
+    </Installations>
+  </Project>
+</KNX>
+"""
+
+
+class _ProjectContents:
+    """Provide 0.xml like KNXProjContents."""
+
+    def open_project_0(self):
+        """Open the project 0 XML."""
+        return io.BytesIO(PROJECT_0_XML)
+
+
+def test_load_project():
+    """Test loading 0.xml in a single pass."""
+    group_addresses, areas, devices, spaces = ProjectLoader.load(_ProjectContents())
+
+    assert [(ga.address, ga.main_name, ga.middle_name) for ga in group_addresses] == [
+        ("1/0/1", "Main", "Middle"),
+        ("1/0/2", "Main", "Middle"),
+    ]
+    assert group_addresses[0].dpt_type == {"main": 1, "sub": 1}
+
+    assert len(areas) == 1
+    assert len(areas[0].lines) == 1
+    line = areas[0].lines[0]
+    # ETS6 Segment medium type overrides the Line
+    assert line.medium_type == "MT-0"
+    # devices without individual address and unassigned devices are skipped
+    assert line.devices == devices
+    assert [device.individual_address for device in devices] == ["1.1.1", "1.1.2"]
+    assert devices[0].additional_addresses == ["10"]
+    assert [ref.ref_id for ref in devices[0].com_object_instance_refs] == ["O-1_R-1"]
+    assert devices[0].com_object_instance_refs[0].links == ["GA-1", "GA-2"]
+    assert devices[0].com_object_instance_refs[0].read_flag is True
+
+    # Locations precede the Topology
+    assert len(spaces) == 1
+    assert spaces[0].type is SpaceType.BUILDING
+    assert spaces[0].devices == ["1.1.1"]
+    assert spaces[0].spaces[0].name == "Kitchen"
+    assert spaces[0].spaces[0].devices == ["1.1.2"]
@@ -0,0 +1,82 @@
+"""Test XML backends."""
+import io
+
+from xknxproject.loader import xml_backend
+
+DOCUMENT = b"""<?xml version="1.0" encoding="utf-8"?>
+<KNX xmlns="http://knx.org/xml/project/21">
+  <!-- comment -->
+  <ComObjectTable>
+    <ComObject Id="O-1" Name="Switch" />
+    <ComObject Id="O-2" Name="Dim" />
+  </ComObjectTable>
+  <ComObjectRefs>
+    <ComObjectRef Id="O-1_R-1" RefId="O-1" />
+  </ComObjectRefs>
+  <Hardware2Programs>
+    <Hardware2Program Id="HP-1">
+      <ApplicationProgramRef RefId="A-1" />
+    </Hardware2Program>
+    <Hardware2Program Id="HP-2" />
+  </Hardware2Programs>
+</KNX>
+"""
+
+
+def test_backend_selected_at_import():
+    """Test the selected backend is one of the known backends."""
+    assert xml_backend.BACKEND.name in ("etree", "lxml")
+
+
+def test_iterparse_tags(xml_backend_fixture):
+    """Test only elements with the given local names are reported."""
+    elements = [
+        (elem.tag, elem.get("Id"))
+        for _, elem in xml_backend_fixture.iterparse(
+            io.BytesIO(DOCUMENT), tags=("ComObject", "ComObjectRef")
+        )
+    ]
+    namespace = "{http://knx.org/xml/project/21}"
+    assert elements == [
+        (f"{namespace}ComObject", "O-1"),
+        (f"{namespace}ComObject", "O-2"),
+        (f"{namespace}ComObjectRef", "O-1_R-1"),
+    ]
+
+
+def test_iterparse_events(xml_backend_fixture):
+    """Test start and end events of all elements are reported."""
+    events = [
+        (event, elem.tag.rpartition("}")[2])
+        for event, elem in xml_backend_fixture.iterparse(
+            io.BytesIO(DOCUMENT), events=("start", "end")
+        )
+    ]
+    assert events[:3] == [
+        ("start", "KNX"),
+        ("start", "ComObjectTable"),
+        ("start", "ComObject"),
+    ]
+    assert events[-1] == ("end", "KNX")
+    assert len(events) == 2 * 10
+
+
+def test_find_paths(xml_backend_fixture):
+    """Test ElementPath expressions with namespace wildcards."""
+    root = next(
+        elem
+        for event, elem in xml_backend_fixture.iterparse(
+            io.BytesIO(DOCUMENT), events=("end",)
+        )
+        if elem.tag.endswith("KNX")
+    )
+    programs = xml_backend_fixture.findall(
+        root,
+        ".//{*}Hardware2Programs/{*}Hardware2Program[@Id]/{*}ApplicationProgramRef[@RefId]/..",
+    )
+    assert [program.get("Id") for program in programs] == ["HP-1"]
+    assert (
+        xml_backend_fixture.find(programs[0], "{*}ApplicationProgramRef").get("RefId")
+        == "A-1"
+    )
+    assert xml_backend_fixture.find(root, ".//{*}Product") is None
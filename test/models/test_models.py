@@ -0,0 +1,138 @@
+"""Test intermediate models."""
+import pytest
+
+from xknxproject.models import (
+    ComObjectInstanceRef,
+    ComObjectRef,
+    DeviceInstance,
+    XMLArea,
+    XMLGroupAddress,
+    XMLLine,
+    resolve_com_object_ref_id,
+)
+
+
+def _com_object_instance_ref(**flags):
+    return ComObjectInstanceRef(
+        identifier=None,
+        ref_id="O-1_R-1",
+        text=None,
+        function_text=None,
+        read_flag=flags.get("read_flag"),
+        write_flag=flags.get("write_flag"),
+        communication_flag=flags.get("communication_flag"),
+        transmit_flag=flags.get("transmit_flag"),
+        update_flag=flags.get("update_flag"),
+        read_on_init_flag=flags.get("read_on_init_flag"),
+        datapoint_type=None,
+        description=None,
+        links=None,
+    )
+
+
+@pytest.mark.parametrize(
+    "flag",
+    [
+        "read_flag",
+        "write_flag",
+        "communication_flag",
+        "transmit_flag",
+        "update_flag",
+        "read_on_init_flag",
+    ],
+)
+def test_com_object_instance_ref_packed_flags(flag):
+    """Test tri-state flags are stored independently of each other."""
+    instance_ref = _com_object_instance_ref()
+    for value in (True, False, None, False, True):
+        setattr(instance_ref, flag, value)
+        assert getattr(instance_ref, flag) is value
+        assert instance_ref == _com_object_instance_ref(**{flag: value})
+
+
+def test_com_object_instance_ref_eq_repr():
+    """Test equality and repr cover the packed flags like a dataclass."""
+    instance_ref = _com_object_instance_ref(read_flag=True, update_flag=False)
+
+    assert instance_ref == _com_object_instance_ref(read_flag=True, update_flag=False)
+    assert instance_ref != _com_object_instance_ref(read_flag=True)
+    assert instance_ref != object()
+    assert ComObjectInstanceRef.__hash__ is None
+    assert repr(instance_ref) == (
+        "ComObjectInstanceRef(identifier=None, ref_id='O-1_R-1', text=None, "
+        "function_text=None, read_flag=True, write_flag=None, "
+        "communication_flag=None, transmit_flag=None, update_flag=False, "
+        "read_on_init_flag=None, datapoint_type=None, description=None, "
+        "links=None, name=None, number=None, object_size=None)"
+    )
+
+
+def test_com_object_instance_ref_merge_flags():
+    """Test merging only fills flags missing on the instance ref."""
+    instance_ref = _com_object_instance_ref(read_flag=False, transmit_flag=True)
+    instance_ref.merge_from_application(
+        ComObjectRef(
+            identifier="O-1_R-1",
+            ref_id="O-1",
+            name="Switch",
+            text=None,
+            function_text=None,
+            object_size=None,
+            read_flag=True,
+            write_flag=True,
+            communication_flag=True,
+            transmit_flag=False,
+            update_flag=None,
+            read_on_init_flag=False,
+            datapoint_type=None,
+        )
+    )
+    assert instance_ref.read_flag is False
+    assert instance_ref.write_flag is True
+    assert instance_ref.communication_flag is True
+    assert instance_ref.transmit_flag is True
+    assert instance_ref.update_flag is None
+    assert instance_ref.read_on_init_flag is False
+    assert instance_ref.name == "Switch"
+
+
+@pytest.mark.parametrize(
+    "ref_id,expected",
+    [
+        ("O-1_R-1", "M-0001_A-1_O-1_R-1"),
+        ("MD-1_M-1_MI-1_O-3-0_R-1", "M-0001_A-1_MD-1_O-3-0_R-1"),
+        ("MD-2_M-12_MI-3_O-3-1_R-5", "M-0001_A-1_MD-2_O-3-1_R-5"),
+        # "_MI-" without a module part is kept
+        ("O-1_MI-1_R-1", "M-0001_A-1_O-1_MI-1_R-1"),
+    ],
+)
+def test_resolve_com_object_ref_id(ref_id, expected):
+    """Test module instances are stripped from ref ids."""
+    assert resolve_com_object_ref_id("M-0001_A-1", ref_id) == expected
+    instance_ref = _com_object_instance_ref()
+    instance_ref.ref_id = ref_id
+    instance_ref.update_ref_id("M-0001_A-1")
+    assert instance_ref.ref_id == expected
+
+
+def test_models_are_slotted():
+    """Test intermediate models don't carry a per-instance __dict__."""
+    area = XMLArea(1, "Area", None, [])
+    line = XMLLine(2, None, "Line", "MT-0", [], area)
+    device = DeviceInstance(
+        identifier="P-0001-0_DI-1",
+        address="3",
+        name="Device",
+        last_modified="",
+        hardware_ref="M-0001_H-1",
+        hardware_program_ref="M-0001_H-1_HP-1",
+        line=line,
+        manufacturer="M-0001",
+    )
+    group_address = XMLGroupAddress(
+        "Main", "Middle", "GA", "P-0001-0_GA-1", "2049", "", "DPST-1-1"
+    )
+    for model in (area, line, device, group_address, _com_object_instance_ref()):
+        assert not hasattr(model, "__dict__")
+    assert device.individual_address == "1.2.3"
+    assert group_address.address == "1/0/1"
@@ -0,0 +1,129 @@
+"""Test the command line interface."""
+import json
+
+import pytest
+
+from xknxproject import XKNXProj, serialization
+from xknxproject.cli import main
+
+from . import RESOURCES_PATH
+
+xknx_test_project_protected_ets6 = RESOURCES_PATH / "testprojekt-ets6.knxproj"
+xknx_test_project_no_password = RESOURCES_PATH / "xknx_test_project_no_password.knxproj"
+
+
+def test_parse_json(tmp_path, capsys):
+    """Test parsing projects to JSON files."""
+    exit_code = main(
+        [
+            "parse",
+            "-p",
+            "test",
+            "--jobs",
+            "1",
+            "--output-dir",
+            str(tmp_path),
+            str(xknx_test_project_protected_ets6),
+            str(xknx_test_project_no_password),
+        ]
+    )
+    assert exit_code == 0
+    output = capsys.readouterr().out
+    for archive_path in (
+        xknx_test_project_protected_ets6,
+        xknx_test_project_no_password,
+    ):
+        output_path = tmp_path / f"{archive_path.stem}.json"
+        assert f"{archive_path} -> {output_path}" in output
+        with output_path.open(encoding="utf-8") as output_file:
+            assert json.load(output_file) == XKNXProj(archive_path, "test").parse()
+
+
+def test_parse_binary_timings(tmp_path, capsys):
+    """Test parsing a project to the binary format printing stage timings."""
+    exit_code = main(
+        [
+            "parse",
+            "--password",
+            "test",
+            "--format",
+            "binary",
+            "--timings",
+            "--quiet",
+            "--output-dir",
+            str(tmp_path),
+            str(xknx_test_project_protected_ets6),
+        ]
+    )
+    assert exit_code == 0
+    project = serialization.loads((tmp_path / "testprojekt-ets6.xkpb").read_bytes())
+    assert project == XKNXProj(xknx_test_project_protected_ets6, "test").parse()
+
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    for stage in (
+        "extract",
+        "key_derivation",
+        "inflate",
+        "ProjectLoader",
+        "ManufacturerLoader",
+        "HardwareLoader",
+        "ApplicationProgramLoader",
+        "convert_group_addresses",
+        "write",
+        "total",
+    ):
+        assert stage in captured.err
+
+
+def test_parse_invalid_password(tmp_path, capsys):
+    """Test a failing file sets the exit code and doesn't stop other files."""
+    exit_code = main(
+        [
+            "parse",
+            "-p",
+            "wrong",
+            "-p",
+            "test",
+            "-j",
+            "1",
+            "-o",
+            str(tmp_path),
+            str(xknx_test_project_protected_ets6),
+            str(xknx_test_project_no_password),
+        ]
+    )
+    assert exit_code == 1
+    assert "InvalidPasswordException" in capsys.readouterr().err
+    assert not (tmp_path / "testprojekt-ets6.json").exists()
+    assert (tmp_path / "xknx_test_project_no_password.json").exists()
+
+
+@pytest.mark.parametrize("jobs", ["1", "2"])
+def test_parse_corrupt_file(tmp_path, capsys, jobs):
+    """Test a corrupt archive doesn't stop other files - also in a process pool."""
+    corrupt_path = tmp_path / "corrupt.knxproj"
+    corrupt_path.write_bytes(b"PK\x03\x04 not a zip file")
+    exit_code = main(
+        [
+            "parse",
+            "-j",
+            jobs,
+            "-o",
+            str(tmp_path),
+            str(corrupt_path),
+            str(xknx_test_project_no_password),
+        ]
+    )
+    assert exit_code == 1
+    assert f"{corrupt_path}: BadZipFile" in capsys.readouterr().err
+    assert not (tmp_path / "corrupt.json").exists()
+    assert (tmp_path / "xknx_test_project_no_password.json").exists()
+
+
+def test_parse_password_count(capsys):
+    """Test the number of passwords has to match the number of files."""
+    with pytest.raises(SystemExit) as exc_info:
+        main(["parse", "-p", "a", "-p", "b", str(xknx_test_project_no_password)])
+    assert exc_info.value.code == 2
+    assert "2 passwords given for 1 files" in capsys.readouterr().err
@@ -0,0 +1,91 @@
+"""Test column oriented export."""
+import pytest
+
+from xknxproject import XKNXProj
+from xknxproject.columnar import (
+    FLAG_COMMUNICATION,
+    FLAG_READ,
+    FLAG_TRANSMIT,
+    FLAG_WRITE,
+    NO_DPT,
+    export_communication_objects,
+    export_group_addresses,
+)
+
+from . import RESOURCES_PATH
+
+xknx_test_project_protected_ets6 = RESOURCES_PATH / "testprojekt-ets6.knxproj"
+
+
+@pytest.fixture(name="project", scope="module")
+def project_fixture():
+    """Return the parsed ETS6 test project."""
+    return XKNXProj(xknx_test_project_protected_ets6, "test").parse()
+
+
+def test_export_group_addresses(project):
+    """Test group address columns match the project."""
+    columns = export_group_addresses(project)
+    group_addresses = list(project["group_addresses"].values())
+    assert len(columns) == len(group_addresses) == 3
+    for index, group_address in enumerate(group_addresses):
+        assert columns.identifier[index] == group_address["identifier"]
+        assert columns.raw_address[index] == group_address["raw_address"]
+        assert (
+            f"{columns.main_group[index]}/{columns.middle_group[index]}/{columns.sub_group[index]}"
+            == group_address["address"]
+        )
+        dpt = group_address["dpt_type"] or {}
+        assert columns.dpt_main[index] == dpt.get("main", NO_DPT)
+        assert columns.dpt_sub[index] == dpt.get("sub", NO_DPT)
+        start, end = columns.communication_object_ids_offsets[index : index + 2]
+        assert (
+            columns.communication_object_ids[start:end]
+            == group_address["communication_object_ids"]
+        )
+
+
+def test_export_communication_objects(project):
+    """Test communication object columns match the project."""
+    columns = export_communication_objects(project)
+    communication_objects = project["communication_objects"]
+    assert columns.identifier == list(communication_objects)
+    for index, com_object in enumerate(communication_objects.values()):
+        flags = com_object["flags"]
+        assert bool(columns.flags[index] & FLAG_READ) == flags["read"]
+        assert bool(columns.flags[index] & FLAG_WRITE) == flags["write"]
+        assert bool(columns.flags[index] & FLAG_TRANSMIT) == flags["transmit"]
+        assert bool(columns.flags[index] & FLAG_COMMUNICATION) == flags["communication"]
+        start, end = columns.group_address_links_offsets[index : index + 2]
+        assert (
+            columns.group_address_links[start:end] == com_object["group_address_links"]
+        )
+    # equal strings are shared
+    assert columns.group_address_links[0] is columns.group_address_links[2]
+
+
+def test_to_numpy(project):
+    """Test vectorised filtering with NumPy."""
+    np = pytest.importorskip("numpy")
+    columns = export_group_addresses(project).to_numpy()
+    selected = columns["identifier"][
+        (columns["dpt_main"] == 1) & (columns["main_group"] == 0)
+    ]
+    assert list(selected) == [
+        ga["identifier"]
+        for ga in project["group_addresses"].values()
+        if ga["dpt_type"] and ga["dpt_type"]["main"] == 1 and ga["raw_address"] < 2048
+    ]
+    assert columns["raw_address"].dtype == np.uint16
+
+
+def test_to_arrow(project):
+    """Test conversion to a PyArrow table."""
+    pytest.importorskip("pyarrow")
+    table = export_communication_objects(project).to_arrow()
+    assert table.num_rows == len(project["communication_objects"])
+    assert "group_address_links_offsets" not in table.column_names
+    assert table.column("group_address_links").to_pylist() == [
+        com_object["group_address_links"]
+        for com_object in project["communication_objects"].values()
+    ]
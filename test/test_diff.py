@@ -0,0 +1,95 @@
+"""Test the diff of two projects."""
+import copy
+import json
+
+import pytest
+
+from xknxproject import XKNXProj
+from xknxproject.diff import ProjectIndex, diff_projects
+
+from . import RESOURCES_PATH
+
+xknx_test_project_protected_ets6 = RESOURCES_PATH / "testprojekt-ets6.knxproj"
+COM_OBJECT_ID = "M-0008_A-1144-13-EB4F-O000A_O-41_R-822"
+
+
+@pytest.fixture(name="project", scope="module")
+def project_fixture():
+    """Return the parsed ETS6 test project."""
+    return XKNXProj(xknx_test_project_protected_ets6, "test").parse()
+
+
+def test_diff_unchanged(project):
+    """Test a project doesn't differ from a copy of itself."""
+    project_diff = diff_projects(project, json.loads(json.dumps(project)))
+
+    assert not project_diff
+    assert list(project_diff.sections) == [
+        "communication_objects",
+        "topology",
+        "devices",
+        "group_addresses",
+        "locations",
+    ]
+
+
+def test_diff_changes(project):
+    """Test added, removed and changed entries of every section."""
+    new = copy.deepcopy(project)
+    new["group_addresses"]["GA-4"] = {
+        **new["group_addresses"]["GA-3"],
+        "identifier": "GA-4",
+    }
+    del new["group_addresses"]["GA-1"]
+    new["group_addresses"]["GA-2"]["dpt_type"] = {"main": 9, "sub": 1}
+    new["devices"]["1.1.5"]["name"] = "Renamed"
+    new["communication_objects"][COM_OBJECT_ID]["group_address_links"].append("GA-4")
+    new["topology"]["1"]["lines"]["1"]["name"] = "Line 1"
+    kitchen = new["locations"]["testprojekt"]["spaces"]["Erdgeschoss"]["spaces"]
+    kitchen["Küche"]["devices"].append("1.1.6")
+
+    project_diff = diff_projects(project, new)
+
+    assert project_diff
+    assert project_diff.as_dict() == {
+        "communication_objects": {
+            "added": [],
+            "removed": [],
+            "changed": {COM_OBJECT_ID: ["group_address_links"]},
+        },
+        "topology": {"added": [], "removed": [], "changed": {"1.1": ["name"]}},
+        "devices": {"added": [], "removed": [], "changed": {"1.1.5": ["name"]}},
+        "group_addresses": {
+            "added": ["GA-4"],
+            "removed": ["GA-1"],
+            "changed": {"GA-2": ["dpt_type"]},
+        },
+        "locations": {
+            "added": [],
+            "removed": [],
+            "changed": {"testprojekt/Erdgeschoss/Küche": ["devices"]},
+        },
+    }
+    change = project_diff.sections["devices"].changed["1.1.5"]
+    assert change.old is project["devices"]["1.1.5"]
+    assert change.new["name"] == "Renamed"
+
+
+def test_project_index(project):
+    """Test flattened entries and fingerprints of an index."""
+    index = ProjectIndex(project)
+    assert list(index.entries("topology")) == ["0", "0.0", "1", "1.0", "1.1"]
+    assert "lines" not in index.entries("topology")["1"]
+    assert list(index.entries("locations")) == [
+        "testprojekt",
+        "testprojekt/Erdgeschoss",
+        "testprojekt/Erdgeschoss/Küche",
+        "testprojekt/Erdgeschoss/Bad",
+        "testprojekt/Technik",
+    ]
+    # fingerprints survive a JSON round trip
+    assert ProjectIndex(json.loads(json.dumps(project))).fingerprints(
+        "devices"
+    ) == index.fingerprints("devices")
+    with pytest.raises(ValueError):
+        diff_projects(project, project, sections=["version"])
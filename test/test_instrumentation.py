@@ -0,0 +1,93 @@
+"""Test the instrumentation of parse stages."""
+import json
+import tracemalloc
+
+from xknxproject import XKNXProj
+from xknxproject.instrumentation import (
+    Instrumentation,
+    count_decompressed,
+    current_stage,
+    measure,
+    nested_stage,
+)
+
+from . import RESOURCES_PATH
+
+xknx_test_project_protected_ets6 = RESOURCES_PATH / "testprojekt-ets6.knxproj"
+
+
+def test_parse_stages():
+    """Test every stage of a parse is measured."""
+    events = []
+    instrumentation = Instrumentation(
+        callback=lambda event, metrics: events.append((event, metrics.name))
+    )
+    project = XKNXProj(
+        xknx_test_project_protected_ets6, "test", instrumentation=instrumentation
+    ).parse()
+    assert project == XKNXProj(xknx_test_project_protected_ets6, "test").parse()
+
+    stages = {metrics.name: metrics for metrics in instrumentation.stages}
+    assert list(stages) == [
+        "extract",
+        "key_derivation",
+        "inflate",
+        "project",
+        "hardware",
+        "application_programs",
+        "master_data",
+        "convert_communication_objects",
+        "convert_topology",
+        "convert_devices",
+        "convert_group_addresses",
+        "convert_locations",
+    ]
+    assert stages["key_derivation"].depth == 1
+    assert stages["extract"].bytes_decompressed == stages["inflate"].bytes_decompressed
+    for name in ("project", "hardware", "application_programs", "master_data"):
+        assert stages[name].depth == 0
+        assert stages[name].bytes_decompressed > 0
+        assert stages[name].elements_parsed > 0
+        assert stages[name].wall_time > 0
+        assert stages[name].peak_memory is None
+    assert events[:3] == [
+        ("start", "extract"),
+        ("start", "key_derivation"),
+        ("end", "key_derivation"),
+    ]
+    assert len(events) == 2 * len(stages)
+
+    exported = json.loads(json.dumps(instrumentation.as_dict()))
+    assert [stage["name"] for stage in exported["stages"]] == list(stages)
+    assert exported["wall_time"] >= stages["application_programs"].wall_time
+
+
+def test_nested_stages_memory():
+    """Test metrics of nested stages are included in their enclosing stage."""
+    instrumentation = Instrumentation(trace_memory=True)
+    assert not tracemalloc.is_tracing()
+    with instrumentation.stage("outer") as outer:
+        count_decompressed(10)
+        with nested_stage("inner") as inner:
+            assert current_stage() is inner
+            count_decompressed(5)
+            data = bytearray(100_000)
+        del data
+        assert current_stage() is outer
+    assert current_stage() is None
+    assert not tracemalloc.is_tracing()
+
+    assert inner.depth == 1
+    assert inner.bytes_decompressed == 5
+    assert outer.bytes_decompressed == 15
+    assert inner.peak_memory >= 100_000
+    assert outer.peak_memory >= inner.peak_memory
+
+
+def test_disabled():
+    """Test nothing is measured without an Instrumentation."""
+    with measure(None, "stage") as metrics, nested_stage("nested") as nested:
+        assert metrics is None
+        assert nested is None
+        assert current_stage() is None
+        count_decompressed(10)
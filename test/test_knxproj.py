@@ -1,9 +1,21 @@
+import asyncio
+import threading
+
+import pytest
+
 from xknxproject import XKNXProj
+from xknxproject.loader import (
+    ApplicationProgramLoader,
+    HardwareLoader,
+    ManufacturerLoader,
+)
+from xknxproject.stage_runner import ProgressEvent
 
 from . import RESOURCES_PATH
 from .conftest import assert_stub
 
 xknx_test_project_protected_ets5 = RESOURCES_PATH / "xknx_test_project.knxproj"
+xknx_test_project_protected_ets6 = RESOURCES_PATH / "testprojekt-ets6.knxproj"
 
 
 def test_parse_project_ets5():
@@ -11,3 +23,146 @@ def test_parse_project_ets5():
     knxproj = XKNXProj(xknx_test_project_protected_ets5, "test")
     project = knxproj.parse()
     assert_stub(project, "xknx_test_project.json")
+
+
+def test_parse_project_parallel():
+    """Test parsing application programs in a process pool."""
+    knxproj = XKNXProj(xknx_test_project_protected_ets6, "test")
+    assert knxproj.parse(workers=2) == knxproj.parse()
+
+
+def test_parse_lazy_sections(monkeypatch):
+    """Test sections not needing application programs don't load them."""
+    knxproj = XKNXProj(xknx_test_project_protected_ets6, "test")
+    project = knxproj.parse()
+
+    def load_tables(*args, **kwargs):
+        pytest.fail("application program loaded")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(ApplicationProgramLoader, "load_tables", load_tables)
+        lazy_project = knxproj.parse_lazy()
+        for key in ("version", "group_addresses", "devices", "topology", "locations"):
+            assert lazy_project[key] == project[key]
+
+    assert lazy_project["communication_objects"] == project["communication_objects"]
+    assert list(lazy_project) == list(project)
+    assert lazy_project.to_dict() == project
+    with pytest.raises(KeyError):
+        lazy_project["unknown"]
+
+
+@pytest.mark.parametrize(
+    "include,skipped_loaders",
+    [
+        (
+            {"locations"},
+            [
+                (ManufacturerLoader, "load"),
+                (HardwareLoader, "load"),
+                (ApplicationProgramLoader, "load_tables"),
+            ],
+        ),
+        (
+            {"topology"},
+            [(HardwareLoader, "load"), (ApplicationProgramLoader, "load_tables")],
+        ),
+        (
+            {"group_addresses"},
+            [(ManufacturerLoader, "load"), (ApplicationProgramLoader, "load_tables")],
+        ),
+        (
+            {"group_addresses", "devices", "topology"},
+            [(ApplicationProgramLoader, "load_tables")],
+        ),
+        ({"communication_objects", "locations"}, []),
+    ],
+)
+def test_parse_include_sections(monkeypatch, include, skipped_loaders):
+    """Test selected sections match a full parse without running unneeded loaders."""
+    knxproj = XKNXProj(xknx_test_project_protected_ets6, "test")
+    project = knxproj.parse()
+
+    def skipped_loader(*args, **kwargs):
+        pytest.fail("loader not needed for the included sections was run")
+
+    with monkeypatch.context() as patch:
+        for loader, method in skipped_loaders:
+            patch.setattr(loader, method, skipped_loader)
+        partial_project = knxproj.parse(include=include)
+
+    assert set(partial_project) == include | {"version"}
+    for key, value in partial_project.items():
+        assert value == project[key]
+
+
+def test_parse_include_unknown_section():
+    """Test unknown sections are rejected."""
+    knxproj = XKNXProj(xknx_test_project_protected_ets6, "test")
+    with pytest.raises(ValueError):
+        knxproj.parse(include={"group_addresses", "unknown"})
+
+
+def test_parse_async():
+    """Test an async parse matches a parse and reports its progress."""
+    knxproj = XKNXProj(xknx_test_project_protected_ets6, "test")
+    events: list[ProgressEvent] = []
+
+    async def progress(event):
+        events.append(event)
+
+    project = asyncio.run(knxproj.parse_async(progress=progress))
+
+    assert project == knxproj.parse()
+    stages = [event.stage for event in events if event.file is None]
+    assert stages[:4] == ["extract", "extract", "project", "project"]
+    assert stages[-2:] == ["convert", "convert"]
+    # master data is loaded concurrently to hardware and application programs
+    assert events.index(ProgressEvent("start", "master_data")) < events.index(
+        ProgressEvent("end", "hardware")
+    )
+    # every file is reported by the stage loading it
+    assert {event.stage for event in events if event.file is not None} == {
+        "hardware",
+        "application_programs",
+    }
+    assert asyncio.run(knxproj.parse_async(include={"locations"})) == {
+        "version": project["version"],
+        "locations": project["locations"],
+    }
+
+
+def test_parse_async_cancelled(monkeypatch):
+    """Test cancelling an async parse skips the stages not started yet."""
+    release = threading.Event()
+    load = HardwareLoader.load
+
+    def blocking_load(*args, **kwargs):
+        release.wait(timeout=10)
+        return load(*args, **kwargs)
+
+    def load_tables(*args, **kwargs):
+        pytest.fail("application program loaded after cancellation")
+
+    monkeypatch.setattr(HardwareLoader, "load", blocking_load)
+    monkeypatch.setattr(ApplicationProgramLoader, "load_tables", load_tables)
+
+    async def cancel_parse():
+        started = asyncio.Event()
+
+        async def progress(event):
+            if event.stage == "hardware" and event.file is not None:
+                started.set()
+
+        task = asyncio.create_task(
+            XKNXProj(xknx_test_project_protected_ets6, "test").parse_async(
+                progress=progress
+            )
+        )
+        await started.wait()
+        task.cancel()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel_parse())
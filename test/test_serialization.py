@@ -0,0 +1,177 @@
+"""Test binary KNXProject serialization."""
+import json
+import struct
+
+import pytest
+
+from xknxproject import XKNXProj, serialization
+from xknxproject.exceptions import InvalidSerializedProjectException
+
+from . import RESOURCES_PATH
+
+xknx_test_project_protected_ets6 = RESOURCES_PATH / "testprojekt-ets6.knxproj"
+
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_round_trip(compress):
+    """Test a parsed project round-trips including the order of keys."""
+    project = XKNXProj(xknx_test_project_protected_ets6, "test").parse()
+    data = serialization.dumps(project, compress=compress)
+    loaded = serialization.loads(data)
+    assert loaded == project
+    assert json.dumps(loaded) == json.dumps(project)
+    assert len(data) < len(json.dumps(project))
+
+
+def test_round_trip_shares_strings():
+    """Test equal strings of a JSON loaded project are loaded once."""
+    project = json.loads(
+        json.dumps(
+            {
+                "version": "1.0.0",
+                "devices": {
+                    "1.1.1": {"name": "Switch", "individual_address": "1.1.1"},
+                    "1.1.2": {"name": "Switch", "individual_address": "1.1.2"},
+                },
+                "group_addresses": {},
+            }
+        )
+    )
+    loaded = serialization.loads(serialization.dumps(project))
+    assert loaded == project
+    assert loaded["devices"]["1.1.1"]["name"] is loaded["devices"]["1.1.2"]["name"]
+    assert loaded["devices"]["1.1.1"] is not loaded["devices"]["1.1.2"]
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"XKPJ\x01\x04\x00",
+        b"XKPB\xff\x04\x00",
+        serialization.dumps({"version": "1.0.0"})[:-3],
+        serialization.dumps({"version": "1.0.0"})[:7] + b"\x00",
+    ],
+)
+def test_invalid_data(data):
+    """Test invalid data is rejected."""
+    with pytest.raises(InvalidSerializedProjectException):
+        serialization.loads(data)
+
+
+def test_unsupported_value():
+    """Test values that are not JSON compatible are rejected."""
+    with pytest.raises(TypeError):
+        serialization.dumps({"version": ("1", "0")})
+
+
+def _split(data):
+    """Return the stream layout, root node and streams of serialized data."""
+    (layout_size,) = struct.unpack_from("<I", data, 6)
+    position = 10 + layout_size
+    stream_layout, root = json.loads(data[10:position])
+    streams = []
+    for _, size in stream_layout:
+        streams.append(bytearray(data[position : position + size]))
+        position += size
+    return [item_size for item_size, _ in stream_layout], root, streams
+
+
+def _join(item_sizes, root, streams):
+    """Return serialized data of a modified root node and streams."""
+    layout = json.dumps(
+        [
+            [[item_size, len(data)] for item_size, data in zip(item_sizes, streams)],
+            root,
+        ],
+        separators=(",", ":"),
+    ).encode()
+    return b"XKPB\x03\x00" + struct.pack("<I", len(layout)) + layout + b"".join(streams)
+
+
+def test_split_join():
+    """Test the helpers of the invalid data tests reproduce serialized data."""
+    data = serialization.dumps({"version": "1.0.0"})
+    assert _join(*_split(data)) == data
+
+
+def _loads_modified(modify):
+    """Load a serialized project modified by `modify(root, streams)`."""
+    item_sizes, root, streams = _split(
+        serialization.dumps(
+            {
+                "version": "1.0.0",
+                "devices": {
+                    "1.1.1": {"name": "Switch", "channels": [1, 2]},
+                    "1.1.2": {"name": "Dimmer", "channels": []},
+                },
+            }
+        )
+    )
+    modify(root, streams)
+    return serialization.loads(_join(item_sizes, root, streams))
+
+
+def _find(node, kind):
+    """Return the first alternative of a kind of a node or its children."""
+    for alternative in node[1]:
+        if alternative[0] == kind:
+            return alternative
+        for child in alternative[2:] if alternative[0] != "r" else alternative[2]:
+            if isinstance(child, list) and (found := _find(child, kind)):
+                return found
+    return None
+
+
+def _set_stream(streams, index, data):
+    """Replace a stream."""
+    streams[index] = bytearray(data)
+
+
+@pytest.mark.parametrize(
+    "modify",
+    [
+        # unknown alternative
+        lambda root, streams: root[1][0].__setitem__(0, "x"),
+        # ref out of the string table
+        lambda root, streams: _set_stream(
+            streams, _find(root, "s")[1], [255] * len(streams[_find(root, "s")[1]])
+        ),
+        # more values than their node holds
+        lambda root, streams: _set_stream(streams, _find(root, "p")[1], b"[1,2,3,4]"),
+        # a string in the primitive values
+        lambda root, streams: _set_stream(streams, _find(root, "p")[1], b'[1,2,"3"]'),
+        # a stream not matching its node
+        lambda root, streams: streams[_find(root, "l")[1]].append(0),
+        # duplicate record keys
+        lambda root, streams: _find(root, "r")[1].__setitem__(
+            1, _find(root, "r")[1][0]
+        ),
+        # string table that isn't a list of strings
+        lambda root, streams: _set_stream(streams, 0, b"[1]"),
+        # trailing data
+        lambda root, streams: streams.append(bytearray(b"\x00")),
+    ],
+)
+def test_invalid_streams(modify):
+    """Test inconsistent nodes and streams are rejected."""
+    with pytest.raises(InvalidSerializedProjectException):
+        _loads_modified(modify)
+
+
+def test_nesting_too_deep():
+    """Test deeply nested data is rejected without exhausting the stack."""
+    item_sizes, _, streams = _split(serialization.dumps({"version": "1.0.0"}))
+    item_sizes.append(1)
+    streams.append(bytearray([1]))
+    node = [None, [["p", 0]]]
+    for _ in range(200):
+        node = [None, [["l", len(streams) - 1, node]]]
+    with pytest.raises(InvalidSerializedProjectException):
+        serialization.loads(_join(item_sizes, node, streams))
+
+    nested = []
+    for _ in range(serialization.MAX_DEPTH + 1):
+        nested = [nested]
+    with pytest.raises(ValueError):
+        serialization.dumps({"version": "1.0.0", "devices": {"a": nested}})
@@ -1,7 +1,9 @@
 """Test utilities."""
+import pickle
+
 import pytest
 
-from xknxproject.util import parse_dpt_types
+from xknxproject.util import FrozenDict, Interner, parse_dpt_types
 
 
 @pytest.mark.parametrize(
@@ -21,3 +23,34 @@ from xknxproject.util import parse_dpt_types
 def test_parse_dpt_types(dpt_types: list[str], expected: dict[str, int]):
     """Test parsing of ETS5 project."""
     assert parse_dpt_types(dpt_types) == expected
+
+
+def test_interner_strings():
+    """Test equal strings are shared."""
+    interner = Interner()
+    first = interner("".join(["M-0083", "_H-1"]))
+    second = interner("".join(["M-0083_", "H-1"]))
+    assert first == "M-0083_H-1"
+    assert first is second
+    assert interner(None) is None
+
+
+def test_interner_dpt_types():
+    """Test DPTs are parsed once per value into a shared immutable dict."""
+    interner = Interner()
+    dpt = interner.dpt_types("DPT-1 DPST-1-1")
+    assert dpt == {"main": 1, "sub": 1}
+    assert interner.dpt_types("DPT-1 DPST-1-1") is dpt
+    assert interner.dpt_types("") == {}
+    with pytest.raises(TypeError):
+        dpt["main"] = 2
+    with pytest.raises(TypeError):
+        dpt.update(sub=2)
+    assert dpt == {"main": 1, "sub": 1}
+
+
+def test_frozen_dict_pickle():
+    """Test FrozenDict survives pickling to worker processes."""
+    dpt = pickle.loads(pickle.dumps(FrozenDict(main=5, sub=1)))
+    assert isinstance(dpt, FrozenDict)
+    assert dpt == {"main": 5, "sub": 1}
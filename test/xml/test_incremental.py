@@ -0,0 +1,120 @@
+"""Test incremental parsing of modified projects."""
+import json
+from pathlib import Path
+from test import RESOURCES_PATH
+from zipfile import ZIP_DEFLATED, ZipFile
+
+import pytest
+
+from xknxproject import XKNXProj
+from xknxproject.exceptions import InvalidPasswordException
+from xknxproject.loader import ApplicationProgramLoader, HardwareLoader
+
+xknx_test_project_ets5 = RESOURCES_PATH / "xknx_test_project_no_password.knxproj"
+xknx_test_project_protected_ets6 = RESOURCES_PATH / "testprojekt-ets6.knxproj"
+PROJECT_0 = "P-01D2/0.xml"
+
+
+def _modify_project_0(target: Path, old: str, new: str) -> Path:
+    """Write a copy of the ETS5 test project with a modified 0.xml."""
+    with ZipFile(xknx_test_project_ets5) as source, ZipFile(
+        target, mode="w", compression=ZIP_DEFLATED
+    ) as archive:
+        for info in source.infolist():
+            data = source.read(info)
+            if info.filename == PROJECT_0:
+                assert old.encode() in data
+                data = data.replace(old.encode(), new.encode())
+            archive.writestr(info, data)
+    return target
+
+
+def test_parse_incremental_unchanged(monkeypatch):
+    """Test the previous result is returned for an unchanged archive."""
+    knxproj = XKNXProj(xknx_test_project_protected_ets6, "test")
+    project, manifest = knxproj.parse_incremental()
+    assert project == knxproj.parse()
+
+    monkeypatch.setattr(
+        "xknxproject.xknxproj.extract", lambda *args: pytest.fail("archive extracted")
+    )
+    assert knxproj.parse_incremental(project, manifest) == (project, manifest)
+
+
+def test_parse_incremental_unchanged_wrong_password():
+    """Test a wrong password fails for an unchanged archive."""
+    project, manifest = XKNXProj(
+        xknx_test_project_protected_ets6, "test"
+    ).parse_incremental()
+    with pytest.raises(InvalidPasswordException):
+        XKNXProj(xknx_test_project_protected_ets6, "wrong").parse_incremental(
+            project, manifest
+        )
+
+
+def test_parse_incremental_group_address_changed(monkeypatch, tmp_path):
+    """Test only 0.xml is read if a group address changed."""
+    previous, manifest = XKNXProj(xknx_test_project_ets5).parse_incremental()
+    modified = _modify_project_0(
+        tmp_path / "modified.knxproj", 'Name="Windalarm"', 'Name="Wind alarm"'
+    )
+    expected = XKNXProj(modified).parse()
+
+    def fail(*args, **kwargs):
+        pytest.fail("file loaded")
+
+    monkeypatch.setattr(ApplicationProgramLoader, "load_tables", fail)
+    monkeypatch.setattr(HardwareLoader, "load", fail)
+    project, new_manifest = XKNXProj(modified).parse_incremental(previous, manifest)
+
+    assert project == expected
+    assert project["group_addresses"]["GA-1"]["name"] == "Wind alarm"
+    assert new_manifest["sections"]["group_addresses"] != (
+        manifest["sections"]["group_addresses"]
+    )
+    assert new_manifest["sections"]["devices"] == manifest["sections"]["devices"]
+
+
+def test_parse_incremental_com_object_changed(monkeypatch, tmp_path):
+    """Test the application program is read for a changed communication object."""
+    previous, manifest = XKNXProj(xknx_test_project_ets5).parse_incremental()
+    # JSON round trip like a stored result
+    previous, manifest = json.loads(json.dumps([previous, manifest]))
+    modified = _modify_project_0(
+        tmp_path / "modified.knxproj",
+        'RefId="O-70_R-1505" DatapointType="DPST-1-8"',
+        'RefId="O-70_R-1505" DatapointType="DPST-1-1"',
+    )
+    expected, expected_manifest = XKNXProj(modified).parse_incremental()
+
+    loaded = []
+    load_tables = ApplicationProgramLoader.load_tables
+
+    def counting_load_tables(*args, **kwargs):
+        loaded.append(args[0])
+        return load_tables(*args, **kwargs)
+
+    monkeypatch.setattr(ApplicationProgramLoader, "load_tables", counting_load_tables)
+    project, new_manifest = XKNXProj(modified).parse_incremental(previous, manifest)
+
+    assert len(loaded) == 1
+    assert project == expected
+    assert list(project["communication_objects"]) == list(
+        expected["communication_objects"]
+    )
+    assert new_manifest == expected_manifest
+
+
+def test_parse_incremental_previous_mismatch(tmp_path):
+    """Test a result not matching its manifest is not used."""
+    previous, manifest = XKNXProj(xknx_test_project_ets5).parse_incremental()
+    previous = json.loads(json.dumps(previous))
+    for communication_object in previous["communication_objects"].values():
+        communication_object["name"] = "stale"
+    modified = _modify_project_0(
+        tmp_path / "modified.knxproj", 'Name="Windalarm"', 'Name="Wind alarm"'
+    )
+
+    project, _ = XKNXProj(modified).parse_incremental(previous, manifest)
+
+    assert project == XKNXProj(modified).parse()
@@ -1,5 +1,6 @@
 from test import RESOURCES_PATH
 
+from xknxproject.loader import HardwareLoader
 from xknxproject.xml.parser import XMLParser
 from xknxproject.zip import extract
 
@@ -64,3 +65,39 @@ def test_parse_project_with_module_defs():
     assert len(parser.areas) == 2
     assert len(parser.areas[1].lines) == 2
     assert len(parser.areas[1].lines[1].devices) == 1
+
+
+def test_group_address_links_index():
+    """Test the reverse index from group addresses to communication objects."""
+    with extract(xknx_test_project_module_defs) as knx_project_contents:
+        parser = XMLParser(knx_project_contents)
+        project = parser.parse()
+
+    assert parser.group_address_links == {
+        "GA-1": ["M-0083_A-013A-32-DCC1_MD-2_O-2-1_R-1"],
+        "GA-2": ["M-0083_A-013A-32-DCC1_MD-2_O-2-2_R-3"],
+        "GA-3": ["M-0083_A-013A-32-DCC1_O-334_R-21"],
+    }
+    for identifier, group_address in project["group_addresses"].items():
+        assert group_address["communication_object_ids"] == (
+            parser.group_address_links[identifier]
+        )
+
+    # the index is built with the ComObjectInstanceRefs - not by a section
+    with extract(xknx_test_project_module_defs) as knx_project_contents:
+        com_objects_parser = XMLParser(knx_project_contents)
+        com_objects_parser.parse(include={"communication_objects"})
+
+    assert com_objects_parser.group_address_links == parser.group_address_links
+
+
+def test_unmatched_hardware_refs(monkeypatch):
+    """Test reporting devices whose hardware is missing from the catalogs."""
+    monkeypatch.setattr(HardwareLoader, "get_hardware_files", lambda _: [])
+    with extract(xknx_test_project_protected_ets6, "test") as knx_project_contents:
+        parser = XMLParser(knx_project_contents)
+        parser.parse()
+
+    assert sum(parser.unmatched_hardware_refs.values()) == len(parser.devices)
+    assert parser.unmatched_hardware_program_refs == {}
+    assert all(device.application_program_ref is None for device in parser.devices)
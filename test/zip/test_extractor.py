@@ -1,9 +1,18 @@
+import io
 from test import RESOURCES_PATH
+from zipfile import ZipFile
 
+import pytest
 from pytest import raises
 
-from xknxproject.exceptions import InvalidPasswordException
-from xknxproject.zip import extract
+from xknxproject.exceptions import InvalidPasswordException, ProjectNotFoundException
+from xknxproject.zip import (
+    ExtractionStrategy,
+    clear_zip_password_cache,
+    derive_zip_password,
+    extract,
+    extractor,
+)
 from xknxproject.zip.extractor import _generate_ets6_zip_password
 
 xknx_test_project_protected_ets5 = RESOURCES_PATH / "xknx_test_project.knxproj"
@@ -76,3 +85,81 @@ def test_wrong_password_ets6():
         with extract(xknx_test_project_protected_ets6, "wrong") as knx_project_contents:
             with knx_project_contents.open_project_0():
                 pass
+
+
+def test_ets6_password_generation_memoised(monkeypatch):
+    """Test the ETS6 key derivation is only run once per password."""
+    derived: list[str] = []
+
+    def derive(password: str) -> bytes:
+        derived.append(password)
+        return password.encode()
+
+    monkeypatch.setattr(extractor, "_derive_ets6_zip_password", derive)
+    clear_zip_password_cache()
+    for password in ("test", "test", "other", "test"):
+        assert _generate_ets6_zip_password(password) == password.encode()
+    assert derived == ["test", "other"]
+    # the memo is keyed by an HMAC - passwords aren't kept
+    assert b"test" not in b"".join(extractor._ETS6_ZIP_PASSWORDS)
+
+    clear_zip_password_cache()
+    _generate_ets6_zip_password("test")
+    assert derived == ["test", "other", "test"]
+    clear_zip_password_cache()
+
+
+@pytest.mark.parametrize(
+    "project", [xknx_test_project_protected_ets5, xknx_test_project_protected_ets6]
+)
+def test_extract_with_zip_password(project):
+    """Test reading a protected project with a pre-derived ZIP password."""
+    zip_password = derive_zip_password(project, "test")
+    with extract(project, zip_password=zip_password) as knx_project_contents:
+        with knx_project_contents.open_project_0() as proj_0:
+            assert proj_0.readline()
+
+    with raises(InvalidPasswordException):
+        with extract(project, zip_password=derive_zip_password(project, "wrong")):
+            pass
+
+
+@pytest.mark.parametrize("strategy", list(ExtractionStrategy))
+@pytest.mark.parametrize(
+    "project", [xknx_test_project_protected_ets5, xknx_test_project_protected_ets6]
+)
+def test_extraction_strategies(project, strategy):
+    """Test all strategies for reading the protected project archive."""
+    with extract(project, "test") as knx_project_contents:
+        with knx_project_contents.open_project_0() as proj_0:
+            expected = proj_0.read()
+
+    with extract(project, "test", strategy=strategy) as knx_project_contents:
+        with knx_project_contents.open_project_0() as proj_0:
+            assert proj_0.read() == expected
+
+
+def _empty_zip() -> bytes:
+    """Return a ZIP archive without entries."""
+    buffer = io.BytesIO()
+    ZipFile(buffer, mode="w").close()
+    return buffer.getvalue()
+
+
+@pytest.mark.parametrize("strategy", list(ExtractionStrategy))
+@pytest.mark.parametrize("nested_archive", [b"", _empty_zip()])
+def test_extract_empty_protected_project(tmp_path, strategy, nested_archive):
+    """Test an empty protected project archive is reported as not found."""
+    archive = tmp_path / "empty.knxproj"
+    with ZipFile(xknx_test_project_protected_ets5) as source, ZipFile(
+        archive, mode="w"
+    ) as target:
+        for info in source.infolist():
+            data = source.read(info)
+            target.writestr(
+                info, nested_archive if info.filename == "P-0242.zip" else data
+            )
+
+    with raises(ProjectNotFoundException):
+        with extract(archive, "test", strategy=strategy):
+            pass
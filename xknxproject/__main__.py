@@ -0,0 +1,4 @@
+"""Run the command line interface - `python -m xknxproject`."""
+from xknxproject.cli import main
+
+raise SystemExit(main())
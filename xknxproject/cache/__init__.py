@@ -0,0 +1,5 @@
+"""Persistent caches for parsed KNX project data."""
+from .application_program_cache import ApplicationProgramCache
+from .project_cache import ProjectCache
+
+__all__ = ["ApplicationProgramCache", "ProjectCache"]
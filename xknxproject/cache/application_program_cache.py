@@ -0,0 +1,139 @@
+"""On-disk cache of parsed application program tables."""
+from __future__ import annotations
+
+import hashlib
+import logging
+from pathlib import Path
+import re
+import struct
+from typing import Any, Final
+from zipfile import ZipInfo
+
+from xknxproject import serialization
+from xknxproject.__version__ import __version__
+from xknxproject.cache.file_cache import FileCache
+from xknxproject.exceptions import InvalidSerializedProjectException
+from xknxproject.loader.application_program_loader import ApplicationProgramTables
+from xknxproject.models import ComObject, ComObjectRef
+from xknxproject.util import FrozenDict
+
+logger = logging.getLogger("xknxproject.log")
+
+CACHE_FORMAT_VERSION: Final = 2
+DEFAULT_MAX_SIZE: Final = 256 * 1024 * 1024
+# magic, format version, ZIP entry CRC-32, ZIP entry size
+_HEADER: Final = struct.Struct("<4sBIQ")
+_MAGIC: Final = b"XKAP"
+# refs of this form are used as file names - others are hashed
+_APPLICATION_PROGRAM_REF: Final = re.compile(r"M-[0-9A-F]{4}_A-[0-9A-Za-z-]+")
+# decoded DPTs are immutable and shared like the ones parsed by the loaders
+_DECODED_DPTS: dict[tuple[tuple[str, int], ...], FrozenDict] = {}
+
+
+class ApplicationProgramCache(FileCache):
+    """
+    Cache the ComObject and ComObjectRef tables of application programs on disk.
+
+    Application program files are immutable per application program ref so
+    entries are keyed by it and validated against the CRC-32 and size of the
+    ZIP entry they were parsed from. The least recently used entries are
+    evicted when the cache grows beyond `max_size` bytes. Refs are read from
+    the archive - a ref not of the form `M-xxxx_A-...` is hashed to keep its
+    entry in the cache directory. Tables are stored in the compressed format
+    of `xknxproject.serialization` - entries that don't decode to the tables
+    are ignored.
+    """
+
+    suffix = ".xkap"
+
+    def __init__(self, directory: str | Path, max_size: int = DEFAULT_MAX_SIZE):
+        """Initialize an ApplicationProgramCache."""
+        super().__init__(directory, max_size)
+
+    def get(
+        self, application_program_ref: str, zip_info: ZipInfo
+    ) -> ApplicationProgramTables | None:
+        """Return the cached tables of an application program or None."""
+        if (
+            data := self._read(_entry_key(application_program_ref))
+        ) is None or not data.startswith(_header(zip_info)):
+            self.misses += 1
+            return None
+        try:
+            entry = serialization.loads_value(data[_HEADER.size :])
+            if entry["version"] != __version__:
+                self.misses += 1
+                return None
+            # rows with other keys than the fields are rejected by __init__
+            tables = (
+                {
+                    row["identifier"]: ComObjectRef(**_decode_row(row))
+                    for row in entry["com_object_refs"]
+                },
+                {
+                    row["identifier"]: ComObject(**_decode_row(row))
+                    for row in entry["com_objects"]
+                },
+            )
+        except (InvalidSerializedProjectException, KeyError, TypeError) as err:
+            logger.debug("Invalid cache entry for %s: %s", application_program_ref, err)
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return tables
+
+    def set(
+        self,
+        application_program_ref: str,
+        zip_info: ZipInfo,
+        tables: ApplicationProgramTables,
+    ) -> None:
+        """Store the tables of an application program."""
+        com_object_refs, com_objects = tables
+        payload = serialization.dumps_value(
+            {
+                "version": __version__,
+                "com_object_refs": [
+                    _encode_row(ref) for ref in com_object_refs.values()
+                ],
+                "com_objects": [
+                    _encode_row(com_object) for com_object in com_objects.values()
+                ],
+            },
+            compress=True,
+        )
+        self._write(_entry_key(application_program_ref), _header(zip_info) + payload)
+
+
+def _entry_key(application_program_ref: str) -> str:
+    """Return the key of the cache entry of an application program ref."""
+    if _APPLICATION_PROGRAM_REF.fullmatch(application_program_ref):
+        return application_program_ref
+    return hashlib.sha256(application_program_ref.encode()).hexdigest()
+
+
+def _header(zip_info: ZipInfo) -> bytes:
+    """Return the header validating a cache entry against its ZIP entry."""
+    return _HEADER.pack(_MAGIC, CACHE_FORMAT_VERSION, zip_info.CRC, zip_info.file_size)
+
+
+def _encode_row(table_entry: ComObject | ComObjectRef) -> dict[str, Any]:
+    """Encode a table entry to a dict of its fields - stored as a record."""
+    return {slot: getattr(table_entry, slot) for slot in table_entry.__slots__}
+
+
+def _decode_row(row: dict[str, Any]) -> dict[str, Any]:
+    """Decode a table entry encoded by `_encode_row` to keyword arguments."""
+    return {**row, "datapoint_type": _decode_dpt(row["datapoint_type"])}
+
+
+def _decode_dpt(datapoint_type: dict[str, int] | None) -> FrozenDict | None:
+    """Decode a parsed DPT - {}, {"main": x} or {"main": x, "sub": y}."""
+    if datapoint_type is None:
+        return None
+    # raises TypeError for values that aren't hashable
+    key = tuple(datapoint_type.items())
+    if (dpt := _DECODED_DPTS.get(key)) is None:
+        dpt = _DECODED_DPTS[key] = FrozenDict(datapoint_type)
+    return dpt
@@ -0,0 +1,79 @@
+"""Base class for size-bounded on-disk caches."""
+from __future__ import annotations
+
+import logging
+import os
+from pathlib import Path
+
+logger = logging.getLogger("xknxproject.log")
+
+
+class FileCache:
+    """
+    Directory of cache files with least recently used eviction.
+
+    Reading an entry refreshes its mtime. After writing an entry, the oldest
+    entries are removed until all entries fit into `max_size` bytes.
+    """
+
+    suffix = ".cache"
+
+    def __init__(self, directory: str | Path, max_size: int):
+        """Initialize a FileCache."""
+        self.directory = Path(directory)
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+
+    def evict(self) -> None:
+        """Remove least recently used entries until the cache fits into `max_size`."""
+        entries: list[tuple[float, int, Path]] = []
+        for path in self.directory.glob(f"*{self.suffix}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+
+        total_size = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            path.unlink(missing_ok=True)
+            total_size -= size
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        for path in self.directory.glob(f"*{self.suffix}"):
+            path.unlink(missing_ok=True)
+
+    def _path(self, key: str) -> Path:
+        """Return the path of the cache file for a key."""
+        return self.directory / f"{key}{self.suffix}"
+
+    def _read(self, key: str) -> bytes | None:
+        """Read a cache file and mark it as recently used."""
+        path = self._path(key)
+        try:
+            data = path.read_bytes()
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except OSError as err:
+            logger.debug("Could not read cache entry %s: %s", path, err)
+            return None
+        return data
+
+    def _write(self, key: str, data: bytes) -> None:
+        """Atomically write a cache file and evict old entries."""
+        path = self._path(key)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            temp_path.write_bytes(data)
+            os.replace(temp_path, path)
+        except OSError as err:
+            logger.warning("Could not write cache entry %s: %s", path, err)
+            temp_path.unlink(missing_ok=True)
+            return
+        self.evict()
@@ -0,0 +1,128 @@
+"""On-disk cache of parsed KNX projects."""
+from __future__ import annotations
+
+import hashlib
+import hmac
+import logging
+import os
+from pathlib import Path
+from typing import Final
+from zipfile import ZipFile
+
+from xknxproject import serialization
+from xknxproject.__version__ import __version__
+from xknxproject.cache.file_cache import FileCache
+from xknxproject.exceptions import InvalidSerializedProjectException
+from xknxproject.models import KNXProject
+from xknxproject.zip import derive_zip_password
+
+logger = logging.getLogger("xknxproject.log")
+
+DEFAULT_MAX_SIZE: Final = 64 * 1024 * 1024
+# random key of the HMAC of cache keys - stored in the cache directory
+SECRET_FILE_NAME: Final = "secret"
+_SECRET_SIZE: Final = 32
+
+
+class ProjectCache(FileCache):
+    """
+    Cache parsed KNXProject results on disk.
+
+    Entries are keyed by a fingerprint of the archive - its size and the name,
+    CRC-32 and size of every ZIP entry from the central directory - the
+    derived ZIP password and the library version. Changing the archive, the
+    password or upgrading xknxproject therefore never returns a stale result.
+    The fingerprint is an HMAC with a random secret of the cache directory, so
+    file names can't be used to guess a password. The raw password is never
+    hashed.
+    Cached projects are stored unencrypted in the format of
+    `xknxproject.serialization` - protect the cache directory like the
+    archives.
+    """
+
+    suffix = ".xkproj"
+
+    def __init__(self, directory: str | Path, max_size: int = DEFAULT_MAX_SIZE):
+        """Initialize a ProjectCache."""
+        super().__init__(directory, max_size)
+        self._secret: bytes | None = None
+
+    def key(
+        self,
+        archive_path: Path,
+        password: str | None,
+        zip_password: bytes | None = None,
+    ) -> str:
+        """
+        Return the cache key of a KNX project archive.
+
+        `password` is derived to the ZIP password - memoised per process - if
+        `zip_password` isn't given.
+        """
+        if zip_password is None and password:
+            zip_password = derive_zip_password(archive_path, password)
+        digest = hmac.new(self._get_secret(), __version__.encode(), hashlib.sha256)
+        digest.update(f"\0{archive_path.stat().st_size}".encode())
+        # only the central directory is read - no entry is decompressed
+        with ZipFile(archive_path, mode="r") as archive:
+            for info in archive.infolist():
+                digest.update(
+                    f"\0{info.filename}\0{info.CRC}\0{info.file_size}".encode()
+                )
+        if zip_password is not None:
+            digest.update(b"\0\0" + zip_password)
+        return digest.hexdigest()
+
+    def _get_secret(self) -> bytes:
+        """Return the secret of the cache directory - created on first use."""
+        if self._secret is not None:
+            return self._secret
+        path = self.directory / SECRET_FILE_NAME
+        try:
+            self._secret = path.read_bytes()
+        except FileNotFoundError:
+            self._secret = self._create_secret(path)
+        except OSError as err:
+            logger.warning("Could not read cache secret %s: %s", path, err)
+            # entries are only found again by this instance
+            self._secret = os.urandom(_SECRET_SIZE)
+        return self._secret
+
+    @staticmethod
+    def _create_secret(path: Path) -> bytes:
+        """Create the secret file - or read the one created concurrently."""
+        secret = os.urandom(_SECRET_SIZE)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            with open(
+                os.open(temp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600), "wb"
+            ) as file:
+                file.write(secret)
+            # fails if another process created the secret first
+            os.link(temp_path, path)
+        except FileExistsError:
+            return path.read_bytes()
+        except OSError as err:
+            logger.warning("Could not write cache secret %s: %s", path, err)
+        finally:
+            temp_path.unlink(missing_ok=True)
+        return secret
+
+    def get(self, key: str) -> KNXProject | None:
+        """Return a cached project or None."""
+        if (data := self._read(key)) is None:
+            self.misses += 1
+            return None
+        try:
+            project = serialization.loads(data)
+        except InvalidSerializedProjectException as err:
+            logger.debug("Invalid cache entry %s: %s", key, err)
+            self.misses += 1
+            return None
+        self.hits += 1
+        return project
+
+    def set(self, key: str, project: KNXProject) -> None:
+        """Store a parsed project."""
+        self._write(key, serialization.dumps(project))
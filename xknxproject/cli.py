@@ -0,0 +1,229 @@
+"""
+Command line interface.
+
+    xknxproject parse [-p PASSWORD]... [--format {json,binary}] [--jobs N]
+                      [--timings] FILE...
+
+Every project is written next to its .knxproj file - or to `--output-dir` -
+with the suffix of the format. Several files are parsed concurrently in a
+process pool of `--jobs` workers.
+"""
+from __future__ import annotations
+
+import argparse
+from collections.abc import Iterator, Sequence
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+import json
+import os
+from pathlib import Path
+import sys
+from typing import Final
+
+from xknxproject import serialization
+from xknxproject.__version__ import __version__
+from xknxproject.instrumentation import Instrumentation, StageMetrics
+from xknxproject.xknxproj import XKNXProj
+
+FORMAT_SUFFIXES: Final = {"json": ".json", "binary": ".xkpb"}
+# {stage: label printed by --timings}
+_STAGE_LABELS: Final = {
+    "project": "ProjectLoader",
+    "master_data": "ManufacturerLoader",
+    "hardware": "HardwareLoader",
+    "application_programs": "ApplicationProgramLoader",
+}
+
+
+@dataclass
+class ParseJob:
+    """A .knxproj file to parse and where to write the result."""
+
+    archive_path: Path
+    output_path: Path
+    password: str | None = None
+    output_format: str = "json"
+    compress: bool = False
+    indent: int | None = None
+    workers: int | None = None
+    trace_memory: bool = False
+
+
+@dataclass
+class ParseResult:
+    """Outcome of a ParseJob - `error` is set if it failed."""
+
+    job: ParseJob
+    stages: list[StageMetrics] = field(default_factory=list)
+    error: str | None = None
+
+
+def parse_file(job: ParseJob) -> ParseResult:
+    """Parse a .knxproj file, write the project and measure each stage."""
+    instrumentation = Instrumentation(trace_memory=job.trace_memory)
+    result = ParseResult(job, instrumentation.stages)
+    try:
+        project = XKNXProj(
+            job.archive_path, job.password, instrumentation=instrumentation
+        ).parse(workers=job.workers)
+        with instrumentation.stage("write"):
+            if job.output_format == "binary":
+                job.output_path.write_bytes(
+                    serialization.dumps(project, compress=job.compress)
+                )
+            else:
+                with job.output_path.open("w", encoding="utf-8") as output_file:
+                    json.dump(project, output_file, indent=job.indent)
+    except Exception as err:  # pylint: disable=broad-except
+        # a corrupt archive may raise anything - e.g. BadZipFile or KeyError -
+        # and must not stop the other files of the batch
+        result.error = (
+            f"{type(err).__name__}: {err}" if str(err) else type(err).__name__
+        )
+    return result
+
+
+def _create_jobs(args: argparse.Namespace) -> list[ParseJob]:
+    """Create a ParseJob for every file - one password is used for all files."""
+    files: list[Path] = args.files
+    passwords: list[str] = args.password or []
+    if len(passwords) > 1 and len(passwords) != len(files):
+        raise ValueError(
+            f"{len(passwords)} passwords given for {len(files)} files - "
+            "give one password for all files or one per file"
+        )
+    suffix = FORMAT_SUFFIXES[args.format]
+    jobs = []
+    for index, archive_path in enumerate(files):
+        output_dir = args.output_dir or archive_path.parent
+        jobs.append(
+            ParseJob(
+                archive_path=archive_path,
+                output_path=output_dir / f"{archive_path.stem}{suffix}",
+                password=passwords[index if len(passwords) > 1 else 0]
+                if passwords
+                else None,
+                output_format=args.format,
+                compress=args.compress,
+                indent=args.indent,
+                workers=args.workers,
+                trace_memory=args.trace_memory,
+            )
+        )
+    return jobs
+
+
+def _run_jobs(jobs: list[ParseJob], max_workers: int) -> Iterator[ParseResult]:
+    """Run jobs in a process pool of `max_workers` - in this process if 1."""
+    if max_workers < 2 or len(jobs) < 2:
+        yield from map(parse_file, jobs)
+        return
+    with ProcessPoolExecutor(max_workers=min(max_workers, len(jobs))) as executor:
+        yield from executor.map(parse_file, jobs)
+
+
+def _print_timings(result: ParseResult) -> None:
+    """Print the stage metrics of a result to stderr - nested stages indented."""
+    print(f"{result.job.archive_path}:", file=sys.stderr)
+    for metrics in result.stages:
+        label = "  " * metrics.depth + _STAGE_LABELS.get(metrics.name, metrics.name)
+        line = (
+            f"  {label:<34}{metrics.wall_time * 1000:>10.1f} ms"
+            f"{metrics.cpu_time * 1000:>10.1f} ms CPU"
+            f"{metrics.bytes_decompressed:>12} B"
+            f"{metrics.elements_parsed:>9} elements"
+        )
+        if metrics.peak_memory is not None:
+            line += f"{metrics.peak_memory:>12} B peak"
+        print(line, file=sys.stderr)
+    total = sum(metrics.wall_time for metrics in result.stages if not metrics.depth)
+    print(f"  {'total':<34}{total * 1000:>10.1f} ms", file=sys.stderr)
+
+
+def _parse_command(args: argparse.Namespace, jobs: list[ParseJob]) -> int:
+    """Run the parse command - return the exit code."""
+    if args.output_dir is not None:
+        args.output_dir.mkdir(parents=True, exist_ok=True)
+    failed = 0
+    for result in _run_jobs(jobs, args.jobs):
+        if result.error is not None:
+            failed += 1
+            print(f"{result.job.archive_path}: {result.error}", file=sys.stderr)
+        elif not args.quiet:
+            print(f"{result.job.archive_path} -> {result.job.output_path}")
+        if args.timings:
+            _print_timings(result)
+    return 1 if failed else 0
+
+
+def _create_argument_parser() -> argparse.ArgumentParser:
+    """Create the argument parser."""
+    parser = argparse.ArgumentParser(
+        prog="xknxproject", description="Parse ETS project files."
+    )
+    parser.add_argument("--version", action="version", version=__version__)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    parse_parser = subparsers.add_parser(
+        "parse", help="parse .knxproj files and write the projects"
+    )
+    parse_parser.add_argument("files", nargs="+", type=Path, metavar="FILE")
+    parse_parser.add_argument(
+        "-p",
+        "--password",
+        action="append",
+        help="project password - repeat once per FILE for different passwords",
+    )
+    parse_parser.add_argument(
+        "-f", "--format", choices=list(FORMAT_SUFFIXES), default="json"
+    )
+    parse_parser.add_argument(
+        "-o",
+        "--output-dir",
+        type=Path,
+        help="directory of the output files (default: next to each FILE)",
+    )
+    parse_parser.add_argument(
+        "--indent", type=int, help="indentation of the JSON output"
+    )
+    parse_parser.add_argument(
+        "--compress", action="store_true", help="compress the binary output"
+    )
+    parse_parser.add_argument(
+        "-j",
+        "--jobs",
+        type=int,
+        default=os.cpu_count() or 1,
+        help="number of files parsed concurrently (default: number of CPUs)",
+    )
+    parse_parser.add_argument(
+        "--workers",
+        type=int,
+        help="processes parsing the application programs of each file",
+    )
+    parse_parser.add_argument(
+        "--timings",
+        "--profile",
+        action="store_true",
+        help="print the duration of each parse stage to stderr",
+    )
+    parse_parser.add_argument(
+        "--trace-memory",
+        action="store_true",
+        help="add the peak memory of each stage to --timings (slow)",
+    )
+    parse_parser.add_argument(
+        "-q", "--quiet", action="store_true", help="only print errors"
+    )
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Run the command line interface - return the exit code."""
+    parser = _create_argument_parser()
+    args = parser.parse_args(argv)
+    try:
+        jobs = _create_jobs(args)
+    except ValueError as err:
+        parser.error(str(err))
+    return _parse_command(args, jobs)
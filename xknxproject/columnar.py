@@ -0,0 +1,211 @@
+"""
+Column oriented export of group addresses and communication objects.
+
+Numbers are stored in `array.array` columns, strings in lists of shared
+instances and the 6 flags of a communication object in one integer bitmask.
+List values - like the communication objects linked to a group address - are
+flattened to a values column and an offsets column of length `len(table) + 1`,
+the layout of Arrow list arrays.
+
+`to_numpy()` and `to_arrow()` convert a table if NumPy or PyArrow is installed.
+"""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, fields
+from typing import Any, Final
+
+from xknxproject.models import Flags, KNXProject
+from xknxproject.util import Interner
+
+# DPT main or sub number of objects without (this part of the) DPT
+NO_DPT: Final = -1
+
+FLAG_READ: Final = 1
+FLAG_WRITE: Final = 2
+FLAG_COMMUNICATION: Final = 4
+FLAG_TRANSMIT: Final = 8
+FLAG_UPDATE: Final = 16
+FLAG_READ_ON_INIT: Final = 32
+_FLAG_BITS: Final = (
+    ("read", FLAG_READ),
+    ("write", FLAG_WRITE),
+    ("communication", FLAG_COMMUNICATION),
+    ("transmit", FLAG_TRANSMIT),
+    ("update", FLAG_UPDATE),
+    ("read_on_init", FLAG_READ_ON_INIT),
+)
+
+
+class _Table:
+    """Conversions shared by the column tables."""
+
+    def __len__(self) -> int:
+        """Return the number of rows."""
+        return len(getattr(self, fields(self)[0].name))  # type: ignore[arg-type]
+
+    def to_numpy(self) -> dict[str, Any]:
+        """
+        Return the columns as NumPy arrays - strings as object arrays.
+
+        List columns keep their values and offsets columns.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        import numpy as np
+
+        return {
+            field.name: (
+                np.frombuffer(column, dtype=column.typecode)
+                if isinstance(column, array)
+                else np.array(column, dtype=object)
+            )
+            for field in fields(self)  # type: ignore[arg-type]
+            for column in (getattr(self, field.name),)
+        }
+
+    def to_arrow(self) -> Any:
+        """Return the columns as a PyArrow Table - list columns as list arrays."""
+        # pylint: disable-next=import-outside-toplevel
+        import pyarrow as pa
+
+        array_types = {
+            "B": pa.uint8(),
+            "H": pa.uint16(),
+            "h": pa.int16(),
+            "I": pa.uint32(),
+        }
+        columns: dict[str, Any] = {}
+        for field in fields(self):  # type: ignore[arg-type]
+            column = getattr(self, field.name)
+            if field.name.endswith("_offsets"):
+                continue
+            if (offsets := getattr(self, f"{field.name}_offsets", None)) is not None:
+                columns[field.name] = pa.ListArray.from_arrays(
+                    pa.array(offsets, type=pa.int32()), pa.array(column)
+                )
+            elif isinstance(column, array):
+                columns[field.name] = pa.array(
+                    column, type=array_types[column.typecode]
+                )
+            else:
+                columns[field.name] = pa.array(column, type=pa.string())
+        return pa.table(columns)
+
+
+@dataclass
+class GroupAddressColumns(_Table):
+    """Group addresses of a KNXProject in columns."""
+
+    identifier: list[str]
+    address: list[str]
+    raw_address: array[int]  # "H"
+    main_group: array[int]  # "B" - 0..31
+    middle_group: array[int]  # "B" - 0..7
+    sub_group: array[int]  # "B" - 0..255
+    main_name: list[str]
+    middle_name: list[str]
+    name: list[str]
+    description: list[str]
+    dpt_main: array[int]  # "h" - NO_DPT if not set
+    dpt_sub: array[int]  # "h" - NO_DPT if not set
+    communication_object_ids: list[str]
+    communication_object_ids_offsets: array[int]  # "I"
+
+
+@dataclass
+class CommunicationObjectColumns(_Table):
+    """Communication objects of a KNXProject in columns."""
+
+    identifier: list[str]
+    name: list[str | None]
+    device_address: list[str]
+    dpt_main: array[int]  # "h" - NO_DPT if not set
+    dpt_sub: array[int]  # "h" - NO_DPT if not set
+    flags: array[int]  # "B" - FLAG_* bitmask - unknown flags are not set
+    group_address_links: list[str]
+    group_address_links_offsets: array[int]  # "I"
+
+
+def export_group_addresses(
+    project: KNXProject, interner: Interner | None = None
+) -> GroupAddressColumns:
+    """Return the group addresses of a project in columns."""
+    intern = interner or Interner()
+    group_addresses = project["group_addresses"].values()
+    raw_address = array("H", [ga["raw_address"] for ga in group_addresses])
+    dpt_main, dpt_sub = _dpt_columns(ga["dpt_type"] for ga in group_addresses)
+    communication_object_ids, offsets = _list_columns(
+        (ga["communication_object_ids"] for ga in group_addresses), intern
+    )
+    return GroupAddressColumns(
+        identifier=[intern(ga["identifier"]) for ga in group_addresses],
+        address=[ga["address"] for ga in group_addresses],
+        raw_address=raw_address,
+        main_group=array("B", [raw >> 11 & 0x1F for raw in raw_address]),
+        middle_group=array("B", [raw >> 8 & 0x07 for raw in raw_address]),
+        sub_group=array("B", [raw & 0xFF for raw in raw_address]),
+        main_name=[intern(ga["main_name"]) for ga in group_addresses],
+        middle_name=[intern(ga["middle_name"]) for ga in group_addresses],
+        name=[intern(ga["name"]) for ga in group_addresses],
+        description=[intern(ga["description"]) for ga in group_addresses],
+        dpt_main=dpt_main,
+        dpt_sub=dpt_sub,
+        communication_object_ids=communication_object_ids,
+        communication_object_ids_offsets=offsets,
+    )
+
+
+def export_communication_objects(
+    project: KNXProject, interner: Interner | None = None
+) -> CommunicationObjectColumns:
+    """Return the communication objects of a project in columns."""
+    intern = interner or Interner()
+    communication_objects = project["communication_objects"]
+    values = communication_objects.values()
+    dpt_main, dpt_sub = _dpt_columns(co["dpt_type"] for co in values)
+    group_address_links, offsets = _list_columns(
+        (co["group_address_links"] for co in values), intern
+    )
+    return CommunicationObjectColumns(
+        identifier=[intern(identifier) for identifier in communication_objects],
+        name=[intern(co["name"]) for co in values],
+        device_address=[intern(co["device_address"]) for co in values],
+        dpt_main=dpt_main,
+        dpt_sub=dpt_sub,
+        flags=array("B", [_pack_flags(co["flags"]) for co in values]),
+        group_address_links=group_address_links,
+        group_address_links_offsets=offsets,
+    )
+
+
+def _pack_flags(flags: Flags) -> int:
+    """Return the FLAG_* bitmask of communication object flags."""
+    mask = 0
+    for flag, bit in _FLAG_BITS:
+        if flags[flag]:  # type: ignore[literal-required]
+            mask |= bit
+    return mask
+
+
+def _dpt_columns(dpt_types: Any) -> tuple[array[int], array[int]]:
+    """Return DPT main and sub numbers - NO_DPT where missing."""
+    dpt_main = array("h")
+    dpt_sub = array("h")
+    for dpt in dpt_types:
+        if dpt:
+            dpt_main.append(dpt.get("main", NO_DPT))
+            dpt_sub.append(dpt.get("sub", NO_DPT))
+        else:
+            dpt_main.append(NO_DPT)
+            dpt_sub.append(NO_DPT)
+    return dpt_main, dpt_sub
+
+
+def _list_columns(lists: Any, intern: Interner) -> tuple[list[str], array[int]]:
+    """Flatten lists of strings to values and offsets."""
+    values: list[str] = []
+    offsets = array("I", [0])
+    for items in lists:
+        values.extend(intern(item) for item in items)
+        offsets.append(len(values))
+    return values, offsets
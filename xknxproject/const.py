@@ -5,6 +5,11 @@ ETS6_SCHEMA_VERSION: Final = b"http://knx.org/xml/project/21"
 ETS57_SCHEMA_VERSION: Final = b"http://knx.org/xml/project/20"
 ETS56_SCHEMA_VERSION: Final = b"http://knx.org/xml/project/14"
 
+# number of derived ETS6 ZIP passwords kept in memory
+ETS6_ZIP_PASSWORD_CACHE_SIZE: Final = 16
+# protected project archives up to this size are inflated into memory
+EXTRACT_IN_MEMORY_MAX_SIZE: Final = 64 * 1024 * 1024
+
 
 MAIN_DPT: Final = "DPT-"
 MAIN_AND_SUB_DPT: Final = "DPST-"
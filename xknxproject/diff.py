@@ -0,0 +1,187 @@
+"""
+Keyed diff of two KNXProject results.
+
+Entries of `group_addresses`, `devices` and `communication_objects` are
+matched by their key. The nested sections are flattened: areas of `topology`
+are keyed by their address ("1") without their lines, lines by area and line
+address ("1.1"); spaces of `locations` are keyed by the path of their names
+("Building/Floor/Room") without their subspaces.
+
+Entries are looked up by key in both projects and entries with the same key
+are compared by content - shared entries, like the communication objects
+carried over by an incremental parse, by identity. `ProjectIndex` also
+provides a fingerprint of every entry to store and compare changes across
+runs. Fingerprints are not used for a diff in memory: serializing an entry
+takes about 3 times longer than comparing two entries once.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from typing import Any, Final
+
+from xknxproject.models import Area, KNXProject, Space
+from xknxproject.util import fingerprint
+
+# sections diffed by default - in KNXProject order
+DIFF_SECTIONS: Final = (
+    "communication_objects",
+    "topology",
+    "devices",
+    "group_addresses",
+    "locations",
+)
+LOCATION_PATH_SEPARATOR: Final = "/"
+
+
+@dataclass
+class EntryChange:
+    """An entry present in both projects with different content."""
+
+    old: dict[str, Any]
+    new: dict[str, Any]
+    # keys of the entry with different values - e.g. "name" or "dpt_type"
+    fields: list[str]
+
+
+@dataclass
+class SectionDiff:
+    """Differences of a section - by entry key."""
+
+    added: dict[str, dict[str, Any]] = field(default_factory=dict)
+    removed: dict[str, dict[str, Any]] = field(default_factory=dict)
+    changed: dict[str, EntryChange] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        """Return True if the section differs."""
+        return bool(self.added or self.removed or self.changed)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the keys of added and removed and the changed fields of changed entries."""
+        return {
+            "added": list(self.added),
+            "removed": list(self.removed),
+            "changed": {key: change.fields for key, change in self.changed.items()},
+        }
+
+
+@dataclass
+class ProjectDiff:
+    """Differences of two KNXProjects - by section."""
+
+    sections: dict[str, SectionDiff]
+
+    def __bool__(self) -> bool:
+        """Return True if any section differs."""
+        return any(self.sections.values())
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the differences for export - e.g. as JSON."""
+        return {
+            section: section_diff.as_dict()
+            for section, section_diff in self.sections.items()
+        }
+
+
+class ProjectIndex:
+    """Entries of the diffed sections of a KNXProject by key."""
+
+    def __init__(self, project: KNXProject) -> None:
+        """Initialize a ProjectIndex - sections are flattened on first use."""
+        self.project = project
+        self._entries: dict[str, dict[str, dict[str, Any]]] = {}
+        self._fingerprints: dict[str, dict[str, str]] = {}
+
+    def entries(self, section: str) -> dict[str, dict[str, Any]]:
+        """Return the entries of a section by key - nested sections flattened."""
+        if (entries := self._entries.get(section)) is None:
+            if section not in _FLATTENERS:
+                raise ValueError(
+                    f"Unknown section {section!r} - valid sections are {list(DIFF_SECTIONS)}"
+                )
+            entries = self._entries[section] = _FLATTENERS[section](
+                self.project[section]  # type: ignore[literal-required]
+            )
+        return entries
+
+    def fingerprints(self, section: str) -> dict[str, str]:
+        """Return the fingerprints of the entries of a section by key."""
+        if (fingerprints := self._fingerprints.get(section)) is None:
+            fingerprints = self._fingerprints[section] = {
+                key: fingerprint(entry) for key, entry in self.entries(section).items()
+            }
+        return fingerprints
+
+
+def diff_projects(
+    old: KNXProject | ProjectIndex,
+    new: KNXProject | ProjectIndex,
+    sections: Iterable[str] = DIFF_SECTIONS,
+) -> ProjectDiff:
+    """Return the differences between two projects or their indexes."""
+    old_index = old if isinstance(old, ProjectIndex) else ProjectIndex(old)
+    new_index = new if isinstance(new, ProjectIndex) else ProjectIndex(new)
+    return ProjectDiff(
+        sections={
+            section: diff_section(old_index, new_index, section) for section in sections
+        }
+    )
+
+
+def diff_section(old: ProjectIndex, new: ProjectIndex, section: str) -> SectionDiff:
+    """Return the differences of a section between two project indexes."""
+    old_entries = old.entries(section)
+    new_entries = new.entries(section)
+    result = SectionDiff()
+    for key, old_entry in old_entries.items():
+        if (new_entry := new_entries.get(key)) is None:
+            result.removed[key] = old_entry
+        elif new_entry is not old_entry and new_entry != old_entry:
+            result.changed[key] = EntryChange(
+                old=old_entry,
+                new=new_entry,
+                fields=[
+                    name
+                    for name in {**old_entry, **new_entry}
+                    if old_entry.get(name) != new_entry.get(name)
+                ],
+            )
+    for key, new_entry in new_entries.items():
+        if key not in old_entries:
+            result.added[key] = new_entry
+    return result
+
+
+def _flatten_topology(topology: dict[str, Area]) -> dict[str, dict[str, Any]]:
+    """Key areas by address and lines by area and line address."""
+    entries: dict[str, dict[str, Any]] = {}
+    for area_address, area in topology.items():
+        entries[area_address] = {
+            name: value for name, value in area.items() if name != "lines"
+        }
+        for line_address, line in area["lines"].items():
+            entries[f"{area_address}.{line_address}"] = dict(line)
+    return entries
+
+
+def _flatten_locations(
+    spaces: dict[str, Space], parent_path: str = ""
+) -> dict[str, dict[str, Any]]:
+    """Key spaces by the path of their names."""
+    entries: dict[str, dict[str, Any]] = {}
+    for name, space in spaces.items():
+        path = f"{parent_path}{name}"
+        entries[path] = {key: value for key, value in space.items() if key != "spaces"}
+        entries.update(
+            _flatten_locations(space["spaces"], f"{path}{LOCATION_PATH_SEPARATOR}")
+        )
+    return entries
+
+
+_FLATTENERS: Final[dict[str, Any]] = {
+    "communication_objects": dict,
+    "topology": _flatten_topology,
+    "devices": dict,
+    "group_addresses": dict,
+    "locations": _flatten_locations,
+}
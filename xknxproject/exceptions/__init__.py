@@ -1,6 +1,7 @@
 """Package for exception handling."""
 from .exceptions import (
     InvalidPasswordException,
+    InvalidSerializedProjectException,
     ProjectNotFoundException,
     XknxProjectException,
 )
@@ -8,5 +9,6 @@ from .exceptions import (
 __all__ = [
     "XknxProjectException",
     "InvalidPasswordException",
+    "InvalidSerializedProjectException",
     "ProjectNotFoundException",
 ]
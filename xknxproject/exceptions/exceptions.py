@@ -11,3 +11,7 @@ class InvalidPasswordException(XknxProjectException):
 
 class ProjectNotFoundException(XknxProjectException):
     """Project files not found in /tmp directory."""
+
+
+class InvalidSerializedProjectException(XknxProjectException):
+    """Data is not a KNXProject serialized in a supported format."""
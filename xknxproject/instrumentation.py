@@ -0,0 +1,191 @@
+"""
+Per-stage metrics of a parse.
+
+Pass an `Instrumentation` to `XKNXProj` or `XMLParser` to record the wall and
+CPU time, decompressed bytes, parsed XML elements and - if `trace_memory` is
+set - the peak traced memory of every stage. Without one, stages run in a
+`nullcontext` and the XML backend skips all counting.
+
+Stages may nest - e.g. key derivation within extraction. The metrics of a
+stage include those of its nested stages. XML parsed in worker processes is
+not counted. Stages of `XKNXProj.parse_async` run in executor threads - the
+callback is called from these and peak memory of concurrent stages overlaps.
+"""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+import threading
+import time
+import tracemalloc
+from typing import IO, Any, Literal
+
+StageEvent = Literal["start", "end"]
+
+_CURRENT_STAGE: ContextVar[_RunningStage | None] = ContextVar(
+    "xknxproject_current_stage", default=None
+)
+
+
+@dataclass
+class StageMetrics:
+    """Metrics of a stage - times in seconds, sizes in bytes."""
+
+    name: str
+    # number of enclosing stages
+    depth: int = 0
+    wall_time: float = 0.0
+    # CPU time of the whole process - including other threads
+    cpu_time: float = 0.0
+    bytes_decompressed: int = 0
+    # XML elements handed to the loaders by the XML backend
+    elements_parsed: int = 0
+    # peak traced memory above the traced memory at the start of the stage -
+    # None if memory is not traced
+    peak_memory: int | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics as a dict."""
+        return asdict(self)
+
+
+class _RunningStage:
+    """A stage being measured."""
+
+    __slots__ = ("instrumentation", "metrics", "parent", "peak_seen")
+
+    def __init__(
+        self,
+        instrumentation: Instrumentation,
+        metrics: StageMetrics,
+        parent: _RunningStage | None,
+    ) -> None:
+        """Initialize a _RunningStage."""
+        self.instrumentation = instrumentation
+        self.metrics = metrics
+        self.parent = parent
+        # highest traced memory seen before nested stages reset the peak
+        self.peak_seen = 0
+
+
+class Instrumentation:
+    """Collector of the StageMetrics of a parse."""
+
+    def __init__(
+        self,
+        callback: Callable[[StageEvent, StageMetrics], None] | None = None,
+        trace_memory: bool = False,
+    ) -> None:
+        """
+        Initialize an Instrumentation.
+
+        `callback` is called with "start" and "end" and the metrics of every
+        stage. If `trace_memory` is set, tracemalloc is started for a stage if it
+        isn't tracing already - this slows down the parse considerably.
+        """
+        self.callback = callback
+        self.trace_memory = trace_memory
+        # measured stages in the order they started
+        self.stages: list[StageMetrics] = []
+        # nested stages of concurrent jobs add their counts to the same parent
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name: str) -> Iterator[StageMetrics]:
+        """Measure a stage."""
+        parent = _CURRENT_STAGE.get()
+        metrics = StageMetrics(
+            name=name, depth=0 if parent is None else parent.metrics.depth + 1
+        )
+        running = _RunningStage(self, metrics, parent)
+        self.stages.append(metrics)
+        if self.callback is not None:
+            self.callback("start", metrics)
+
+        start_memory = 0
+        started_tracing = False
+        if self.trace_memory:
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+                started_tracing = True
+            start_memory, peak = tracemalloc.get_traced_memory()
+            if parent is not None:
+                parent.peak_seen = max(parent.peak_seen, peak)
+            tracemalloc.reset_peak()
+        token = _CURRENT_STAGE.set(running)
+        start_time = time.perf_counter()
+        start_cpu_time = time.process_time()
+        try:
+            yield metrics
+        finally:
+            metrics.wall_time = time.perf_counter() - start_time
+            metrics.cpu_time = time.process_time() - start_cpu_time
+            _CURRENT_STAGE.reset(token)
+            if self.trace_memory and tracemalloc.is_tracing():
+                peak = max(running.peak_seen, tracemalloc.get_traced_memory()[1])
+                metrics.peak_memory = peak - start_memory
+                if parent is not None:
+                    parent.peak_seen = max(parent.peak_seen, peak)
+                if started_tracing:
+                    tracemalloc.stop()
+            if parent is not None:
+                with self._lock:
+                    parent.metrics.bytes_decompressed += metrics.bytes_decompressed
+                    parent.metrics.elements_parsed += metrics.elements_parsed
+            if self.callback is not None:
+                self.callback("end", metrics)
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the metrics of all stages for export - e.g. as JSON."""
+        return {
+            "stages": [metrics.as_dict() for metrics in self.stages],
+            "wall_time": sum(
+                metrics.wall_time for metrics in self.stages if metrics.depth == 0
+            ),
+        }
+
+
+def measure(
+    instrumentation: Instrumentation | None, name: str
+) -> AbstractContextManager[StageMetrics | None]:
+    """Measure a stage if `instrumentation` is given."""
+    if instrumentation is None:
+        return nullcontext()
+    return instrumentation.stage(name)
+
+
+def nested_stage(name: str) -> AbstractContextManager[StageMetrics | None]:
+    """Measure a stage nested in the running stage - if a stage is measured."""
+    if (running := _CURRENT_STAGE.get()) is None:
+        return nullcontext()
+    return running.instrumentation.stage(name)
+
+
+def current_stage() -> StageMetrics | None:
+    """Return the metrics of the innermost running stage - None if not measured."""
+    if (running := _CURRENT_STAGE.get()) is None:
+        return None
+    return running.metrics
+
+
+def count_decompressed(size: int) -> None:
+    """Add decompressed bytes to the running stage."""
+    if (running := _CURRENT_STAGE.get()) is not None:
+        running.metrics.bytes_decompressed += size
+
+
+class CountingReader:
+    """Binary file wrapper adding the bytes read to a stage."""
+
+    def __init__(self, source: IO[bytes], metrics: StageMetrics) -> None:
+        """Initialize a CountingReader."""
+        self._source = source
+        self._metrics = metrics
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to `size` bytes."""
+        data = self._source.read(size)
+        self._metrics.bytes_decompressed += len(data)
+        return data
@@ -1,90 +1,73 @@
 """Application Program Loader."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from typing import Final
 from xml.etree import ElementTree
-from zipfile import Path
+from zipfile import Path, ZipFile
 
+from xknxproject.loader import xml_backend
 from xknxproject.models import ComObject, ComObjectRef, DeviceInstance
-from xknxproject.util import parse_dpt_types, parse_xml_flag
+from xknxproject.util import Interner, parse_xml_flag
+
+# ({ComObjectRef Id: ComObjectRef}, {ComObject Id: ComObject})
+ApplicationProgramTables = tuple[dict[str, ComObjectRef], dict[str, ComObject]]
+
+COM_OBJECT_TAG: Final = "ComObject"
+COM_OBJECT_REF_TAG: Final = "ComObjectRef"
+APPLICATION_PROGRAM_TAG: Final = "ApplicationProgram"
 
 
 class ApplicationProgramLoader:
     """Load the application program from KNX XML."""
 
     @staticmethod
-    def load(
-        application_program_path: Path, devices: list[DeviceInstance]
-    ) -> None:  # tuple[dict[str, ComObjectRef], dict[str, ComObject]]:
+    def load(application_program_path: Path, devices: list[DeviceInstance]) -> None:
         """Load Hardware mappings and assign to devices."""
-        com_object_instance_refs = [
-            instance_ref
+        com_object_refs, com_objects = ApplicationProgramLoader.load_tables(
+            application_program_path,
+            ApplicationProgramLoader.get_used_com_object_ref_ids(devices),
+        )
+        ApplicationProgramLoader.merge(devices, com_object_refs, com_objects)
+
+    @staticmethod
+    def get_used_com_object_ref_ids(devices: list[DeviceInstance]) -> set[str]:
+        """Get the ComObjectRef ids referenced by the devices ComObjectInstanceRefs."""
+        return {
+            instance_ref.ref_id
             for device in devices
             for instance_ref in device.com_object_instance_refs
-        ]
-        used_com_object_ref_ids = {
-            instance_ref.ref_id for instance_ref in com_object_instance_refs
         }
-        com_object_refs: dict[str, ComObjectRef] = {}  # {Id: ComObjectRef}
-        com_objects: dict[str, ComObject] = {}  # {Id: ComObject}
 
-        with application_program_path.open(mode="rb") as application_xml:
-            for _, elem in ElementTree.iterparse(application_xml):
-                if elem.tag.endswith("ComObject"):
-                    # we take all since we don't know which are referenced to yet
-                    identifier = elem.attrib.get("Id")
-                    com_objects[identifier] = ComObject(
-                        identifier=identifier,
-                        name=elem.get("Name"),
-                        text=elem.get("Text"),
-                        number=elem.get("Number"),
-                        function_text=elem.get("FunctionText"),
-                        object_size=elem.get("ObjectSize"),
-                        read_flag=parse_xml_flag(elem.get("ReadFlag"), False),
-                        write_flag=parse_xml_flag(elem.get("WriteFlag"), False),
-                        communication_flag=parse_xml_flag(
-                            elem.get("CommunicationFlag"), False
-                        ),
-                        transmit_flag=parse_xml_flag(elem.get("TransmitFlag"), False),
-                        update_flag=parse_xml_flag(elem.get("UpdateFlag"), False),
-                        read_on_init_flag=parse_xml_flag(
-                            elem.get("ReadOnInitFlag"), False
-                        ),
-                        datapoint_type=parse_dpt_types(
-                            elem.get("DatapointType", "").split(" ")
-                        ),
-                    )
-                if elem.tag.endswith("ComObjectRef"):
-                    identifier = elem.attrib.get("Id")
-                    if identifier in used_com_object_ref_ids:
-                        _dpt_type = elem.get("DatapointType")
-                        datapoint_type = (
-                            parse_dpt_types(_dpt_type.split(" ")) if _dpt_type else None
-                        )
-
-                        com_object_refs[identifier] = ComObjectRef(
-                            identifier=identifier,
-                            ref_id=elem.get("RefId"),
-                            name=elem.get("Name"),
-                            text=elem.get("Text"),
-                            function_text=elem.get("FunctionText"),
-                            object_size=elem.get("ObjectSize"),
-                            read_flag=parse_xml_flag(elem.get("ReadFlag")),
-                            write_flag=parse_xml_flag(elem.get("WriteFlag")),
-                            communication_flag=parse_xml_flag(
-                                elem.get("CommunicationFlag")
-                            ),
-                            transmit_flag=parse_xml_flag(elem.get("TransmitFlag")),
-                            update_flag=parse_xml_flag(elem.get("UpdateFlag")),
-                            read_on_init_flag=parse_xml_flag(
-                                elem.get("ReadOnInitFlag")
-                            ),
-                            datapoint_type=datapoint_type,
-                        )
-                if elem.tag.endswith("ApplicationPrograms"):
-                    # We don't need anything after ApplicationPrograms
-                    elem.clear()
-                    break
-                elem.clear()
+    @staticmethod
+    def load_tables(
+        application_program_path: Path,
+        used_com_object_ref_ids: set[str] | None,
+        interner: Interner | None = None,
+    ) -> ApplicationProgramTables:
+        """
+        Load the used ComObjectRefs and the ComObjects they point to.
+
+        If `used_com_object_ref_ids` is None, all ComObjectRefs and ComObjects are loaded.
+        Otherwise reading stops as soon as all used ComObjectRefs and their
+        ComObjects are found - ComObjects precede ComObjectRefs in the schema.
+        Repeated attribute values are shared through `interner`.
+        """
+        if used_com_object_ref_ids is not None and not used_com_object_ref_ids:
+            return {}, {}
+        return _ApplicationProgramStreamLoader(
+            used_com_object_ref_ids, interner or Interner()
+        ).load(application_program_path)
 
-            for com_instance in com_object_instance_refs:
+    @staticmethod
+    def merge(
+        devices: list[DeviceInstance],
+        com_object_refs: dict[str, ComObjectRef],
+        com_objects: dict[str, ComObject],
+    ) -> None:
+        """Merge application program information into the devices ComObjectInstanceRefs."""
+        for device in devices:
+            for com_instance in device.com_object_instance_refs:
                 _com_object_ref = com_object_refs[com_instance.ref_id]
                 com_instance.merge_from_application(_com_object_ref)
                 com_instance.merge_from_application(com_objects[_com_object_ref.ref_id])
@@ -106,3 +89,141 @@ class ApplicationProgramLoader:
             (project_root_path / xml_file): devices
             for xml_file, devices in _result.items()
         }
+
+
+class _ApplicationProgramStreamLoader:
+    """Stream an application program collecting ComObjectRefs and ComObjects."""
+
+    def __init__(
+        self, used_com_object_ref_ids: set[str] | None, interner: Interner
+    ) -> None:
+        """Initialize an _ApplicationProgramStreamLoader."""
+        self.interner = interner
+        # ComObjectRef ids not found yet - None to load all
+        self.remaining_ref_ids = (
+            None if used_com_object_ref_ids is None else set(used_com_object_ref_ids)
+        )
+        # ComObject ids of found ComObjectRefs whose ComObject wasn't seen yet
+        self.pending_com_object_ids: set[str] = set()
+        self.com_object_refs: dict[str, ComObjectRef] = {}  # {Id: ComObjectRef}
+        # attributes of all ComObjects - only referenced ones are materialised
+        self.com_object_attributes: dict[str, dict[str, str]] = {}  # {Id: attrib}
+
+    def load(self, application_program_path: Path) -> ApplicationProgramTables:
+        """Parse the application program."""
+        # {namespaced tag: handler} - resolved from the first reported element
+        handlers: dict[str, Callable[[ElementTree.Element], None]] = {}
+        with application_program_path.open(mode="rb") as application_xml:
+            # only ComObject, ComObjectRef and ApplicationProgram elements are
+            # reported by the backend
+            for _, elem in xml_backend.BACKEND.iterparse(
+                application_xml,
+                tags=(COM_OBJECT_TAG, COM_OBJECT_REF_TAG, APPLICATION_PROGRAM_TAG),
+            ):
+                if not handlers:
+                    namespace = elem.tag[: elem.tag.find("}") + 1]
+                    handlers = {
+                        f"{namespace}{COM_OBJECT_TAG}": self._com_object,
+                        f"{namespace}{COM_OBJECT_REF_TAG}": self._com_object_ref,
+                    }
+                if (handler := handlers.get(elem.tag)) is None:
+                    # We don't need anything after the ApplicationProgram
+                    break
+                handler(elem)
+                if (
+                    self.remaining_ref_ids is not None
+                    and not self.remaining_ref_ids
+                    and not self.pending_com_object_ids
+                ):
+                    break
+
+        if self.remaining_ref_ids is None:
+            com_object_ids: Iterable[str] = self.com_object_attributes
+        else:
+            # only keep ComObjects that are referenced
+            com_object_ids = dict.fromkeys(
+                com_object_ref.ref_id
+                for com_object_ref in self.com_object_refs.values()
+            )
+        return self.com_object_refs, {
+            identifier: self._create_com_object(
+                identifier, self.com_object_attributes[identifier]
+            )
+            for identifier in com_object_ids
+        }
+
+    def _com_object(self, elem: ElementTree.Element) -> None:
+        """Keep the attributes of a ComObject - we don't know which are referenced yet."""
+        identifier = elem.get("Id", "")
+        self.com_object_attributes[identifier] = dict(elem.attrib)
+        self.pending_com_object_ids.discard(identifier)
+
+    def _com_object_ref(self, elem: ElementTree.Element) -> None:
+        """Create a used ComObjectRef."""
+        identifier = elem.get("Id", "")
+        if self.remaining_ref_ids is not None:
+            if identifier not in self.remaining_ref_ids:
+                return
+            self.remaining_ref_ids.remove(identifier)
+
+        interner = self.interner
+        _dpt_type = elem.get("DatapointType")
+        com_object_ref = self.com_object_refs[identifier] = ComObjectRef(
+            identifier=identifier,
+            ref_id=interner(elem.get("RefId")),  # type: ignore[arg-type]
+            name=interner(elem.get("Name")),
+            text=interner(elem.get("Text")),
+            function_text=interner(elem.get("FunctionText")),
+            object_size=interner(elem.get("ObjectSize")),
+            read_flag=parse_xml_flag(elem.get("ReadFlag")),
+            write_flag=parse_xml_flag(elem.get("WriteFlag")),
+            communication_flag=parse_xml_flag(elem.get("CommunicationFlag")),
+            transmit_flag=parse_xml_flag(elem.get("TransmitFlag")),
+            update_flag=parse_xml_flag(elem.get("UpdateFlag")),
+            read_on_init_flag=parse_xml_flag(elem.get("ReadOnInitFlag")),
+            datapoint_type=interner.dpt_types(_dpt_type) if _dpt_type else None,
+        )
+        if com_object_ref.ref_id not in self.com_object_attributes:
+            self.pending_com_object_ids.add(com_object_ref.ref_id)
+
+    def _create_com_object(
+        self, identifier: str, attributes: dict[str, str]
+    ) -> ComObject:
+        """Create a ComObject from its attributes."""
+        interner = self.interner
+        return ComObject(
+            identifier=identifier,
+            name=interner(attributes.get("Name")),  # type: ignore[arg-type]
+            text=interner(attributes.get("Text")),  # type: ignore[arg-type]
+            number=attributes.get("Number"),  # type: ignore[arg-type]
+            function_text=interner(attributes.get("FunctionText")),  # type: ignore[arg-type]
+            object_size=interner(attributes.get("ObjectSize")),  # type: ignore[arg-type]
+            read_flag=parse_xml_flag(attributes.get("ReadFlag"), False),
+            write_flag=parse_xml_flag(attributes.get("WriteFlag"), False),
+            communication_flag=parse_xml_flag(
+                attributes.get("CommunicationFlag"), False
+            ),
+            transmit_flag=parse_xml_flag(attributes.get("TransmitFlag"), False),
+            update_flag=parse_xml_flag(attributes.get("UpdateFlag"), False),
+            read_on_init_flag=parse_xml_flag(attributes.get("ReadOnInitFlag"), False),
+            datapoint_type=interner.dpt_types(attributes.get("DatapointType", "")),
+        )
+
+
+# archives opened by worker processes - kept open for the lifetime of the process
+_WORKER_ARCHIVES: dict[str, ZipFile] = {}
+
+
+def load_application_program_tables_in_worker(
+    archive_path: str,
+    application_program_name: str,
+    used_com_object_ref_ids: set[str] | None,
+) -> ApplicationProgramTables:
+    """Load application program tables in a worker process opening the archive itself."""
+    if (archive := _WORKER_ARCHIVES.get(archive_path)) is None:
+        # pylint: disable-next=consider-using-with
+        archive = ZipFile(archive_path, mode="r")
+        _WORKER_ARCHIVES[archive_path] = archive
+    return ApplicationProgramLoader.load_tables(
+        Path(archive, application_program_name), used_com_object_ref_ids
+    )
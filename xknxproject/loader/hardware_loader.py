@@ -4,6 +4,7 @@ from __future__ import annotations
 from xml.etree import ElementTree
 from zipfile import Path
 
+from xknxproject.loader import xml_backend
 from xknxproject.models import Hardware
 from xknxproject.zip import KNXProjContents
 
@@ -12,14 +13,56 @@ class HardwareLoader:
     """Load hardware from KNX XML."""
 
     @staticmethod
-    def load(hardware_file: Path) -> list[Hardware]:
-        """Load Hardware mappings."""
+    def load(
+        hardware_file: Path, hardware_refs: set[str] | None = None
+    ) -> list[Hardware]:
+        """
+        Load Hardware mappings.
+
+        If `hardware_refs` is given, only Hardware with these ids is parsed and
+        reading stops as soon as all of them have been found.
+        """
         hardware_list: list[Hardware] = []
+        remaining_refs = None if hardware_refs is None else set(hardware_refs)
+        if remaining_refs is not None and not remaining_refs:
+            return hardware_list
 
         with hardware_file.open(mode="rb") as hardware_xml:
-            tree = ElementTree.parse(hardware_xml)
-            for hardware in tree.findall(".//{*}Manufacturer/{*}Hardware/{*}Hardware"):
-                hardware_list.append(HardwareLoader.parse_hardware_element(hardware))
+            hardware_tag = ""
+            # tags of the currently open elements - root is `tags[0]`
+            tags: list[str] = []
+            in_hardware = False
+            for event, elem in xml_backend.BACKEND.iterparse(
+                hardware_xml, events=("start", "end")
+            ):
+                if event == "start":
+                    if not tags:
+                        namespace, _, _ = elem.tag.rpartition("}")
+                        hardware_tag = (
+                            f"{namespace}}}Hardware" if namespace else "Hardware"
+                        )
+                    tags.append(elem.tag)
+                    # KNX/ManufacturerData/Manufacturer/Hardware/Hardware
+                    if len(tags) == 5 and elem.tag == tags[3] == hardware_tag:
+                        in_hardware = True
+                    continue
+
+                tags.pop()
+                if in_hardware and len(tags) == 4:
+                    in_hardware = False
+                    if remaining_refs is None:
+                        hardware_list.append(
+                            HardwareLoader.parse_hardware_element(elem)
+                        )
+                    elif (identifier := elem.get("Id", "")) in remaining_refs:
+                        hardware_list.append(
+                            HardwareLoader.parse_hardware_element(elem)
+                        )
+                        remaining_refs.remove(identifier)
+                        if not remaining_refs:
+                            break
+                if not in_hardware:
+                    elem.clear()
 
         return hardware_list
 
@@ -28,16 +71,17 @@ class HardwareLoader:
         """Parse hardware mapping."""
         identifier: str = hardware_node.get("Id", "")
         name: str = hardware_node.get("Name", "")
-        _product_node = hardware_node.find(".//{*}Product")
+        _product_node = xml_backend.BACKEND.find(hardware_node, ".//{*}Product")
         text: str = _product_node.get("Text", "") if _product_node is not None else ""
         application_program_refs: dict[str, str] = {}
-        for hardware2program_element in hardware_node.findall(
-            ".//{*}Hardware2Programs/{*}Hardware2Program[@Id]/{*}ApplicationProgramRef[@RefId]/.."
+        for hardware2program_element in xml_backend.BACKEND.findall(
+            hardware_node,
+            ".//{*}Hardware2Programs/{*}Hardware2Program[@Id]/{*}ApplicationProgramRef[@RefId]/..",
         ):
             application_program_refs[
                 hardware2program_element.get("Id")  # type: ignore[index]
-            ] = hardware2program_element.find(
-                "{*}ApplicationProgramRef"
+            ] = xml_backend.BACKEND.find(
+                hardware2program_element, "{*}ApplicationProgramRef"
             ).get(  # type: ignore[union-attr]
                 "RefId"
             )  # type: ignore[assignment]
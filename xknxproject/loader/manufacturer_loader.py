@@ -1,28 +1,62 @@
 """KNX Master Data Loader."""
 from __future__ import annotations
 
-from xml.etree import ElementTree
 from zipfile import Path
 
-from xknxproject.models import DeviceInstance
+from xknxproject.loader import xml_backend
+from xknxproject.models import DeviceInstance, KNXMasterData
 
 
 class ManufacturerLoader:
     """Load KNX master XML."""
 
     @staticmethod
-    def load(knx_master_file: Path, devices: list[DeviceInstance]) -> None:
-        """Load KNX manufacturer."""
+    def load(knx_master_file: Path, devices: list[DeviceInstance]) -> KNXMasterData:
+        """
+        Load KNX manufacturer names.
+
+        The file is streamed and reading stops as soon as all manufacturers of
+        `devices` are resolved or the Manufacturers section ends.
+        """
         manufacturer_mapping: dict[str, str | None] = dict.fromkeys(
             {device.manufacturer for device in devices}
         )
+        unresolved_manufacturers = set(manufacturer_mapping)
 
         with knx_master_file.open(mode="rb") as master_xml:
-            tree = ElementTree.parse(master_xml)
-            for manufacturer in tree.findall(".//{*}Manufacturers/{*}Manufacturer"):
-                identifier = manufacturer.get("Id", "")
-                if identifier in manufacturer_mapping:
-                    manufacturer_mapping[identifier] = manufacturer.get("Name", "")
+            manufacturers_tag = manufacturer_tag = ""
+            for event, elem in xml_backend.BACKEND.iterparse(
+                master_xml, events=("start", "end")
+            ):
+                if not manufacturers_tag:
+                    # resolve the namespace from the root element
+                    namespace = elem.tag[: elem.tag.find("}") + 1]
+                    manufacturers_tag = f"{namespace}Manufacturers"
+                    manufacturer_tag = f"{namespace}Manufacturer"
+
+                if event == "end":
+                    if elem.tag == manufacturers_tag:
+                        break
+                    elem.clear()
+                    continue
+
+                if elem.tag == manufacturer_tag:
+                    identifier = elem.get("Id", "")
+                    if identifier in unresolved_manufacturers:
+                        manufacturer_mapping[identifier] = elem.get("Name", "")
+                        unresolved_manufacturers.remove(identifier)
+                        if not unresolved_manufacturers:
+                            break
+                elif elem.tag == manufacturers_tag and not unresolved_manufacturers:
+                    break
 
         for device in devices:
             device.manufacturer_name = manufacturer_mapping[device.manufacturer]  # type: ignore[assignment]
+
+        return KNXMasterData(
+            manufacturer_names={
+                identifier: name
+                for identifier, name in manufacturer_mapping.items()
+                if name is not None
+            }
+        )
@@ -1,8 +1,10 @@
 """Project file loader."""
 from __future__ import annotations
 
+from typing import IO
 from xml.etree import ElementTree
 
+from xknxproject.loader import xml_backend
 from xknxproject.models import (
     ComObjectInstanceRef,
     DeviceInstance,
@@ -12,7 +14,7 @@ from xknxproject.models import (
     XMLLine,
     XMLSpace,
 )
-from xknxproject.util import parse_dpt_types, parse_xml_flag
+from xknxproject.util import Interner, parse_xml_flag
 from xknxproject.zip import KNXProjContents
 
 
@@ -22,113 +24,227 @@ class ProjectLoader:
     @staticmethod
     def load(
         knx_proj_contents: KNXProjContents,
+        interner: Interner | None = None,
     ) -> tuple[
         list[XMLGroupAddress], list[XMLArea], list[DeviceInstance], list[XMLSpace]
     ]:
-        """Load topology mappings."""
-        areas: list[XMLArea] = []
-        devices: list[DeviceInstance] = []
-        group_address_list: list[XMLGroupAddress] = []
-        spaces: list[XMLSpace] = []
-
+        """
+        Load topology mappings.
+
+        0.xml is streamed in a single pass. Group addresses, areas, lines, devices
+        and spaces are created as soon as their elements are read and finished
+        subtrees are cleared, so memory usage is bound by the output, not the XML.
+        Repeated attribute values are shared through `interner`.
+        """
         with knx_proj_contents.open_project_0() as project_file:
-            tree = ElementTree.parse(project_file)
-            for group_ranges_element in tree.findall(
-                "{*}Project/{*}Installations/{*}Installation/{*}GroupAddresses/{*}GroupRanges"
-            ):
-                _GroupAddressLoader.load(group_address_list, group_ranges=group_ranges_element)
-                
-            for topology_element in tree.findall(
-                "{*}Project/{*}Installations/{*}Installation/{*}Topology"
-            ):
-                areas.extend(
-                    _TopologyLoader.load(topology_element=topology_element),
-                )
-            for area in areas:
-                for line in area.lines:
-                    devices.extend(line.devices)
-            for location_element in tree.findall(
-                "{*}Project/{*}Installations/{*}Installation/{*}Locations"
-            ):
-                spaces.extend(
-                    _LocationLoader(devices).load(location_element=location_element),
-                )
+            return _ProjectStreamLoader(interner or Interner()).load(project_file)
 
-        return group_address_list, areas, devices, spaces
 
+class _ProjectTags:
+    """Tags of the project schema resolved with its namespace."""
 
-class _GroupAddressLoader:
-    """Load GroupAddress info from KNX XML."""
+    def __init__(self, namespace: str = "") -> None:
+        """Initialize the _ProjectTags."""
+        self.installation_path = [
+            f"{namespace}Project",
+            f"{namespace}Installations",
+            f"{namespace}Installation",
+        ]
+        self.topology = f"{namespace}Topology"
+        self.group_addresses = f"{namespace}GroupAddresses"
+        self.locations = f"{namespace}Locations"
+        self.sections = {self.topology, self.group_addresses, self.locations}
+        self.area = f"{namespace}Area"
+        self.segment = f"{namespace}Segment"
+        self.device_instance = f"{namespace}DeviceInstance"
+        self.group_ranges = f"{namespace}GroupRanges"
+        self.space = f"{namespace}Space"
+
+
+class _ProjectStreamLoader:
+    """Create project models from a single iterparse pass over 0.xml."""
+
+    # depth of elements - KNX/Project/Installations/Installation/<section>
+    SECTION_DEPTH = 5
+
+    def __init__(self, interner: Interner) -> None:
+        """Initialize the _ProjectStreamLoader."""
+        self.interner = interner
+        self.areas: list[XMLArea] = []
+        self.devices: list[DeviceInstance] = []
+        self.group_addresses: list[XMLGroupAddress] = []
+        self.spaces: list[XMLSpace] = []
+
+        self._tags = _ProjectTags()
+        self._area: XMLArea | None = None
+        self._line: XMLLine | None = None
+        self._line_has_segment = False
+        self._main_group_range_name: str | None = None
+        self._middle_group_range_name: str | None = None
 
-    @staticmethod
-    def load(groupaddress_list: list, group_ranges: ElementTree.Element) -> XMLGroupAddress:
-        """Appends GroupAddress mappings to groupaddress list."""
-        for main_group_range in group_ranges:
-            main_address_name = main_group_range.get("Name")
-            for middle_group_range in main_group_range:
-                middle_address_name = middle_group_range.get("Name")
-                for address in middle_group_range:
-                    xml_groupaddress = XMLGroupAddress(
-                        main_name = main_address_name,
-                        middle_name = middle_address_name,
-                        name = address.get("Name", ""),
-                        identifier = address.get("Id", ""),
-                        address = address.get("Address", ""),
-                        dpt_type = address.get("DatapointType"),
-                        description = address.get("Description", "")
+    def load(
+        self, project_file: IO[bytes]
+    ) -> tuple[
+        list[XMLGroupAddress], list[XMLArea], list[DeviceInstance], list[XMLSpace]
+    ]:
+        """Parse 0.xml."""
+        # tags of the currently open elements - root is `tags[0]`
+        tags: list[str] = []
+        section = ""
+        # depth of the element whose subtree is kept until its end event
+        keep_depth = 0
+        for event, elem in xml_backend.BACKEND.iterparse(
+            project_file, events=("start", "end")
+        ):
+            if event == "start":
+                if not tags:
+                    # resolve the namespace of the schema version from the root
+                    self._tags = _ProjectTags(elem.tag[: elem.tag.find("}") + 1])
+                tags.append(elem.tag)
+                depth = len(tags)
+                if keep_depth:
+                    continue
+                if depth == self.SECTION_DEPTH:
+                    section = (
+                        elem.tag
+                        if tags[1:4] == self._tags.installation_path
+                        and elem.tag in self._tags.sections
+                        else ""
                     )
-
-                    groupaddress_list.append(xml_groupaddress)
+                elif section == self._tags.topology:
+                    keep_depth = self._topology_start(elem, depth)
+                elif section == self._tags.group_addresses:
+                    self._group_addresses_start(elem, tags)
+                elif (
+                    section == self._tags.locations
+                    and depth == self.SECTION_DEPTH + 1
+                    and elem.tag == self._tags.space
+                ):
+                    keep_depth = depth
+                continue
+
+            depth = len(tags)
+            tags.pop()
+            if keep_depth:
+                if depth > keep_depth:
+                    continue
+                keep_depth = 0
+                if section == self._tags.topology and self._line is not None:
+                    if device := _TopologyLoader.create_device(
+                        elem, self._line, self.interner
+                    ):
+                        self._line.devices.append(device)
+                        self.devices.append(device)
+                elif section == self._tags.locations:
+                    self.spaces.append(_LocationLoader.parse_space(elem))
+            elif section == self._tags.topology:
+                self._topology_end(depth)
+            elif section == self._tags.group_addresses:
+                self._group_addresses_end(elem, tags, depth)
+            elem.clear()
+
+        _LocationLoader(self.devices).resolve_devices(self.spaces)
+        return self.group_addresses, self.areas, self.devices, self.spaces
+
+    def _topology_start(self, elem: ElementTree.Element, depth: int) -> int:
+        """Handle a start event in Topology. Return the depth of a DeviceInstance."""
+        if depth == self.SECTION_DEPTH + 1:
+            self._area = None
+            if elem.tag == self._tags.area:
+                self._area = _TopologyLoader.create_area(elem)
+                self.areas.append(self._area)
+        elif depth == self.SECTION_DEPTH + 2:
+            self._line = None
+            if self._area is not None:
+                # every child of an Area is a Line
+                self._line = _TopologyLoader.create_line(
+                    elem, self._area, self.interner
+                )
+                self._area.lines.append(self._line)
+                self._line_has_segment = False
+        elif self._line is not None:
+            if (
+                depth == self.SECTION_DEPTH + 3
+                and elem.tag == self._tags.segment
+                and not self._line_has_segment
+            ):
+                #  ETS-6 (21) adds "Segment" tags between "Line" and "DeviceInstance" tags
+                self._line.medium_type = self.interner(elem.get("MediumTypeRefId", ""))
+                self._line_has_segment = True
+            elif elem.tag == self._tags.device_instance:
+                return depth
+        return 0
+
+    def _topology_end(self, depth: int) -> None:
+        """Handle an end event in Topology."""
+        if depth == self.SECTION_DEPTH + 1:
+            self._area = None
+        elif depth == self.SECTION_DEPTH + 2:
+            self._line = None
+
+    def _group_addresses_start(
+        self, elem: ElementTree.Element, tags: list[str]
+    ) -> None:
+        """Handle a start event in GroupAddresses."""
+        depth = len(tags)
+        if (
+            depth <= self.SECTION_DEPTH + 1
+            or tags[self.SECTION_DEPTH] != self._tags.group_ranges
+        ):
+            return
+        if depth == self.SECTION_DEPTH + 2:
+            self._main_group_range_name = elem.get("Name")
+        elif depth == self.SECTION_DEPTH + 3:
+            self._middle_group_range_name = elem.get("Name")
+
+    def _group_addresses_end(
+        self, elem: ElementTree.Element, tags: list[str], depth: int
+    ) -> None:
+        """Handle an end event in GroupAddresses."""
+        # GroupRanges/<main GroupRange>/<middle GroupRange>/<GroupAddress>
+        if (
+            depth == self.SECTION_DEPTH + 4
+            and tags[self.SECTION_DEPTH] == self._tags.group_ranges
+        ):
+            self.group_addresses.append(
+                XMLGroupAddress(
+                    main_name=self._main_group_range_name,  # type: ignore[arg-type]
+                    middle_name=self._middle_group_range_name,  # type: ignore[arg-type]
+                    name=elem.get("Name", ""),
+                    identifier=elem.get("Id", ""),
+                    address=elem.get("Address", ""),
+                    dpt_type=elem.get("DatapointType"),
+                    description=elem.get("Description", ""),
+                    interner=self.interner,
+                )
+            )
 
 
 class _TopologyLoader:
     """Load topology from KNX XML."""
 
     @staticmethod
-    def load(topology_element: ElementTree.Element) -> list[XMLArea]:
-        """Load topology mappings."""
-        areas: list[XMLArea] = []
-
-        for area in topology_element.findall("{*}Area"):
-            areas.append(_TopologyLoader._create_area(area))
-
-        return areas
-
-    @staticmethod
-    def _create_area(area_element: ElementTree.Element) -> XMLArea:
-        """Create an Area."""
+    def create_area(area_element: ElementTree.Element) -> XMLArea:
+        """Create an Area without lines."""
         address: int = int(area_element.get("Address", ""))
         name: str = area_element.get("Name", "")
         description: str | None = area_element.get("Description")
-        area: XMLArea = XMLArea(address, name, description, [])
-
-        for line_element in area_element:
-            area.lines.append(_TopologyLoader._create_line(line_element, area))
-
-        return area
+        return XMLArea(address, name, description, [])
 
     @staticmethod
-    def _create_line(line_element: ElementTree.Element, area: XMLArea) -> XMLLine:
-        """Create a Line."""
+    def create_line(
+        line_element: ElementTree.Element, area: XMLArea, interner: Interner
+    ) -> XMLLine:
+        """Create a Line without devices."""
         address: int = int(line_element.get("Address", ""))
         name: str = line_element.get("Name", "")
         description: str | None = line_element.get("Description")
-        if (segment := line_element.find("{*}Segment")) is not None:
-            #  ETS-6 (21) adds "Segment" tags between "Line" and "DeviceInstance" tags
-            medium_type = segment.get("MediumTypeRefId", "")
-        else:
-            medium_type = line_element.get("MediumTypeRefId", "")
-        line: XMLLine = XMLLine(address, description, name, medium_type, [], area)
-
-        for device_element in line_element.findall(".//{*}DeviceInstance"):
-            if device := _TopologyLoader._create_device(device_element, line):
-                line.devices.append(device)
-
-        return line
+        medium_type = interner(line_element.get("MediumTypeRefId", ""))
+        return XMLLine(address, description, name, medium_type, [], area)
 
     @staticmethod
-    def _create_device(
-        device_element: ElementTree.Element, line: XMLLine
+    def create_device(
+        device_element: ElementTree.Element, line: XMLLine, interner: Interner
     ) -> DeviceInstance | None:
         """Create device."""
         identifier: str = device_element.get("Id", "")
@@ -141,8 +257,8 @@ class _TopologyLoader:
         name: str = device_element.get("Name", "")
         last_modified: str = device_element.get("LastModified", "")
         _product_ref_parts = device_element.get("ProductRefId", "").split("_")
-        hardware_ref = _product_ref_parts[0] + "_" + _product_ref_parts[1]
-        hardware_program_ref = device_element.get("Hardware2ProgramRefId", "")
+        hardware_ref = interner(_product_ref_parts[0] + "_" + _product_ref_parts[1])
+        hardware_program_ref = interner(device_element.get("Hardware2ProgramRefId", ""))
         device: DeviceInstance = DeviceInstance(
             identifier=identifier,
             address=address,
@@ -151,7 +267,7 @@ class _TopologyLoader:
             hardware_ref=hardware_ref,
             hardware_program_ref=hardware_program_ref,
             line=line,
-            manufacturer=_product_ref_parts[0],
+            manufacturer=interner(_product_ref_parts[0]),
         )
 
         for sub_node in device_element:
@@ -161,29 +277,29 @@ class _TopologyLoader:
                         device.additional_addresses.append(_address)
             if sub_node.tag.endswith("ComObjectInstanceRefs"):
                 for com_object in sub_node:
-                    if instance := _TopologyLoader._create_com_object_instance(
-                        com_object
+                    if instance := _TopologyLoader.create_com_object_instance(
+                        com_object, interner
                     ):
                         device.com_object_instance_refs.append(instance)
 
         return device
 
     @staticmethod
-    def _create_com_object_instance(
-        com_object: ElementTree.Element,
+    def create_com_object_instance(
+        com_object: ElementTree.Element, interner: Interner
     ) -> ComObjectInstanceRef | None:
         """Create ComObjectInstanceRef."""
         if not (links := com_object.get("Links")):
             return None
 
         _dpt_type = com_object.get("DatapointType")
-        datapoint_type = parse_dpt_types(_dpt_type.split(" ")) if _dpt_type else None
+        datapoint_type = interner.dpt_types(_dpt_type) if _dpt_type else None
 
         return ComObjectInstanceRef(
             identifier=com_object.get("Id"),
-            ref_id=com_object.get("RefId"),  # type: ignore[arg-type]
-            text=com_object.get("Text"),
-            function_text=com_object.get("FunctionText"),
+            ref_id=interner(com_object.get("RefId")),  # type: ignore[arg-type]
+            text=interner(com_object.get("Text")),
+            function_text=interner(com_object.get("FunctionText")),
             read_flag=parse_xml_flag(com_object.get("ReadFlag")),
             write_flag=parse_xml_flag(com_object.get("WriteFlag")),
             communication_flag=parse_xml_flag(com_object.get("CommunicationFlag")),
@@ -191,8 +307,8 @@ class _TopologyLoader:
             update_flag=parse_xml_flag(com_object.get("UpdateFlag")),
             read_on_init_flag=parse_xml_flag(com_object.get("ReadOnInitFlag")),
             datapoint_type=datapoint_type,
-            description=com_object.get("Description"),
-            links=links.split(" "),
+            description=interner(com_object.get("Description")),
+            links=[interner(link) for link in links.split(" ")],
         )
 
 
@@ -205,14 +321,9 @@ class _LocationLoader:
             device.identifier: device.individual_address for device in devices
         }
 
-    def load(self, location_element: ElementTree.Element) -> list[XMLSpace]:
-        """Load Location mappings."""
-        return [
-            self.parse_space(space) for space in location_element.findall("{*}Space")
-        ]
-
-    def parse_space(self, node: ElementTree.Element) -> XMLSpace:
-        """Parse a space from the document."""
+    @staticmethod
+    def parse_space(node: ElementTree.Element) -> XMLSpace:
+        """Parse a space from the document. Devices are DeviceInstance ids until resolved."""
         name: str = node.get("Name", "")
         space_type = SpaceType(node.get("Type"))
         space: XMLSpace = XMLSpace([], space_type, name, [])
@@ -220,9 +331,18 @@ class _LocationLoader:
         for sub_node in node:
             if sub_node.tag.endswith("Space"):
                 # recursively call parse space since this can be nested for an unbound time in the XSD
-                space.spaces.append(self.parse_space(sub_node))
+                space.spaces.append(_LocationLoader.parse_space(sub_node))
             elif sub_node.tag.endswith("DeviceInstanceRef"):
-                if individual_address := self.devices.get(sub_node.get("RefId", "")):
-                    space.devices.append(individual_address)
+                space.devices.append(sub_node.get("RefId", ""))
 
         return space
+
+    def resolve_devices(self, spaces: list[XMLSpace]) -> None:
+        """Replace DeviceInstance ids by individual addresses - Locations may precede the Topology."""
+        for space in spaces:
+            space.devices = [
+                individual_address
+                for device_id in space.devices
+                if (individual_address := self.devices.get(device_id))
+            ]
+            self.resolve_devices(space.spaces)
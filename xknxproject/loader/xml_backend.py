@@ -0,0 +1,188 @@
+"""
+XML backend used by the loaders.
+
+lxml is used if it is installed, `xml.etree.ElementTree` otherwise. The backend
+is selected once at import time and can be forced by setting the environment
+variable `XKNXPROJECT_XML_BACKEND` to "lxml" or "etree". Elements of both
+backends share the ElementTree API used by the loaders - `tag`, `get()`,
+iteration over children and `clear()`.
+"""
+from __future__ import annotations
+
+from collections.abc import Iterable, Iterator
+import logging
+import os
+import re
+from typing import IO, Any, Final, Literal, cast
+from xml.etree import ElementTree
+
+from xknxproject import instrumentation
+
+logger = logging.getLogger("xknxproject.log")
+
+XML_BACKEND_ENV: Final = "XKNXPROJECT_XML_BACKEND"
+
+ParserEvent = Literal["start", "end"]
+
+_NAMESPACE_WILDCARD: Final = re.compile(r"\{\*\}([\w.-]+)")
+
+
+class ElementTreeBackend:
+    """Parse XML with `xml.etree.ElementTree`."""
+
+    name = "etree"
+
+    def iterparse(
+        self,
+        source: IO[bytes],
+        events: tuple[ParserEvent, ...] = ("end",),
+        tags: Iterable[str] | None = None,
+    ) -> Iterator[tuple[str, ElementTree.Element]]:
+        """
+        Iterate over the parser events of `source`.
+
+        If `tags` is given, only end events of elements with these local names
+        are yielded. Yielded elements may be cleared once the next one is
+        requested then, so only their attributes and text are reliable.
+        Read bytes and yielded elements are counted if a stage is measured.
+        """
+        if (metrics := instrumentation.current_stage()) is None:
+            return self._iterparse(source, events, tags)
+        return _count_events(
+            self._iterparse(
+                cast(IO[bytes], instrumentation.CountingReader(source, metrics)),
+                events,
+                tags,
+            ),
+            metrics,
+        )
+
+    def _iterparse(
+        self,
+        source: IO[bytes],
+        events: tuple[ParserEvent, ...],
+        tags: Iterable[str] | None,
+    ) -> Iterator[tuple[str, ElementTree.Element]]:
+        """Iterate over parser events - every element is cleared after a matching tag."""
+        if tags is None:
+            yield from ElementTree.iterparse(source, events=events)
+            return
+
+        local_tags = set(tags)
+        namespaced_tags: set[str] = set()
+        for event, elem in ElementTree.iterparse(source, events=("end",)):
+            if not namespaced_tags:
+                # resolve the namespace of the document from its first element
+                namespace = elem.tag[: elem.tag.find("}") + 1]
+                namespaced_tags = {f"{namespace}{tag}" for tag in local_tags}
+            if elem.tag in namespaced_tags:
+                yield event, elem
+            elem.clear()
+
+    def find(self, elem: ElementTree.Element, path: str) -> ElementTree.Element | None:
+        """Return the first element matching an ElementPath expression or None."""
+        return elem.find(path)
+
+    def findall(
+        self, elem: ElementTree.Element, path: str
+    ) -> list[ElementTree.Element]:
+        """Return all elements matching an ElementPath expression."""
+        return elem.findall(path)
+
+
+class LxmlBackend(ElementTreeBackend):
+    """
+    Parse XML with lxml.
+
+    Tag filters are applied by the parser in C and ElementPath expressions are
+    compiled to XPath once per expression.
+    """
+
+    name = "lxml"
+
+    def __init__(self) -> None:
+        """Initialize the LxmlBackend."""
+        # pylint: disable-next=import-outside-toplevel
+        from lxml import etree
+
+        self._etree = etree
+        self._xpaths: dict[str, Any] = {}
+
+    def _iterparse(
+        self,
+        source: IO[bytes],
+        events: tuple[ParserEvent, ...],
+        tags: Iterable[str] | None,
+    ) -> Iterator[tuple[str, ElementTree.Element]]:
+        """Iterate over parser events - elements before a matching tag are released."""
+        options: dict[str, Any] = {
+            "remove_comments": True,
+            "remove_pis": True,
+            "resolve_entities": False,
+            "huge_tree": True,
+        }
+        if tags is None:
+            yield from self._etree.iterparse(source, events=events, **options)
+            return
+
+        for event, elem in self._etree.iterparse(
+            source,
+            events=("end",),
+            tag=[f"{{*}}{tag}" for tag in tags],
+            **options,
+        ):
+            yield event, elem
+            elem.clear()
+            # drop finished siblings - the parser doesn't report unmatched elements
+            for node in (elem, *elem.iterancestors()):
+                while node.getprevious() is not None:
+                    del node.getparent()[0]
+
+    def find(self, elem: ElementTree.Element, path: str) -> ElementTree.Element | None:
+        """Return the first element matching an ElementPath expression or None."""
+        return next(iter(self._xpath(path)(elem)), None)
+
+    def findall(
+        self, elem: ElementTree.Element, path: str
+    ) -> list[ElementTree.Element]:
+        """Return all elements matching an ElementPath expression."""
+        return self._xpath(path)(elem)  # type: ignore[no-any-return]
+
+    def _xpath(self, path: str) -> Any:
+        """Return the compiled XPath for an ElementPath expression with `{*}` wildcards."""
+        if (xpath := self._xpaths.get(path)) is None:
+            xpath = self._xpaths[path] = self._etree.XPath(
+                _NAMESPACE_WILDCARD.sub(r"*[local-name()='\1']", path)
+            )
+        return xpath
+
+
+def _count_events(
+    events: Iterator[tuple[str, ElementTree.Element]],
+    metrics: instrumentation.StageMetrics,
+) -> Iterator[tuple[str, ElementTree.Element]]:
+    """Count the elements handed to a loader by their end events."""
+    for event in events:
+        if event[0] == "end":
+            metrics.elements_parsed += 1
+        yield event
+
+
+def _select_backend() -> ElementTreeBackend:
+    """Select the backend from the environment or by availability of lxml."""
+    requested = os.environ.get(XML_BACKEND_ENV, "").lower()
+    if requested == ElementTreeBackend.name:
+        return ElementTreeBackend()
+    if requested not in ("", LxmlBackend.name):
+        logger.warning("Unknown %s %r - ignored", XML_BACKEND_ENV, requested)
+    try:
+        return LxmlBackend()
+    except ImportError:
+        if requested == LxmlBackend.name:
+            logger.warning(
+                "%s is set to lxml but lxml is not installed", XML_BACKEND_ENV
+            )
+        return ElementTreeBackend()
+
+
+BACKEND: ElementTreeBackend = _select_backend()
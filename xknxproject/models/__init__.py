@@ -15,10 +15,12 @@ from .models import (
     ComObjectRef,
     DeviceInstance,
     Hardware,
+    KNXMasterData,
     XMLArea,
     XMLGroupAddress,
     XMLLine,
     XMLSpace,
+    resolve_com_object_ref_id,
 )
 from .static import MEDIUM_TYPES, SpaceType
 
@@ -41,5 +43,7 @@ __all__ = [
     "XMLLine",
     "XMLSpace",
     "Hardware",
+    "KNXMasterData",
     "MEDIUM_TYPES",
+    "resolve_com_object_ref_id",
 ]
@@ -3,14 +3,38 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 import re
+from typing import Any, ClassVar, Final, overload
 
 from xknxproject.models.static import SpaceType
-from xknxproject.util import parse_dpt_types
+from xknxproject.util import Interner, parse_dpt_types
+
+# module and ModuleInstance part of a ComObjectInstanceRef RefId - it is not
+# part of the ids in the application program
+_MODULE_INSTANCE_PATTERN: Final = re.compile(r"(M-\d+?_MI-\d+?_)")
+
+
+def resolve_com_object_ref_id(application_program_ref: str, ref_id: str) -> str:
+    """Return the application program ComObjectRef id of a ComObjectInstanceRef RefId."""
+    # every match contains "_MI-" - most ref ids don't reference a module
+    if "_MI-" in ref_id:
+        ref_id = _MODULE_INSTANCE_PATTERN.sub("", ref_id)
+    return f"{application_program_ref}_{ref_id}"
 
 
 class XMLGroupAddress:
     """Class that represents a group address."""
 
+    __slots__ = (
+        "main_name",
+        "middle_name",
+        "name",
+        "identifier",
+        "raw_address",
+        "description",
+        "dpt_type",
+        "address",
+    )
+
     def __init__(
         self,
         main_name: str,
@@ -20,17 +44,22 @@ class XMLGroupAddress:
         address: str,
         description: str,
         dpt_type: str | None,
+        interner: Interner | None = None,
     ):
-        """Initialize a group address."""
+        """Initialize a group address. DPTs are shared through `interner` if given."""
         self.main_name = main_name
         self.middle_name = middle_name
         self.name = name
         self.identifier = identifier.split("_")[1]
         self.raw_address = int(address)
         self.description = description
-        self.dpt_type = (
-            None if dpt_type is None else parse_dpt_types(dpt_type.split(" "))
-        )
+        self.dpt_type: dict[str, int] | None
+        if dpt_type is None:
+            self.dpt_type = None
+        elif interner is None:
+            self.dpt_type = parse_dpt_types(dpt_type.split(" "))
+        else:
+            self.dpt_type = interner.dpt_types(dpt_type)
 
         self.address = self._parse_address()
 
@@ -50,6 +79,8 @@ class XMLGroupAddress:
 class XMLArea:
     """Class that represents a area."""
 
+    __slots__ = ("address", "name", "description", "lines")
+
     address: int
     name: str
     description: str | None
@@ -60,6 +91,8 @@ class XMLArea:
 class XMLLine:
     """Class that represents a Line."""
 
+    __slots__ = ("address", "description", "name", "medium_type", "devices", "area")
+
     address: int
     description: str | None
     name: str
@@ -71,6 +104,25 @@ class XMLLine:
 class DeviceInstance:
     """Class that represents a device instance."""
 
+    __slots__ = (
+        "identifier",
+        "address",
+        "name",
+        "last_modified",
+        "hardware_ref",
+        "hardware_program_ref",
+        "line",
+        "manufacturer",
+        "additional_addresses",
+        "com_object_instance_refs",
+        "com_objects",
+        "application_program_ref",
+        "individual_address",
+        "product_name",
+        "hardware_name",
+        "manufacturer_name",
+    )
+
     def __init__(
         self,
         *,
@@ -118,36 +170,163 @@ class DeviceInstance:
         return f"{self.manufacturer}/{self.application_program_ref}.xml"
 
 
-@dataclass
+class _PackedFlag:
+    """Descriptor for a tri-state flag packed into 2 bits of `_flags`.
+
+    The low bit records if the flag is set at all, the high bit holds its value.
+    """
+
+    __slots__ = ("_set_bit", "_value_bit", "_mask")
+
+    def __init__(self, index: int):
+        """Initialize a packed flag at the given index."""
+        self._set_bit = 1 << (2 * index)
+        self._value_bit = self._set_bit << 1
+        self._mask = self._set_bit | self._value_bit
+
+    @overload
+    def __get__(self, instance: None, owner: type[Any]) -> _PackedFlag:
+        ...
+
+    @overload
+    def __get__(self, instance: ComObjectInstanceRef, owner: type[Any]) -> bool | None:
+        ...
+
+    def __get__(
+        self, instance: ComObjectInstanceRef | None, owner: type[Any]
+    ) -> _PackedFlag | bool | None:
+        """Return the flag of the instance - the descriptor itself on the class."""
+        if instance is None:
+            return self
+        flags = instance._flags  # pylint: disable=protected-access
+        if not flags & self._set_bit:
+            return None
+        return bool(flags & self._value_bit)
+
+    def __set__(self, instance: ComObjectInstanceRef, value: bool | None) -> None:
+        """Set the flag of the instance."""
+        flags = instance._flags & ~self._mask  # pylint: disable=protected-access
+        if value is not None:
+            flags |= self._value_bit | self._set_bit if value else self._set_bit
+        instance._flags = flags  # pylint: disable=protected-access
+
+
 class ComObjectInstanceRef:
     """Class that represents a ComObjectInstanceRef instance."""
 
+    __slots__ = (
+        "identifier",
+        "ref_id",
+        "text",
+        "function_text",
+        "_flags",
+        "datapoint_type",
+        "description",
+        "links",
+        "name",
+        "number",
+        "object_size",
+    )
+    # arguments of `__init__` - compared by `__eq__` and shown by `__repr__`
+    _FIELDS: ClassVar[tuple[str, ...]] = (
+        "identifier",
+        "ref_id",
+        "text",
+        "function_text",
+        "read_flag",
+        "write_flag",
+        "communication_flag",
+        "transmit_flag",
+        "update_flag",
+        "read_on_init_flag",
+        "datapoint_type",
+        "description",
+        "links",
+        "name",
+        "number",
+        "object_size",
+    )
+    # mutable and compared by value - not hashable
+    __hash__ = None  # type: ignore[assignment]
+
     identifier: str | None  # "Id" - xs:ID
     # "RefId" - knx:RELIDREF - required - points to a ComObjectRef Id
     # initially stripped by the devices application_program_ref
     ref_id: str
     text: str | None  # "Text"
     function_text: str | None  # "FunctionText"
-    read_flag: bool | None  # "ReadFlag" - knx:Enable_t
-    write_flag: bool | None  # "WriteFlag" - knx:Enable_t
-    communication_flag: bool | None  # "CommunicationFlag" - knx:Enable_t
-    transmit_flag: bool | None  # "TransmitFlag" - knx:Enable_t
-    update_flag: bool | None  # "UpdateFlag" - knx:Enable_t
-    read_on_init_flag: bool | None  # "ReadOnInitFlag" - knx:Enable_t
+    # bool | None - packed into `_flags`
+    read_flag = _PackedFlag(0)  # "ReadFlag" - knx:Enable_t
+    write_flag = _PackedFlag(1)  # "WriteFlag" - knx:Enable_t
+    communication_flag = _PackedFlag(2)  # "CommunicationFlag" - knx:Enable_t
+    transmit_flag = _PackedFlag(3)  # "TransmitFlag" - knx:Enable_t
+    update_flag = _PackedFlag(4)  # "UpdateFlag" - knx:Enable_t
+    read_on_init_flag = _PackedFlag(5)  # "ReadOnInitFlag" - knx:Enable_t
     datapoint_type: dict[str, int] | None  # "DataPointType" - knx:IDREFS
     description: str | None  # "Description" - language dependent
     links: list[str] | None  # "Links" - knx:RELIDREFS
+    # only available form ComObject and ComObjectRef - defaults of `__init__`
+    # as slots can't have class level defaults
+    name: str | None
+    number: int | None
+    object_size: str | None
 
-    # only available form ComObject and ComObjectRef
-    name: str | None = None
-    number: int | None = None
-    object_size: str | None = None
+    def __init__(
+        self,
+        identifier: str | None,
+        ref_id: str,
+        text: str | None,
+        function_text: str | None,
+        read_flag: bool | None,
+        write_flag: bool | None,
+        communication_flag: bool | None,
+        transmit_flag: bool | None,
+        update_flag: bool | None,
+        read_on_init_flag: bool | None,
+        datapoint_type: dict[str, int] | None,
+        description: str | None,
+        links: list[str] | None,
+        name: str | None = None,
+        number: int | None = None,
+        object_size: str | None = None,
+    ):
+        """Initialize a ComObjectInstanceRef."""
+        self.identifier = identifier
+        self.ref_id = ref_id
+        self.text = text
+        self.function_text = function_text
+        self._flags = 0
+        self.read_flag = read_flag
+        self.write_flag = write_flag
+        self.communication_flag = communication_flag
+        self.transmit_flag = transmit_flag
+        self.update_flag = update_flag
+        self.read_on_init_flag = read_on_init_flag
+        self.datapoint_type = datapoint_type
+        self.description = description
+        self.links = links
+        self.name = name
+        self.number = number
+        self.object_size = object_size
+
+    def __eq__(self, other: object) -> bool:
+        """Compare all fields like a dataclass."""
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return all(
+            getattr(self, field) == getattr(other, field) for field in self._FIELDS
+        )
+
+    def __repr__(self) -> str:
+        """Return the fields like a dataclass."""
+        fields = ", ".join(
+            f"{field}={getattr(self, field)!r}" for field in self._FIELDS
+        )
+        return f"{self.__class__.__name__}({fields})"
 
     def update_ref_id(self, application_program_ref: str) -> None:
         """Prepend the ref_id with the application program ref."""
-        # Remove module and ModuleInstance occurence as they will not be in the application program directly
-        self.ref_id = re.sub(r"(M-\d+?_MI-\d+?_)", "", self.ref_id)
-        self.ref_id = f"{application_program_ref}_{self.ref_id}"
+        self.ref_id = resolve_com_object_ref_id(application_program_ref, self.ref_id)
 
     def merge_from_application(self, com_object: ComObject | ComObjectRef) -> None:
         """Fill missing information with information parsed from the application program."""
@@ -212,6 +391,10 @@ class ComObject:
     read_on_init_flag: bool  # "ReadOnInitFlag" - knx:Enable_t
     datapoint_type: dict[str, int] | None  # "DataPointType" - knx:IDREFS - optional
 
+    def __reduce__(self) -> tuple[type[ComObject], tuple[Any, ...]]:
+        """Pickle as positional arguments - frozen slots can't be restored by setattr."""
+        return self.__class__, tuple(getattr(self, slot) for slot in self.__slots__)
+
 
 @dataclass(frozen=True)
 class ComObjectRef:
@@ -247,11 +430,17 @@ class ComObjectRef:
     read_on_init_flag: bool | None  # "ReadOnInitFlag" - knx:Enable_t
     datapoint_type: dict[str, int] | None  # "DataPointType" - knx:IDREFS
 
+    def __reduce__(self) -> tuple[type[ComObjectRef], tuple[Any, ...]]:
+        """Pickle as positional arguments - frozen slots can't be restored by setattr."""
+        return self.__class__, tuple(getattr(self, slot) for slot in self.__slots__)
+
 
 @dataclass
 class XMLSpace:
     """A space in the location XML."""
 
+    __slots__ = ("spaces", "type", "name", "devices")
+
     spaces: list[XMLSpace]
     type: SpaceType
     name: str
@@ -262,9 +451,18 @@ class XMLSpace:
 class Hardware:
     """Model a Hardware instance."""
 
+    __slots__ = ("identifier", "name", "product_name", "application_program_refs")
+
     identifier: str
     name: str
     product_name: str
     application_program_refs: dict[
         str, str
     ]  # {Hardware2ProgramRefID: ApplicationProgramRef}
+
+
+@dataclass
+class KNXMasterData:
+    """Model the parts of knx_master.xml used by the project."""
+
+    manufacturer_names: dict[str, str]  # {Manufacturer Id: Name}
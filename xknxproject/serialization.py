@@ -0,0 +1,426 @@
+"""
+Compact binary serialization of KNXProject.
+
+The format is safe to load from untrusted sources and independent of the
+Python version. Serialized data is a header followed by the payload - zlib
+compressed if flag bit 0 is set:
+
+    header   magic b"XKPB", format version (uint8), flags (uint8)
+    payload  size of the layout (uint32), the layout as UTF-8 JSON
+             `[[[item size, byte size], ...], root node]`, then the streams
+
+Values are stored column wise. All values at the same position of the tree -
+e.g. the names of all devices - form a node. A node is `[tags, alternatives]`:
+`tags` is the stream of the alternative of each value - null if all values
+have the same alternative. An alternative is one of
+
+    ["s", refs]                     strings - string table index of each
+    ["p", values]                   None, bools and numbers - a JSON array
+    ["l", lengths, node]            lists - the items of all lists are a node
+    ["m", lengths, keys, node]      dicts - refs of their keys, values a node
+    ["r", [key refs], [node, ...]]  records - dicts sharing the same keys, a
+                                    node per key
+
+Dicts are records if several dicts of a node have the same keys in the same
+order - e.g. the devices. Others - e.g. sections keyed by identifiers - are
+maps.
+
+Streams of item size 0 are UTF-8 JSON arrays, the others little endian
+unsigned integers. Stream 0 is the string table - a JSON array of every
+distinct string. Every distinct string is stored and allocated once.
+
+Loading decodes every stream in C and rebuilds the lists and dicts of a node
+at once - Python code runs per node, not per value. `loads` rejects
+inconsistent data and checks the result is a KNXProject - possibly partial -
+before returning it.
+
+`dumps` and `loads` round-trip any JSON compatible project - including partial
+projects and projects loaded from JSON - preserving the order of keys.
+`dumps_value` and `loads_value` do the same for any JSON compatible value.
+"""
+from __future__ import annotations
+
+from array import array
+from collections import Counter, defaultdict, deque
+from collections.abc import Sequence
+from itertools import chain, compress as select, count, islice, repeat
+import json
+from operator import setitem
+import struct
+import sys
+from typing import Any, Final, cast
+import zlib
+
+from xknxproject.exceptions import InvalidSerializedProjectException
+from xknxproject.models import KNXProject
+from xknxproject.util import FrozenDict
+
+FORMAT_VERSION: Final = 3
+# magic, format version, flags
+_HEADER: Final = struct.Struct("<4sBB")
+_LAYOUT_SIZE: Final = struct.Struct("<I")
+_MAGIC: Final = b"XKPB"
+_FLAG_COMPRESSED: Final = 1
+# deeper values are rejected - a KNXProject nests spaces of locations only
+MAX_DEPTH: Final = 64
+# dicts with more keys are stored as maps even if they share their keys
+_MAX_RECORD_FIELDS: Final = 64
+
+# kinds of values - dicts are keyed by their keys if stored as records
+_STR: Final = 0
+_PRIMITIVE: Final = 1
+_LIST: Final = 2
+_DICT: Final = 3
+_KINDS: Final[dict[type, int]] = {
+    str: _STR,
+    type(None): _PRIMITIVE,
+    bool: _PRIMITIVE,
+    int: _PRIMITIVE,
+    float: _PRIMITIVE,
+    list: _LIST,
+    dict: _DICT,
+    # shared DPTs of a parse
+    FrozenDict: _DICT,
+}
+_PRIMITIVE_TYPES: Final = {type(None), bool, int, float}
+# {item size: array typecode}
+_TYPECODES: Final = {1: "B", 2: "H", 4: "I"}
+
+
+def dumps(project: KNXProject, compress: bool = False) -> bytes:
+    """Serialize a KNXProject - `compress` trades dump and load time for size."""
+    return dumps_value(project, compress)
+
+
+def loads(data: bytes) -> KNXProject:
+    """Deserialize a KNXProject serialized by `dumps`."""
+    project = loads_value(data)
+    _validate(project)
+    return cast(KNXProject, project)
+
+
+def dumps_value(value: Any, compress: bool = False) -> bytes:
+    """Serialize any JSON compatible value - `compress` trades time for size."""
+    encoder = _Encoder()
+    root = encoder.node([value], 0)
+    encoder.streams[0] = (0, _json_array(list(encoder.strings)))
+    layout = _json_array(
+        [[[item_size, len(data)] for item_size, data in encoder.streams], root]
+    )
+    payload = b"".join(
+        (
+            _LAYOUT_SIZE.pack(len(layout)),
+            layout,
+            *(data for _, data in encoder.streams),
+        )
+    )
+
+    flags = 0
+    if compress:
+        payload = zlib.compress(payload)
+        flags |= _FLAG_COMPRESSED
+    return _HEADER.pack(_MAGIC, FORMAT_VERSION, flags) + payload
+
+
+def loads_value(data: bytes) -> Any:
+    """Deserialize a value serialized by `dumps_value`."""
+    try:
+        magic, format_version, flags = _HEADER.unpack_from(data)
+    except struct.error as err:
+        raise InvalidSerializedProjectException("Data is too short") from err
+    if magic != _MAGIC:
+        raise InvalidSerializedProjectException("Data is not a serialized KNXProject")
+    if format_version != FORMAT_VERSION:
+        raise InvalidSerializedProjectException(
+            f"Unsupported format version {format_version}"
+        )
+    try:
+        payload = memoryview(data)[_HEADER.size :]
+        if flags & _FLAG_COMPRESSED:
+            payload = memoryview(zlib.decompress(payload))
+        return _Decoder(payload).decode()
+    except (
+        IndexError,
+        KeyError,
+        ValueError,
+        TypeError,
+        RecursionError,
+        struct.error,
+        zlib.error,
+    ) as err:
+        # UnicodeDecodeError and JSONDecodeError are ValueErrors
+        raise InvalidSerializedProjectException(f"Invalid data: {err!r}") from err
+
+
+class _Encoder:
+    """Encoder of JSON compatible values to nodes and streams."""
+
+    def __init__(self) -> None:
+        """Initialize an _Encoder."""
+        # {string: index} - the string table in order of first use
+        self.strings: defaultdict[str, int] = defaultdict(count().__next__)
+        # [(item size, data)] - the string table is added last
+        self.streams: list[tuple[int, bytes]] = [(0, b"")]
+
+    def node(self, values: list[Any], depth: int) -> list[Any]:
+        """Encode the values at a position of the tree - return the node."""
+        if depth > MAX_DEPTH:
+            raise ValueError("Values nested too deeply")
+        kinds: list[Any] = list(map(_KINDS.get, map(type, values)))
+        if None in kinds:
+            kinds = list(map(_kind, values))
+        # the alternative of each value - its kind or the joined keys of records
+        keys = self._dict_keys(values, kinds) if _DICT in kinds else kinds
+
+        alternatives = list(dict.fromkeys(keys))
+        if len(alternatives) < 2:
+            return [
+                None,
+                [self._alternative(key, values, depth) for key in alternatives],
+            ]
+        index = {key: tag for tag, key in enumerate(alternatives)}
+        tags = list(map(index.__getitem__, keys))
+        return [
+            self._unsigned(tags),
+            [
+                self._alternative(
+                    key, list(select(values, map(tag.__eq__, tags))), depth
+                )
+                for tag, key in enumerate(alternatives)
+            ],
+        ]
+
+    @staticmethod
+    def _dict_keys(values: list[Any], kinds: list[int]) -> list[int | str]:
+        """
+        Return the alternatives of values - dicts sharing their keys are records.
+
+        Records are keyed by their joined keys. Strings aren't tracked by the
+        garbage collector - unlike tuples of keys. Other dicts - like the
+        sections keyed by identifiers - are maps.
+        """
+        all_dicts = kinds.count(_DICT) == len(kinds)
+        dicts = values if all_dicts else list(select(values, map(_DICT.__eq__, kinds)))
+        try:
+            signatures = list(map("\0".join, dicts))
+        except TypeError as err:
+            raise TypeError(f"Can't serialize dict keys: {err}") from err
+        record_keys: dict[str, int | str] = {
+            signature: signature
+            if number > 1 and signature and signature.count("\0") < _MAX_RECORD_FIELDS
+            else _DICT
+            for signature, number in Counter(signatures).items()
+        }
+        dict_keys = list(map(record_keys.__getitem__, signatures))
+        if all_dicts:
+            return dict_keys
+        next_dict_key = iter(dict_keys).__next__
+        return [next_dict_key() if kind == _DICT else kind for kind in kinds]
+
+    def _alternative(self, key: int | str, values: list[Any], depth: int) -> list[Any]:
+        """Encode the values of an alternative of a node."""
+        if isinstance(key, str):
+            fields = tuple(values[0])
+            # dicts of the same joined keys have the same keys if no key holds "\0"
+            no_separator = len(fields) == key.count("\0") + 1
+            if no_separator and set(map(len, values)) == {len(fields)}:
+                # values of all records in one pass - a column is every n-th
+                items = list(chain.from_iterable(map(dict.values, values)))
+                return [
+                    "r",
+                    self._refs(fields),
+                    [
+                        self.node(items[column :: len(fields)], depth + 1)
+                        for column in range(len(fields))
+                    ],
+                ]
+            key = _DICT
+        if key == _STR:
+            return ["s", self._unsigned(list(map(self.strings.__getitem__, values)))]
+        if key == _PRIMITIVE:
+            return ["p", self._stream(0, _json_array(values))]
+        if key == _LIST:
+            return [
+                "l",
+                self._unsigned(list(map(len, values))),
+                self.node(list(chain.from_iterable(values)), depth + 1),
+            ]
+        return [
+            "m",
+            self._unsigned(list(map(len, values))),
+            self._unsigned(self._refs(list(chain.from_iterable(values)))),
+            self.node(list(chain.from_iterable(map(dict.values, values))), depth + 1),
+        ]
+
+    def _refs(self, keys: Sequence[Any]) -> list[int]:
+        """Return the string table indexes of dict keys - raise if not strings."""
+        if not set(map(type, keys)) <= {str}:
+            for key in keys:
+                if not isinstance(key, str):
+                    raise TypeError(f"Can't serialize dict key {type(key).__name__}")
+        return list(map(self.strings.__getitem__, keys))
+
+    def _unsigned(self, items: list[int]) -> int:
+        """Add a stream of unsigned integers - return its index."""
+        largest = max(items, default=0)
+        for item_size, typecode in _TYPECODES.items():
+            if largest < 1 << (8 * item_size):
+                data = array(typecode, items)
+                if sys.byteorder == "big":
+                    data.byteswap()
+                return self._stream(item_size, data.tobytes())
+        raise ValueError(f"Can't serialize {largest} items")
+
+    def _stream(self, item_size: int, data: bytes) -> int:
+        """Add a stream - return its index."""
+        self.streams.append((item_size, data))
+        return len(self.streams) - 1
+
+
+def _kind(value: Any) -> int:
+    """Return the kind of a value of a subclass of a JSON type."""
+    if isinstance(value, str):
+        return _STR
+    if isinstance(value, (bool, int, float)):
+        return _PRIMITIVE
+    if isinstance(value, list):
+        return _LIST
+    if isinstance(value, dict):
+        return _DICT
+    raise TypeError(f"Can't serialize {type(value).__name__}")
+
+
+def _json_array(items: list[Any]) -> bytes:
+    """Return items as compact UTF-8 JSON."""
+    return json.dumps(items, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class _Decoder:
+    """Decoder of the nodes and streams of a payload."""
+
+    def __init__(self, payload: memoryview) -> None:
+        """Initialize a _Decoder - raise if the streams don't match the payload."""
+        (layout_size,) = _LAYOUT_SIZE.unpack_from(payload)
+        position = _LAYOUT_SIZE.size + layout_size
+        stream_layout, self.root = json.loads(
+            bytes(payload[_LAYOUT_SIZE.size : position])
+        )
+        self.streams: list[tuple[int, memoryview]] = []
+        for item_size, size in stream_layout:
+            if size < 0:
+                raise ValueError("Invalid stream size")
+            self.streams.append((item_size, payload[position : position + size]))
+            position += size
+        if position != len(payload):
+            raise ValueError("Stream sizes don't match the data")
+        self.strings = self._json(0)
+        if not set(map(type, self.strings)) <= {str}:
+            raise ValueError("String table is not a list of strings")
+
+    def decode(self) -> Any:
+        """Decode the root value."""
+        (value,) = self._node(self.root, 1, 0)
+        return value
+
+    def _node(self, node: list[Any], size: int, depth: int) -> list[Any]:
+        """Decode the `size` values of a node."""
+        if depth > MAX_DEPTH:
+            raise ValueError("Values nested too deeply")
+        tags_stream, alternatives = node
+        if tags_stream is None:
+            if not size:
+                return []
+            # raises ValueError unless there is a single alternative
+            (alternative,) = alternatives
+            return self._alternative(alternative, size, depth)
+        tags = self._unsigned(tags_stream, size)
+        sizes = Counter(tags)
+        if max(sizes) >= len(alternatives):
+            raise ValueError("Tag out of the alternatives")
+        iterators = [
+            iter(self._alternative(alternative, sizes[tag], depth))
+            for tag, alternative in enumerate(alternatives)
+        ]
+        return list(map(next, map(iterators.__getitem__, tags)))
+
+    def _alternative(self, alternative: list[Any], size: int, depth: int) -> list[Any]:
+        """Decode the `size` values of an alternative of a node."""
+        kind = alternative[0]
+        if kind == "s":
+            return list(
+                map(self.strings.__getitem__, self._unsigned(alternative[1], size))
+            )
+        if kind == "p":
+            values = self._json(alternative[1])
+            if len(values) != size or not set(map(type, values)) <= _PRIMITIVE_TYPES:
+                raise ValueError("Invalid primitive values")
+            return values
+        if kind == "l":
+            lengths = self._unsigned(alternative[1], size)
+            items = iter(self._node(alternative[2], sum(lengths), depth + 1))
+            return list(map(list, map(islice, repeat(items), lengths)))
+        if kind == "m":
+            lengths = self._unsigned(alternative[1], size)
+            total = sum(lengths)
+            map_keys = map(
+                self.strings.__getitem__, self._unsigned(alternative[2], total)
+            )
+            items = zip(map_keys, self._node(alternative[3], total, depth + 1))
+            return list(map(dict, map(islice, repeat(items), lengths)))
+        if kind == "r":
+            keys = list(map(self.strings.__getitem__, alternative[1]))
+            if (
+                not keys
+                or len(set(keys)) != len(keys)
+                or len(alternative[2]) != len(keys)
+            ):
+                raise ValueError("Invalid record keys")
+            columns = [self._node(column, size, depth + 1) for column in alternative[2]]
+            # copies of a template have the keys in order and don't resize
+            records = list(map(dict.copy, repeat(dict.fromkeys(keys), size)))
+            for key, column in zip(keys, columns):
+                deque(map(setitem, records, repeat(key), column), 0)
+            return records
+        raise ValueError(f"Unknown alternative {kind!r}")
+
+    def _unsigned(self, index: int, size: int) -> array[int]:
+        """Return a stream of `size` unsigned integers."""
+        item_size, data = self.streams[index]
+        items = array(_TYPECODES[item_size])
+        items.frombytes(data)
+        if len(items) != size:
+            raise ValueError("Stream size doesn't match its node")
+        if sys.byteorder == "big":
+            items.byteswap()
+        return items
+
+    def _json(self, index: int) -> list[Any]:
+        """Return a JSON array stream."""
+        item_size, data = self.streams[index]
+        if item_size != 0 or not isinstance(items := json.loads(bytes(data)), list):
+            raise ValueError("Stream is not a JSON array")
+        return items
+
+
+# top level keys of a KNXProject and the types of their values
+_PROJECT_KEYS: Final[dict[str, type]] = {
+    "version": str,
+    "communication_objects": dict,
+    "topology": dict,
+    "devices": dict,
+    "group_addresses": dict,
+    "locations": dict,
+}
+
+
+def _validate(project: Any) -> None:
+    """Check decoded data is a KNXProject - sections may be missing."""
+    if not isinstance(project, dict) or not isinstance(project.get("version"), str):
+        raise InvalidSerializedProjectException("Data is not a serialized KNXProject")
+    for key, value in project.items():
+        if (value_type := _PROJECT_KEYS.get(key)) is None or not isinstance(
+            value, value_type
+        ):
+            raise InvalidSerializedProjectException(
+                f"Invalid KNXProject section {key!r}"
+            )
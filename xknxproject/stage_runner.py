@@ -0,0 +1,138 @@
+"""
+Run the stages of a parse from an asyncio event loop.
+
+`StageRunner` offloads the blocking work of `XKNXProj.parse_async` - key
+derivation, inflation, loader stages and conversion - to an executor and
+reports the progress through an async callback. Jobs are submitted with a copy
+of the current context, so the stages measured by an `Instrumentation` nest
+like in a synchronous parse. The executor has to be a thread pool: jobs share
+the parsed models and the open archive.
+
+Cancelling a parse cancels the jobs not started yet. Running jobs can't be
+interrupted - `wait_for_jobs()` waits for them before the archive is closed.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from concurrent.futures import Executor, Future
+from contextlib import asynccontextmanager
+import contextvars
+from dataclasses import dataclass
+from typing import Any, TypeVar
+
+from xknxproject.instrumentation import (
+    Instrumentation,
+    StageEvent,
+    measure,
+    nested_stage,
+)
+
+_T = TypeVar("_T")
+
+# name of the stage a task runs in - files loaded by its jobs are reported for it
+_REPORTED_STAGE: contextvars.ContextVar[str] = contextvars.ContextVar(
+    "xknxproject_reported_stage", default=""
+)
+
+
+@dataclass(frozen=True)
+class ProgressEvent:
+    """Start or end of a stage of an async parse."""
+
+    event: StageEvent
+    # "extract", a load stage of `STAGE_DEPENDENCIES` or "convert"
+    stage: str
+    # archive entry loaded by a job of the stage - None for the stage itself
+    file: str | None = None
+
+
+ProgressCallback = Callable[[ProgressEvent], Awaitable[None]]
+
+
+class StageRunner:
+    """Runner of the blocking jobs of a parse in an executor."""
+
+    def __init__(
+        self,
+        executor: Executor,
+        progress: ProgressCallback | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        """
+        Initialize a StageRunner.
+
+        `progress` is awaited on the event loop with the start and end of every
+        stage and every file loaded by a job of its own.
+        """
+        self.executor = executor
+        self.progress = progress
+        self.instrumentation = instrumentation
+        self._jobs: set[Future[Any]] = set()
+
+    @asynccontextmanager
+    async def stage(self, name: str) -> AsyncIterator[None]:
+        """Measure and report a stage - jobs run within it are nested in it."""
+        await self._report("start", name)
+        token = _REPORTED_STAGE.set(name)
+        try:
+            with measure(self.instrumentation, name):
+                yield
+        finally:
+            _REPORTED_STAGE.reset(token)
+        await self._report("end", name)
+
+    async def run(
+        self, func: Callable[..., _T], *args: Any, file: str | None = None
+    ) -> _T:
+        """
+        Run a job in the executor and return its result.
+
+        A job loading a `file` is reported as a file of the running stage and
+        measured as a stage nested in it.
+        """
+        stage = _REPORTED_STAGE.get()
+        if file is not None:
+            await self._report("start", stage, file)
+            args = (func, file, *args)
+            func = _run_nested
+        future = self.executor.submit(contextvars.copy_context().run, func, *args)
+        self._jobs.add(future)
+        try:
+            result: _T = await asyncio.wrap_future(future)
+        finally:
+            # a cancelled job keeps running if it started already
+            if future.done():
+                self._jobs.discard(future)
+        if file is not None:
+            await self._report("end", stage, file)
+        return result
+
+    async def gather(self, *awaitables: Awaitable[_T]) -> list[_T]:
+        """Await jobs or stages concurrently - the others are cancelled if one fails."""
+        tasks = [asyncio.ensure_future(awaitable) for awaitable in awaitables]
+        try:
+            return await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def wait_for_jobs(self) -> None:
+        """Wait for all running jobs - the ones not started yet are cancelled."""
+        while jobs := [job for job in self._jobs if not job.cancel()]:
+            await asyncio.wait([asyncio.wrap_future(job) for job in jobs])
+            self._jobs.difference_update(jobs)
+
+    async def _report(
+        self, event: StageEvent, stage: str, file: str | None = None
+    ) -> None:
+        """Report a ProgressEvent if a callback is set."""
+        if self.progress is not None:
+            await self.progress(ProgressEvent(event, stage, file))
+
+
+def _run_nested(func: Callable[..., _T], file: str, *args: Any) -> _T:
+    """Run a job in a stage named after its file - nested in the running stage."""
+    with nested_stage(file):
+        return func(*args)
@@ -1,7 +1,8 @@
 """XML utilities."""
 from __future__ import annotations
 
-from typing import overload
+import hashlib
+from typing import Any, NoReturn, overload
 
 from xknxproject.const import MAIN_AND_SUB_DPT, MAIN_DPT
 
@@ -20,6 +21,16 @@ def parse_dpt_types(dpt_types: list[str]) -> dict[str, int]:
     return {}
 
 
+def fingerprint(value: Any) -> str:
+    """
+    Return a hex digest of a value of JSON types - dicts, lists, strings, numbers.
+
+    Equal values with the same key order have equal fingerprints - also after
+    a round trip through JSON. `repr` is faster than `json.dumps` here.
+    """
+    return hashlib.blake2b(repr(value).encode(), digest_size=16).hexdigest()
+
+
 @overload
 def parse_xml_flag(flag: str | None, default: bool) -> bool:
     ...
@@ -35,3 +46,60 @@ def parse_xml_flag(flag: str | None, default: bool | None = None) -> bool | None
     if flag is None:
         return default
     return flag == "Enabled"
+
+
+class FrozenDict(dict[str, int]):
+    """A dict that can't be modified - safe to share between parsed objects."""
+
+    def _immutable(self, *args: Any, **kwargs: Any) -> NoReturn:
+        """Raise for any modification."""
+        raise TypeError(f"'{self.__class__.__name__}' object is immutable")
+
+    __setitem__ = __delitem__ = _immutable
+    clear = pop = popitem = setdefault = update = __ior__ = _immutable
+
+    def __reduce__(self) -> tuple[type[FrozenDict], tuple[dict[str, int]]]:
+        """Pickle as a plain dict - unpickling can't set items one by one."""
+        return self.__class__, (dict(self),)
+
+
+class Interner:
+    """
+    Deduplicate values repeated across the elements of a single parse.
+
+    Strings are shared by value and DPT attributes are parsed once per distinct
+    value into a shared `FrozenDict`. The tables are released with the Interner.
+    """
+
+    __slots__ = ("_strings", "_dpt_types")
+
+    def __init__(self) -> None:
+        """Initialize the Interner."""
+        self._strings: dict[str, str] = {}
+        self._dpt_types: dict[str, FrozenDict] = {}
+
+    @overload
+    def __call__(self, value: str) -> str:
+        ...
+
+    @overload
+    def __call__(self, value: None) -> None:
+        ...
+
+    @overload
+    def __call__(self, value: str | None) -> str | None:
+        ...
+
+    def __call__(self, value: str | None) -> str | None:
+        """Return the shared instance of a string."""
+        if value is None:
+            return None
+        return self._strings.setdefault(value, value)
+
+    def dpt_types(self, dpt_types: str) -> FrozenDict:
+        """Return the shared result of `parse_dpt_types` for a DatapointType attribute."""
+        if (dpt := self._dpt_types.get(dpt_types)) is None:
+            dpt = self._dpt_types[dpt_types] = FrozenDict(
+                parse_dpt_types(dpt_types.split(" "))
+            )
+        return dpt
@@ -1,13 +1,35 @@
 """ETS Project Parser is a library to parse ETS project files."""
 from __future__ import annotations
 
+from collections.abc import Iterable, Mapping
+from concurrent.futures import Executor, ThreadPoolExecutor
+from contextlib import ExitStack
+from functools import partial
 import logging
+import os
 from pathlib import Path
+from typing import Any, cast
+from zipfile import ZipFile
 
 from xknxproject import __version__
+from xknxproject.cache import ApplicationProgramCache, ProjectCache
+from xknxproject.instrumentation import Instrumentation, measure
 from xknxproject.models import KNXProject
-from xknxproject.xml import XMLParser
-from xknxproject.zip.extractor import extract
+from xknxproject.stage_runner import ProgressCallback, StageRunner
+from xknxproject.xml import (
+    IncrementalXMLParser,
+    LazyKNXProject,
+    ParseManifest,
+    XMLParser,
+)
+from xknxproject.xml.incremental import archive_entries, matches_manifest
+from xknxproject.xml.parser import validate_sections
+from xknxproject.zip import (
+    ExtractionStrategy,
+    check_password,
+    derive_zip_password,
+    extract,
+)
 
 logger = logging.getLogger("xknxproject.log")
 
@@ -19,14 +41,248 @@ class XKNXProj:
         self,
         archive_name: str | Path,
         archive_password: str | None = None,
+        *,
+        application_program_cache: ApplicationProgramCache | None = None,
+        project_cache: ProjectCache | None = None,
+        zip_password: bytes | None = None,
+        extraction_strategy: ExtractionStrategy = ExtractionStrategy.AUTO,
+        instrumentation: Instrumentation | None = None,
     ):
-        """Initialize a KNXProjParser."""
+        """
+        Initialize a KNXProjParser.
+
+        `zip_password` may be given instead of `archive_password` to skip the key
+        derivation - see `xknxproject.zip.derive_zip_password`. The stages of
+        every parse are measured by `instrumentation` if given.
+        """
         self.archive_path = Path(archive_name)
         self.password = archive_password
+        self.zip_password = zip_password
+        self.extraction_strategy = extraction_strategy
+        self.application_program_cache = application_program_cache
+        self.project_cache = project_cache
+        self.instrumentation = instrumentation
 
         self.version = __version__
 
-    def parse(self) -> KNXProject:
-        """Parse the KNX project."""
-        with extract(self.archive_path, self.password) as knx_project_content:
-            return XMLParser(knx_project_content).parse()
+    def parse(
+        self, workers: int | None = None, include: Iterable[str] | None = None
+    ) -> KNXProject:
+        """
+        Parse the KNX project.
+
+        Application programs are parsed in a pool of `workers` processes if
+        given. This pays off for projects using many application programs.
+        If `include` is given, only these KNXProject sections are returned and
+        loader stages and XML files they don't depend on are skipped - see
+        `xknxproject.xml.SECTION_DEPENDENCIES`.
+        If a `project_cache` is set, an unchanged project is loaded from it.
+        Only complete projects are stored in it.
+        """
+        # validated before the cache lookup - a cached project has all sections
+        sections = None if include is None else set(validate_sections(include))
+        if self.project_cache is not None:
+            cache_key = self.project_cache.key(
+                self.archive_path, self.password, self.zip_password
+            )
+            if (project := self.project_cache.get(cache_key)) is not None:
+                return _select_sections(project, sections)
+
+        with ExitStack() as stack:
+            with measure(self.instrumentation, "extract"):
+                knx_project_content = stack.enter_context(
+                    extract(
+                        self.archive_path,
+                        self.password,
+                        self.zip_password,
+                        self.extraction_strategy,
+                    )
+                )
+            project = XMLParser(
+                knx_project_content,
+                workers=workers,
+                application_program_cache=self.application_program_cache,
+                instrumentation=self.instrumentation,
+            ).parse(sections)
+
+        if self.project_cache is not None and sections is None:
+            self.project_cache.set(cache_key, project)
+        return project
+
+    async def parse_async(
+        self,
+        workers: int | None = None,
+        include: Iterable[str] | None = None,
+        *,
+        executor: Executor | None = None,
+        progress: ProgressCallback | None = None,
+    ) -> KNXProject:
+        """
+        Parse the KNX project without blocking the event loop.
+
+        Arguments and result are those of `parse`. Key derivation, inflation,
+        every load stage and the conversion run as jobs in `executor` - a
+        thread pool created for the parse if not given. Independent stages run
+        concurrently: master data, the Hardware.xml files and - without
+        `workers` - the application program files. The parse can be cancelled
+        between jobs. `progress` is awaited with the start and end of every
+        stage and file as `xknxproject.stage_runner.ProgressEvent`.
+        """
+        # validated before the cache lookup - a cached project has all sections
+        sections = None if include is None else set(validate_sections(include))
+        owned_executor = None
+        if executor is None:
+            # the jobs hold the GIL most of the time - more threads than CPUs
+            # only add contention
+            executor = owned_executor = ThreadPoolExecutor(
+                max_workers=os.cpu_count(), thread_name_prefix="xknxproject"
+            )
+        runner = StageRunner(executor, progress, self.instrumentation)
+        try:
+            return await self._parse_async(runner, workers, sections)
+        finally:
+            if owned_executor is not None:
+                # running jobs are done already - don't block the event loop
+                owned_executor.shutdown(wait=False)
+
+    async def _parse_async(
+        self, runner: StageRunner, workers: int | None, sections: set[str] | None
+    ) -> KNXProject:
+        """Parse the KNX project with the jobs run by `runner`."""
+        if self.project_cache is not None:
+            cache_key = await runner.run(
+                self.project_cache.key,
+                self.archive_path,
+                self.password,
+                self.zip_password,
+            )
+            if (
+                project := await runner.run(self.project_cache.get, cache_key)
+            ) is not None:
+                return _select_sections(project, sections)
+
+        stack = ExitStack()
+        try:
+            async with runner.stage("extract"):
+                zip_password = self.zip_password
+                if zip_password is None and self.password:
+                    # a job of its own to allow cancelling before inflation
+                    zip_password = await runner.run(
+                        derive_zip_password, self.archive_path, self.password
+                    )
+                knx_project_content = await runner.run(
+                    stack.enter_context,
+                    extract(
+                        self.archive_path,
+                        self.password,
+                        zip_password,
+                        self.extraction_strategy,
+                    ),
+                )
+            project = await XMLParser(
+                knx_project_content,
+                workers=workers,
+                application_program_cache=self.application_program_cache,
+                instrumentation=self.instrumentation,
+            ).parse_async(runner, sections)
+        finally:
+            # a cancelled job may still read the archive
+            await runner.wait_for_jobs()
+            await runner.run(stack.close)
+
+        if self.project_cache is not None and sections is None:
+            await runner.run(self.project_cache.set, cache_key, project)
+        return project
+
+    def parse_incremental(
+        self,
+        previous: KNXProject | None = None,
+        manifest: ParseManifest | None = None,
+        workers: int | None = None,
+    ) -> tuple[KNXProject, ParseManifest]:
+        """
+        Parse the KNX project reusing a previous result - return it and its manifest.
+
+        `previous` and `manifest` are a result of this method for an earlier
+        version of the archive. 0.xml is parsed again if it changed. Master data,
+        hardware and application programs are only read if changed or newly
+        referenced and communication objects of unchanged devices are carried
+        over. The result is equal to a full parse. Without `previous` or if it
+        doesn't match its manifest the project is parsed completely. An
+        unchanged archive is returned without parsing once its password is
+        checked. The `project_cache` is not used.
+        """
+        if previous is not None and manifest is not None:
+            with ZipFile(self.archive_path, mode="r") as root:
+                # the protected project archive is an entry of the root archive
+                entries = archive_entries(root)
+            if entries == manifest["entries"] and matches_manifest(previous, manifest):
+                # a wrong password has to fail like it does for a parse
+                check_password(self.archive_path, self.password, self.zip_password)
+                return previous, manifest
+
+        with ExitStack() as stack:
+            with measure(self.instrumentation, "extract"):
+                knx_project_content = stack.enter_context(
+                    extract(
+                        self.archive_path,
+                        self.password,
+                        self.zip_password,
+                        self.extraction_strategy,
+                    )
+                )
+            return IncrementalXMLParser(
+                knx_project_content,
+                previous,
+                manifest,
+                workers=workers,
+                application_program_cache=self.application_program_cache,
+                instrumentation=self.instrumentation,
+            ).parse_incremental()
+
+    def parse_lazy(self, workers: int | None = None) -> Mapping[str, Any]:
+        """
+        Return the KNX project as a mapping parsing each section on first access.
+
+        Consumers needing only some sections - e.g. `group_addresses` - skip
+        loading the rest. An unchanged project found in the `project_cache` is
+        returned completely. Partially parsed projects are not stored in it.
+        """
+        if self.project_cache is not None and (
+            project := self.project_cache.get(
+                self.project_cache.key(
+                    self.archive_path, self.password, self.zip_password
+                )
+            )
+        ):
+            return project
+
+        return LazyKNXProject(
+            partial(
+                extract,
+                self.archive_path,
+                self.password,
+                self.zip_password,
+                self.extraction_strategy,
+            ),
+            partial(
+                XMLParser,
+                workers=workers,
+                application_program_cache=self.application_program_cache,
+                instrumentation=self.instrumentation,
+            ),
+        )
+
+
+def _select_sections(project: KNXProject, sections: set[str] | None) -> KNXProject:
+    """Return the given sections of a project - all if `sections` is None."""
+    if sections is None:
+        return project
+    return cast(
+        KNXProject,
+        {
+            key: value
+            for key, value in project.items()
+            if key == "version" or key in sections
+        },
+    )
@@ -1,4 +1,13 @@
 """XML Parsing functionality."""
-from .parser import XMLParser
+from .incremental import IncrementalXMLParser, ParseManifest
+from .lazy_project import LazyKNXProject
+from .parser import SECTION_DEPENDENCIES, STAGE_DEPENDENCIES, XMLParser
 
-__all__ = ["XMLParser"]
+__all__ = [
+    "IncrementalXMLParser",
+    "LazyKNXProject",
+    "ParseManifest",
+    "SECTION_DEPENDENCIES",
+    "STAGE_DEPENDENCIES",
+    "XMLParser",
+]
@@ -0,0 +1,342 @@
+"""
+Incremental parsing of a modified KNXProj file.
+
+A `ParseManifest` records what a parse read - the CRC-32 of every ZIP entry,
+the hardware and master data it resolved, a fingerprint of the inputs of every
+device's communication objects and of every section of the result. Given the
+previous result and its manifest, `IncrementalXMLParser` parses 0.xml again
+but only reads knx_master.xml, Hardware.xml and application program files
+for what changed or is newly referenced. Communication objects of unchanged
+devices are carried over from the previous result.
+"""
+from __future__ import annotations
+
+from typing import Any, ClassVar, Final, TypedDict
+from zipfile import ZipFile
+import zlib
+
+from xknxproject.__version__ import __version__
+from xknxproject.loader import HardwareLoader
+from xknxproject.models import (
+    CommunicationObject,
+    ComObjectInstanceRef,
+    DeviceInstance,
+    Hardware,
+    KNXMasterData,
+    KNXProject,
+)
+from xknxproject.util import fingerprint
+from xknxproject.xml.parser import SECTION_DEPENDENCIES, XMLParser
+from xknxproject.zip.extractor import KNXProjContents
+
+KNX_MASTER_ENTRY: Final = "knx_master.xml"
+_CRC_CHUNK_SIZE: Final = 1024 * 1024
+
+
+class ManifestMasterData(TypedDict):
+    """Parts of knx_master.xml used by a parse."""
+
+    manufacturer_names: dict[str, str]
+
+
+class ParseManifest(TypedDict):
+    """
+    Record of a parse to re-parse a modified archive incrementally.
+
+    Only plain JSON types are used so the manifest can be stored next to the
+    result in any format of `xknxproject.serialization` or as JSON.
+    """
+
+    version: str
+    # {root archive entry name: CRC-32}
+    entries: dict[str, int]
+    # CRC-32 of 0.xml - from the protected archive if password protected
+    project_0: int
+    # {KNXProject section: fingerprint}
+    sections: dict[str, str]
+    master_data: ManifestMasterData
+    # {hardware ref of a device: [name, product name, {program ref: application
+    # program ref}] - None if not found}
+    hardware: dict[str, list[Any] | None]
+    # {device identifier: fingerprint of the inputs of its communication objects}
+    devices: dict[str, str]
+    # {communication object id: identifier of the device it was converted from}
+    communication_objects: dict[str, str]
+
+
+def archive_entries(root: ZipFile) -> dict[str, int]:
+    """Return the CRC-32 of every entry of a ZIP archive."""
+    return {info.filename: info.CRC for info in root.infolist()}
+
+
+def _project_0_crc(knx_proj_contents: KNXProjContents) -> int:
+    """Return the CRC-32 of 0.xml."""
+    info = knx_proj_contents.project_0_info()
+    if info.CRC or not info.file_size:
+        return info.CRC
+    # WinZip AE-2 encrypted entries store 0 instead of the CRC-32
+    crc = 0
+    with knx_proj_contents.open_project_0() as project_0:
+        while chunk := project_0.read(_CRC_CHUNK_SIZE):
+            crc = zlib.crc32(chunk, crc)
+    return crc
+
+
+def matches_manifest(previous: KNXProject, manifest: ParseManifest) -> bool:
+    """Check if a previous result is the one recorded by a manifest of this version."""
+    return manifest["version"] == __version__ and all(
+        section in previous
+        and fingerprint(previous[section]) == digest  # type: ignore[literal-required]
+        for section, digest in manifest["sections"].items()
+    )
+
+
+class IncrementalXMLParser(XMLParser):
+    """
+    XMLParser reusing a previous result and its ParseManifest.
+
+    The previous result is only used if it matches the section fingerprints of
+    its manifest. Without one every file is read like by XMLParser and
+    `manifest()` records a full parse. Only complete projects can be parsed
+    incrementally.
+    """
+
+    # the stage loaders are overridden - each stage runs in a single job
+    _ASYNC_STAGE_LOADERS: ClassVar[dict[str, str]] = {}
+
+    def __init__(
+        self,
+        knx_proj_contents: KNXProjContents,
+        previous: KNXProject | None = None,
+        previous_manifest: ParseManifest | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize an IncrementalXMLParser - `kwargs` are passed to XMLParser."""
+        super().__init__(knx_proj_contents, **kwargs)
+        self.entries = archive_entries(knx_proj_contents.root)
+        self.project_0_crc = _project_0_crc(knx_proj_contents)
+        self.previous: KNXProject | None = None
+        self.previous_manifest: ParseManifest | None = None
+        if (
+            previous is not None
+            and previous_manifest is not None
+            and previous_manifest["version"] == __version__
+            # only communication objects are carried over from the result
+            and fingerprint(previous["communication_objects"])
+            == previous_manifest["sections"].get("communication_objects")
+        ):
+            self.previous = previous
+            self.previous_manifest = previous_manifest
+        # {device identifier: fingerprint of the inputs of its communication objects}
+        self.device_fingerprints: dict[str, str] = {}
+        # {communication object id: (device, ComObjectInstanceRef)} - the last
+        # device wins like in a full parse
+        self.com_object_sources: dict[
+            str, tuple[DeviceInstance, ComObjectInstanceRef]
+        ] = {}
+        # {communication object id: CommunicationObject} taken from `previous`
+        self.carried_com_objects: dict[str, CommunicationObject] = {}
+
+    def parse_incremental(self) -> tuple[KNXProject, ParseManifest]:
+        """
+        Parse all sections - return the project and its manifest.
+
+        The previous result is returned if neither 0.xml nor any file outside of
+        the project directory changed - e.g. if only project.xml was rewritten.
+        """
+        if (
+            self.previous is not None
+            and self.previous_manifest is not None
+            and self._is_project_unchanged()
+            and matches_manifest(self.previous, self.previous_manifest)
+        ):
+            manifest = self.previous_manifest.copy()
+            manifest["entries"] = self.entries
+            return self.previous, manifest
+        project = self.parse()
+        return project, self.manifest(project)
+
+    def manifest(self, project: KNXProject) -> ParseManifest:
+        """Return the manifest of a complete project parsed by this parser."""
+        hardware_by_id = {hardware.identifier: hardware for hardware in self.hardware}
+        hardware: dict[str, list[Any] | None] = {}
+        for device in self.devices:
+            if (entry := hardware_by_id.get(device.hardware_ref)) is None:
+                hardware[device.hardware_ref] = None
+            else:
+                hardware[device.hardware_ref] = [
+                    entry.name,
+                    entry.product_name,
+                    entry.application_program_refs,
+                ]
+        return ParseManifest(
+            version=__version__,
+            entries=self.entries,
+            project_0=self.project_0_crc,
+            sections={
+                section: fingerprint(project[section])  # type: ignore[literal-required]
+                for section in SECTION_DEPENDENCIES
+            },
+            master_data=ManifestMasterData(
+                manufacturer_names=self.master_data.manufacturer_names,
+            ),
+            hardware=hardware,
+            devices=self.device_fingerprints,
+            communication_objects={
+                com_object_id: device.identifier
+                for com_object_id, (device, _) in self.com_object_sources.items()
+            },
+        )
+
+    def _is_project_unchanged(self) -> bool:
+        """Check if all files read by the parser are unchanged since the previous parse."""
+        if self.previous_manifest is None:
+            return False
+        if self.project_0_crc != self.previous_manifest["project_0"]:
+            return False
+        # only 0.xml is read from the project directory or protected archive P-*
+        return {
+            name: crc for name, crc in self.entries.items() if not name.startswith("P-")
+        } == {
+            name: crc
+            for name, crc in self.previous_manifest["entries"].items()
+            if not name.startswith("P-")
+        }
+
+    def _is_entry_unchanged(self, name: str) -> bool:
+        """Check if a root archive entry is unchanged since the previous parse."""
+        if self.previous_manifest is None:
+            return False
+        return self.entries.get(name) == self.previous_manifest["entries"].get(name)
+
+    def _load_master_data(self) -> None:
+        """Load knx_master.xml unless all manufacturers are known from the manifest."""
+        manufacturers = {device.manufacturer for device in self.devices}
+        if self.previous_manifest is None or not self._is_entry_unchanged(
+            KNX_MASTER_ENTRY
+        ):
+            super()._load_master_data()
+            return
+        previous_master_data = self.previous_manifest["master_data"]
+        manufacturer_names = previous_master_data["manufacturer_names"]
+        if not manufacturers.issubset(manufacturer_names):
+            super()._load_master_data()
+            return
+
+        for device in self.devices:
+            device.manufacturer_name = manufacturer_names[device.manufacturer]
+        self.master_data = KNXMasterData(
+            manufacturer_names={
+                manufacturer: manufacturer_names[manufacturer]
+                for manufacturer in manufacturers
+            }
+        )
+
+    def _load_hardware(self) -> None:
+        """Load Hardware.xml files changed or with hardware refs new to the manifest."""
+        previous_hardware = (
+            {} if self.previous_manifest is None else self.previous_manifest["hardware"]
+        )
+        hardware_refs = self._hardware_refs_by_manufacturer()
+        for hardware_file in HardwareLoader.get_hardware_files(self.knx_proj_contents):
+            if not (
+                manufacturer_refs := hardware_refs.get(
+                    hardware_file.at.partition("/")[0]
+                )
+            ):
+                continue
+            if self._is_entry_unchanged(
+                hardware_file.at
+            ) and manufacturer_refs.issubset(previous_hardware):
+                self.hardware.extend(
+                    Hardware(hardware_ref, *entry)
+                    for hardware_ref in manufacturer_refs
+                    if (entry := previous_hardware[hardware_ref]) is not None
+                )
+            else:
+                self.hardware.extend(
+                    HardwareLoader.load(hardware_file, manufacturer_refs)
+                )
+
+        self._join_hardware()
+        self._resolve_com_object_ref_ids()
+        self._index_group_address_links()
+
+    def _load_application_programs(self) -> None:
+        """Load the application programs of devices whose communication objects can't be carried over."""
+        for device in self.devices:
+            self.device_fingerprints[device.identifier] = self._fingerprint_device(
+                device
+            )
+            for com_object in device.com_object_instance_refs:
+                if com_object.links:
+                    self.com_object_sources[com_object.ref_id] = (device, com_object)
+
+        stale_devices: set[str] = set()
+        if self.previous is None or self.previous_manifest is None:
+            stale_devices.update(self.device_fingerprints)
+        else:
+            previous_com_objects = self.previous["communication_objects"]
+            previous_sources = self.previous_manifest["communication_objects"]
+            previous_devices = self.previous_manifest["devices"]
+            for com_object_id, (device, _) in self.com_object_sources.items():
+                # a communication object only depends on the device it was
+                # converted from - the previous value belongs to the same device
+                if (
+                    previous_sources.get(com_object_id) == device.identifier
+                    and previous_devices.get(device.identifier)
+                    == self.device_fingerprints[device.identifier]
+                    and (previous_com_object := previous_com_objects.get(com_object_id))
+                    is not None
+                ):
+                    self.carried_com_objects[com_object_id] = previous_com_object
+                else:
+                    stale_devices.add(device.identifier)
+
+        self._merge_application_programs(
+            [device for device in self.devices if device.identifier in stale_devices]
+        )
+
+    def _fingerprint_device(self, device: DeviceInstance) -> str:
+        """Return a fingerprint of the inputs of the communication objects of a device."""
+        application_program_crc = (
+            None
+            if device.application_program_ref is None
+            else self.entries.get(device.application_program_xml())
+        )
+        return fingerprint(
+            [
+                device.individual_address,
+                device.application_program_ref,
+                application_program_crc,
+                [
+                    [
+                        com_object.ref_id,
+                        com_object.text,
+                        com_object.read_flag,
+                        com_object.write_flag,
+                        com_object.communication_flag,
+                        com_object.transmit_flag,
+                        com_object.update_flag,
+                        com_object.read_on_init_flag,
+                        com_object.datapoint_type,
+                        com_object.links,
+                    ]
+                    for com_object in device.com_object_instance_refs
+                    if com_object.links
+                ],
+            ]
+        )
+
+    def _convert_communication_objects(self) -> dict[str, CommunicationObject]:
+        """Convert the linked ComObjectInstanceRefs not carried over."""
+        communication_objects: dict[str, CommunicationObject] = {}
+        for com_object_id, (device, com_object) in self.com_object_sources.items():
+            if (
+                communication_object := self.carried_com_objects.get(com_object_id)
+            ) is None:
+                communication_object = self._convert_communication_object(
+                    device, com_object
+                )
+            communication_objects[com_object_id] = communication_object
+        return communication_objects
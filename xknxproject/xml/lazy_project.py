@@ -0,0 +1,80 @@
+"""KNXProject mapping parsing its sections on first access."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import AbstractContextManager
+from typing import Any
+
+from xknxproject.__version__ import __version__
+from xknxproject.models import KNXProject
+from xknxproject.xml.parser import SECTION_DEPENDENCIES, XMLParser
+from xknxproject.zip import KNXProjContents
+
+
+class LazyKNXProject(Mapping[str, Any]):
+    """
+    A KNXProject whose sections are parsed and converted on first access.
+
+    Only the load stages a section depends on are run - see
+    `SECTION_DEPENDENCIES`. The archive is opened for each access of a section
+    not converted yet.
+    """
+
+    def __init__(
+        self,
+        open_contents: Callable[[], AbstractContextManager[KNXProjContents]],
+        create_parser: Callable[[KNXProjContents], XMLParser] = XMLParser,
+    ) -> None:
+        """Initialize a LazyKNXProject."""
+        self._open_contents = open_contents
+        self._create_parser = create_parser
+        self._parser: XMLParser | None = None
+        self._sections: dict[str, Any] = {"version": __version__}
+
+    def __getitem__(self, key: str) -> Any:
+        """Return a section - converting it if it wasn't accessed before."""
+        if key not in self._sections:
+            if key not in SECTION_DEPENDENCIES:
+                raise KeyError(key)
+            with self._open_contents() as knx_proj_contents:
+                self._sections[key] = self._get_parser(knx_proj_contents).convert(key)
+        return self._sections[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys of a KNXProject."""
+        yield "version"
+        yield from SECTION_DEPENDENCIES
+
+    def __len__(self) -> int:
+        """Return the number of keys of a KNXProject."""
+        return len(SECTION_DEPENDENCIES) + 1
+
+    def __repr__(self) -> str:
+        """Return string representation."""
+        return f"<{self.__class__.__name__} converted={list(self._sections)}>"
+
+    def to_dict(self) -> KNXProject:
+        """Convert all remaining sections opening the archive once."""
+        if missing := [
+            key for key in SECTION_DEPENDENCIES if key not in self._sections
+        ]:
+            with self._open_contents() as knx_proj_contents:
+                parser = self._get_parser(knx_proj_contents)
+                for key in missing:
+                    self._sections[key] = parser.convert(key)
+        return KNXProject(
+            version=self._sections["version"],
+            communication_objects=self._sections["communication_objects"],
+            topology=self._sections["topology"],
+            devices=self._sections["devices"],
+            group_addresses=self._sections["group_addresses"],
+            locations=self._sections["locations"],
+        )
+
+    def _get_parser(self, knx_proj_contents: KNXProjContents) -> XMLParser:
+        """Return the parser - its loaded models are kept between accesses."""
+        if self._parser is None:
+            self._parser = self._create_parser(knx_proj_contents)
+        else:
+            self._parser.knx_proj_contents = knx_proj_contents
+        return self._parser
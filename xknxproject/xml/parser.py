@@ -1,79 +1,215 @@
 """Parser logic for ETS XML files."""
 from __future__ import annotations
 
+import asyncio
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+import logging
+from typing import Any, ClassVar, Final, cast
+from zipfile import Path
+
 from xknxproject.__version__ import __version__
+from xknxproject.cache import ApplicationProgramCache
+from xknxproject.instrumentation import Instrumentation, measure
 from xknxproject.loader import (
     ApplicationProgramLoader,
     HardwareLoader,
     ManufacturerLoader,
     ProjectLoader,
 )
+from xknxproject.loader.application_program_loader import (
+    ApplicationProgramTables,
+    load_application_program_tables_in_worker,
+)
 from xknxproject.models import (
     MEDIUM_TYPES,
     Area,
     CommunicationObject,
+    ComObjectInstanceRef,
     Device,
     DeviceInstance,
     Flags,
     GroupAddress,
     Hardware,
+    KNXMasterData,
     KNXProject,
     Line,
     Space,
     XMLArea,
     XMLGroupAddress,
     XMLSpace,
+    resolve_com_object_ref_id,
 )
+from xknxproject.stage_runner import StageRunner
+from xknxproject.util import Interner
 from xknxproject.zip.extractor import KNXProjContents
 
+logger = logging.getLogger("xknxproject.log")
+
+# {load stage: load stages it depends on}
+STAGE_DEPENDENCIES: Final[dict[str, tuple[str, ...]]] = {
+    "project": (),  # 0.xml
+    "master_data": ("project",),  # knx_master.xml
+    "hardware": ("project",),  # M-*/Hardware.xml
+    "application_programs": ("hardware",),  # M-*/M-*_A-*.xml
+}
+# {KNXProject section: load stages needed to convert it} - in KNXProject order
+# communication object ids are prefixed by the application program ref which
+# is resolved from the hardware - the application programs themselves are only
+# needed for the names, flags and DPTs of communication objects
+SECTION_DEPENDENCIES: Final[dict[str, tuple[str, ...]]] = {
+    "communication_objects": ("application_programs",),
+    "topology": ("master_data",),
+    "devices": ("master_data", "hardware"),
+    "group_addresses": ("hardware",),
+    "locations": ("project",),
+}
+
+
+def validate_sections(include: Iterable[str] | None) -> list[str]:
+    """Return the sections to parse - raise ValueError for unknown sections."""
+    sections = list(SECTION_DEPENDENCIES if include is None else include)
+    if unknown := set(sections).difference(SECTION_DEPENDENCIES):
+        raise ValueError(
+            f"Unknown sections {sorted(unknown)} - valid sections are {list(SECTION_DEPENDENCIES)}"
+        )
+    return sections
+
 
 class XMLParser:
     """Class that parses XMLs and returns useful information."""
 
-    def __init__(self, knx_proj_contents: KNXProjContents) -> None:
-        """Initialize the parser."""
+    def __init__(
+        self,
+        knx_proj_contents: KNXProjContents,
+        workers: int | None = None,
+        application_program_cache: ApplicationProgramCache | None = None,
+        instrumentation: Instrumentation | None = None,
+    ) -> None:
+        """
+        Initialize the parser.
+
+        If `workers` is greater than 1, application programs are parsed in a
+        process pool of this size. Parsed application programs are stored in and
+        read from `application_program_cache` if given. Every load stage and
+        section conversion is measured by `instrumentation` if given.
+        """
         self.knx_proj_contents = knx_proj_contents
+        self.workers = workers
+        self.application_program_cache = application_program_cache
+        self.instrumentation = instrumentation
+        # shares repeated strings and DPTs between all models of this parse
+        self.interner = Interner()
         self.spaces: list[XMLSpace] = []
         self.group_addresses: list[XMLGroupAddress] = []
         self.hardware: list[Hardware] = []
         self.areas: list[XMLArea] = []
         self.devices: list[DeviceInstance] = []
+        self.master_data = KNXMasterData(manufacturer_names={})
+        # names of the load stages already run - each stage runs only once
+        self.loaded_stages: set[str] = set()
+        # {GroupAddress.identifier: [CommunicationObject ids]} - built by the hardware stage
+        self.group_address_links: dict[str, list[str]] = {}
+        # {ref: number of devices} of references not found in the hardware catalogs
+        self.unmatched_hardware_refs: dict[str, int] = {}
+        self.unmatched_hardware_program_refs: dict[str, int] = {}
+
+    def parse(self, include: Iterable[str] | None = None) -> KNXProject:
+        """
+        Parse ETS files.
+
+        If `include` is given, only these sections of `SECTION_DEPENDENCIES` are
+        returned and only the load stages they depend on are run.
+        """
+        sections = validate_sections(include)
+        self.load(
+            stage for section in sections for stage in SECTION_DEPENDENCIES[section]
+        )
+        return self._convert_sections(sections)
+
+    async def parse_async(
+        self, runner: StageRunner, include: Iterable[str] | None = None
+    ) -> KNXProject:
+        """
+        Parse ETS files from an event loop - blocking work runs in `runner`.
+
+        Like `parse` but the load stages run via `load_async` and the sections
+        are converted in a single job.
+        """
+        sections = validate_sections(include)
+        await self.load_async(
+            runner,
+            (stage for section in sections for stage in SECTION_DEPENDENCIES[section]),
+        )
+        async with runner.stage("convert"):
+            return await runner.run(self._convert_sections, sections)
+
+    def _convert_sections(self, sections: list[str]) -> KNXProject:
+        """Convert the given sections to a KNXProject."""
+        project: dict[str, Any] = {"version": __version__}
+        # keep the key order of a full KNXProject
+        for section in SECTION_DEPENDENCIES:
+            if section in sections:
+                project[section] = self.convert(section)
+        return cast(KNXProject, project)
 
-    def parse(self) -> KNXProject:
-        """Parse ETS files."""
-        self.load()
+    def convert(self, section: str) -> Any:
+        """Convert a section of the KNXProject - running the load stages it needs."""
+        self.load(SECTION_DEPENDENCIES[section])
+        with measure(self.instrumentation, f"convert_{section}"):
+            return getattr(self, self._SECTION_CONVERTERS[section])()
 
+    def _convert_communication_objects(self) -> dict[str, CommunicationObject]:
+        """Convert the linked ComObjectInstanceRefs of all devices."""
         communication_objects: dict[str, CommunicationObject] = {}
-        devices_dict: dict[str, Device] = {}
         for device in self.devices:
-            device_com_objects: list[str] = []
             for com_object in device.com_object_instance_refs:
                 if com_object.links:
-                    communication_objects[com_object.ref_id] = CommunicationObject(
-                        name=com_object.name or com_object.text,
-                        device_address=device.individual_address,
-                        dpt_type=com_object.datapoint_type,  # type: ignore[typeddict-item]
-                        flags=Flags(
-                            read=com_object.read_flag,  # type: ignore[typeddict-item]
-                            write=com_object.write_flag,  # type: ignore[typeddict-item]
-                            communication=com_object.communication_flag,  # type: ignore[typeddict-item]
-                            update=com_object.update_flag,  # type: ignore[typeddict-item]
-                            read_on_init=com_object.read_on_init_flag,  # type: ignore[typeddict-item]
-                            transmit=com_object.transmit_flag,  # type: ignore[typeddict-item]
-                        ),
-                        group_address_links=com_object.links,
-                    )
-                    device_com_objects.append(com_object.ref_id)
+                    communication_objects[
+                        com_object.ref_id
+                    ] = self._convert_communication_object(device, com_object)
+        return communication_objects
 
+    @staticmethod
+    def _convert_communication_object(
+        device: DeviceInstance, com_object: ComObjectInstanceRef
+    ) -> CommunicationObject:
+        """Convert a linked ComObjectInstanceRef of a device."""
+        return CommunicationObject(
+            name=com_object.name or com_object.text,
+            device_address=device.individual_address,
+            dpt_type=com_object.datapoint_type,  # type: ignore[typeddict-item]
+            flags=Flags(
+                read=com_object.read_flag,  # type: ignore[typeddict-item]
+                write=com_object.write_flag,  # type: ignore[typeddict-item]
+                communication=com_object.communication_flag,  # type: ignore[typeddict-item]
+                update=com_object.update_flag,  # type: ignore[typeddict-item]
+                read_on_init=com_object.read_on_init_flag,  # type: ignore[typeddict-item]
+                transmit=com_object.transmit_flag,  # type: ignore[typeddict-item]
+            ),
+            group_address_links=com_object.links,  # type: ignore[typeddict-item]
+        )
+
+    def _convert_devices(self) -> dict[str, Device]:
+        """Convert the devices."""
+        devices_dict: dict[str, Device] = {}
+        for device in self.devices:
             devices_dict[device.individual_address] = Device(
                 name=device.name or device.product_name,
                 product_name=device.product_name,
                 description=device.hardware_name,
                 individual_address=device.individual_address,
                 manufacturer_name=device.manufacturer_name,
-                communication_object_ids=device_com_objects,
+                communication_object_ids=[
+                    com_object.ref_id
+                    for com_object in device.com_object_instance_refs
+                    if com_object.links
+                ],
             )
+        return devices_dict
 
+    def _convert_topology(self) -> dict[str, Area]:
+        """Convert areas and lines."""
         topology_dict: dict[str, Area] = {}
         for area in self.areas:
             lines_dict: dict[str, Line] = {}
@@ -90,15 +226,12 @@ class XMLParser:
             topology_dict[str(area.address)] = Area(
                 name=area.name, description=area.description, lines=lines_dict
             )
+        return topology_dict
 
+    def _convert_group_addresses(self) -> dict[str, GroupAddress]:
+        """Convert the group addresses with the ids of their linked communication objects."""
         group_address_dict: dict[str, GroupAddress] = {}
-
         for group_address in self.group_addresses:
-            _com_object_ids = [
-                com_object_id
-                for com_object_id, com_object in communication_objects.items()
-                if group_address.identifier in com_object["group_address_links"]
-            ]
             group_address_dict[group_address.identifier] = GroupAddress(
                 main_name=group_address.main_name,
                 middle_name=group_address.middle_name,
@@ -107,22 +240,19 @@ class XMLParser:
                 raw_address=group_address.raw_address,
                 address=group_address.address,
                 dpt_type=group_address.dpt_type,
-                communication_object_ids=_com_object_ids,
+                communication_object_ids=self.group_address_links.get(
+                    group_address.identifier, []
+                ),
                 description=group_address.description,
             )
+        return group_address_dict
 
+    def _convert_locations(self) -> dict[str, Space]:
+        """Convert the spaces of the Locations section."""
         space_dict: dict[str, Space] = {}
         for space in self.spaces:
             space_dict[space.name] = self.recursive_convert_spaces(space)
-
-        return KNXProject(
-            version=__version__,
-            communication_objects=communication_objects,
-            topology=topology_dict,
-            devices=devices_dict,
-            group_addresses=group_address_dict,
-            locations=space_dict,
-        )
+        return space_dict
 
     def recursive_convert_spaces(self, space: XMLSpace) -> Space:
         """Convert spaces to the final output format."""
@@ -132,44 +262,352 @@ class XMLParser:
 
         return Space(type=space.type.value, devices=space.devices, spaces=subspaces)
 
-    def load(self) -> None:
-        """Load XML files."""
+    def load(self, stages: Iterable[str] | None = None) -> None:
+        """
+        Load XML files.
+
+        Only the given load stages of `STAGE_DEPENDENCIES` and the stages they
+        depend on are run if `stages` is given. Every stage runs only once.
+        """
+        for stage in STAGE_DEPENDENCIES if stages is None else stages:
+            if stage in self.loaded_stages:
+                continue
+            self.load(STAGE_DEPENDENCIES[stage])
+            with measure(self.instrumentation, stage):
+                getattr(self, self._STAGE_LOADERS[stage])()
+            self.loaded_stages.add(stage)
+
+    async def load_async(
+        self, runner: StageRunner, stages: Iterable[str] | None = None
+    ) -> None:
+        """
+        Load XML files from an event loop - blocking work runs in `runner`.
+
+        Like `load` but every stage runs in a task of its own as soon as the
+        stages it depends on are loaded - e.g. master data concurrently to
+        hardware and application programs. If a stage fails or the load is
+        cancelled, the other stages are cancelled.
+        """
+        tasks: dict[str, asyncio.Future[None]] = {}
+
+        def schedule(stage: str) -> asyncio.Future[None] | None:
+            if stage in self.loaded_stages:
+                return None
+            if (task := tasks.get(stage)) is None:
+                dependencies = [
+                    dependency_task
+                    for dependency in STAGE_DEPENDENCIES[stage]
+                    if (dependency_task := schedule(dependency)) is not None
+                ]
+                task = tasks[stage] = asyncio.ensure_future(
+                    self._load_stage_async(runner, stage, dependencies)
+                )
+            return task
+
+        for stage in STAGE_DEPENDENCIES if stages is None else stages:
+            schedule(stage)
+        await runner.gather(*tasks.values())
+
+    async def _load_stage_async(
+        self,
+        runner: StageRunner,
+        stage: str,
+        dependencies: list[asyncio.Future[None]],
+    ) -> None:
+        """Run a load stage once the stages it depends on are loaded."""
+        for dependency in dependencies:
+            await dependency
+        async with runner.stage(stage):
+            if (loader := self._ASYNC_STAGE_LOADERS.get(stage)) is not None:
+                await getattr(self, loader)(runner)
+            else:
+                await runner.run(getattr(self, self._STAGE_LOADERS[stage]))
+        self.loaded_stages.add(stage)
+
+    def _load_project(self) -> None:
+        """Load group addresses, topology, devices and locations from 0.xml."""
         (
             self.group_addresses,
             self.areas,
             self.devices,
             self.spaces,
-        ) = ProjectLoader.load(self.knx_proj_contents)
+        ) = ProjectLoader.load(self.knx_proj_contents, self.interner)
 
-        ManufacturerLoader.load(
+    def _load_master_data(self) -> None:
+        """Load manufacturer names, DPT names and medium types from knx_master.xml."""
+        self.master_data = ManufacturerLoader.load(
             self.knx_proj_contents.root_path / "knx_master.xml", self.devices
         )
 
-        for _hardware in [
-            HardwareLoader.load(hardware_file)
+    def _load_hardware(self) -> None:
+        """Load the hardware of all devices and resolve their application program refs."""
+        hardware_refs = self._hardware_refs_by_manufacturer()
+        for hardware_file in HardwareLoader.get_hardware_files(self.knx_proj_contents):
+            # M-*/Hardware.xml only holds hardware of its manufacturer
+            if manufacturer_refs := hardware_refs.get(
+                hardware_file.at.partition("/")[0]
+            ):
+                self.hardware.extend(
+                    HardwareLoader.load(hardware_file, manufacturer_refs)
+                )
+
+        self._join_hardware()
+        self._resolve_com_object_ref_ids()
+        self._index_group_address_links()
+
+    async def _load_hardware_async(self, runner: StageRunner) -> None:
+        """Load the Hardware.xml files of all manufacturers concurrently - one job per file."""
+        hardware_refs = self._hardware_refs_by_manufacturer()
+        hardware_files = [
+            (hardware_file, manufacturer_refs)
             for hardware_file in HardwareLoader.get_hardware_files(
                 self.knx_proj_contents
             )
-        ]:
-            self.hardware.extend(_hardware)
-
-        for hardware in self.hardware:
-            for device in self.devices:
-                if device.hardware_ref == hardware.identifier:
-                    device.product_name = hardware.name
-                    device.hardware_name = hardware.product_name
-
-                    if application_program_ref := hardware.application_program_refs.get(
-                        device.hardware_program_ref
-                    ):
-                        device.application_program_ref = application_program_ref
-                        for com_object in device.com_object_instance_refs:
-                            com_object.update_ref_id(application_program_ref)
+            if (
+                manufacturer_refs := hardware_refs.get(
+                    hardware_file.at.partition("/")[0]
+                )
+            )
+        ]
+        # extended in file order like by `_load_hardware`
+        for hardware in await runner.gather(
+            *(
+                runner.run(
+                    HardwareLoader.load,
+                    hardware_file,
+                    manufacturer_refs,
+                    file=hardware_file.at,
+                )
+                for hardware_file, manufacturer_refs in hardware_files
+            )
+        ):
+            self.hardware.extend(hardware)
+
+        await runner.run(self._join_hardware)
+        await runner.run(self._resolve_com_object_ref_ids)
+        await runner.run(self._index_group_address_links)
+
+    def _hardware_refs_by_manufacturer(self) -> dict[str, set[str]]:
+        """Return the hardware refs of all devices by manufacturer."""
+        hardware_refs: dict[str, set[str]] = {}
+        for device in self.devices:
+            hardware_refs.setdefault(device.manufacturer, set()).add(
+                device.hardware_ref
+            )
+        return hardware_refs
+
+    def _load_application_programs(self) -> None:
+        """Load the application programs of all devices from the cache or the archive."""
+        self._merge_application_programs(self.devices)
+
+    async def _load_application_programs_async(self, runner: StageRunner) -> None:
+        """
+        Load the application programs of all devices concurrently - one job per file.
+
+        With `workers` they are loaded in a single job using the process pool.
+        """
+        if self.workers is not None and self.workers > 1:
+            await runner.run(self._load_application_programs)
+            return
+
+        application_programs = await runner.run(
+            ApplicationProgramLoader.get_application_program_files_for_devices,
+            self.knx_proj_contents.root_path,
+            self.devices,
+        )
+        await runner.gather(
+            *(
+                runner.run(
+                    self._merge_application_program,
+                    application_program_file,
+                    devices,
+                    file=application_program_file.at,
+                )
+                for application_program_file, devices in application_programs.items()
+            )
+        )
 
+    def _merge_application_program(
+        self, application_program_file: Path, devices: list[DeviceInstance]
+    ) -> None:
+        """Merge an application program into its devices from the cache or the archive."""
+        cache = self.application_program_cache
+        info = self.knx_proj_contents.root.getinfo(application_program_file.at)
+        application_program_ref: str = devices[0].application_program_ref  # type: ignore[assignment]
+        if cache is None or not (tables := cache.get(application_program_ref, info)):
+            tables = ApplicationProgramLoader.load_tables(
+                application_program_file,
+                self._used_com_object_ref_ids(devices),
+                self.interner,
+            )
+            if cache is not None:
+                cache.set(application_program_ref, info, tables)
+        ApplicationProgramLoader.merge(devices, *tables)
+
+    def _merge_application_programs(
+        self, devices_to_merge: list[DeviceInstance]
+    ) -> None:
+        """Merge the application programs of some devices from the cache or the archive."""
         application_programs = (
             ApplicationProgramLoader.get_application_program_files_for_devices(
-                self.knx_proj_contents.root_path, self.devices
+                self.knx_proj_contents.root_path, devices_to_merge
             )
         )
+        cache = self.application_program_cache
+        pending: dict[Path, list[DeviceInstance]] = {}
         for application_program_file, devices in application_programs.items():
-            ApplicationProgramLoader.load(application_program_file, devices)
+            if cache is not None and (
+                tables := cache.get(
+                    devices[0].application_program_ref,  # type: ignore[arg-type]
+                    self.knx_proj_contents.root.getinfo(application_program_file.at),
+                )
+            ):
+                ApplicationProgramLoader.merge(devices, *tables)
+            else:
+                pending[application_program_file] = devices
+
+        for application_program_file, tables in self._load_application_program_tables(
+            pending
+        ):
+            devices = pending[application_program_file]
+            if cache is not None:
+                cache.set(
+                    devices[0].application_program_ref,  # type: ignore[arg-type]
+                    self.knx_proj_contents.root.getinfo(application_program_file.at),
+                    tables,
+                )
+            ApplicationProgramLoader.merge(devices, *tables)
+
+    def _load_application_program_tables(
+        self, application_programs: dict[Path, list[DeviceInstance]]
+    ) -> Iterator[tuple[Path, ApplicationProgramTables]]:
+        """Load application program tables - in a process pool if workers are set."""
+        if self.workers is None or self.workers < 2 or len(application_programs) < 2:
+            for application_program_file, devices in application_programs.items():
+                yield application_program_file, ApplicationProgramLoader.load_tables(
+                    application_program_file,
+                    self._used_com_object_ref_ids(devices),
+                    self.interner,
+                )
+            return
+
+        # application programs are stored unencrypted in the root archive so
+        # every worker can open and decompress them on its own
+        archive_path = str(self.knx_proj_contents.root.filename)
+        with ProcessPoolExecutor(
+            max_workers=min(self.workers, len(application_programs))
+        ) as executor:
+            futures = {
+                application_program_file: executor.submit(
+                    load_application_program_tables_in_worker,
+                    archive_path,
+                    application_program_file.at,
+                    self._used_com_object_ref_ids(devices),
+                )
+                for application_program_file, devices in application_programs.items()
+            }
+            for application_program_file, future in futures.items():
+                yield application_program_file, future.result()
+
+    def _used_com_object_ref_ids(
+        self, devices: list[DeviceInstance]
+    ) -> set[str] | None:
+        """Return the ComObject ref ids used by devices - None to load all of them."""
+        # cached tables have to contain all ComObjects for other projects
+        if self.application_program_cache is not None:
+            return None
+        return ApplicationProgramLoader.get_used_com_object_ref_ids(devices)
+
+    def _join_hardware(self) -> None:
+        """Resolve hardware and application program references of all devices."""
+        hardware_by_id = {hardware.identifier: hardware for hardware in self.hardware}
+        devices_by_hardware_ref: dict[str, list[DeviceInstance]] = {}
+        for device in self.devices:
+            devices_by_hardware_ref.setdefault(device.hardware_ref, []).append(device)
+
+        self.unmatched_hardware_refs = {}
+        self.unmatched_hardware_program_refs = {}
+        for hardware_ref, devices in devices_by_hardware_ref.items():
+            if (hardware := hardware_by_id.get(hardware_ref)) is None:
+                self.unmatched_hardware_refs[hardware_ref] = len(devices)
+                continue
+            for device in devices:
+                device.product_name = hardware.name
+                device.hardware_name = hardware.product_name
+
+                if application_program_ref := hardware.application_program_refs.get(
+                    device.hardware_program_ref
+                ):
+                    device.application_program_ref = application_program_ref
+                elif device.hardware_program_ref:
+                    unmatched_programs = self.unmatched_hardware_program_refs
+                    unmatched_programs[device.hardware_program_ref] = (
+                        unmatched_programs.get(device.hardware_program_ref, 0) + 1
+                    )
+
+        if self.unmatched_hardware_refs:
+            logger.warning(
+                "No hardware found for %d devices (%d hardware refs)",
+                sum(self.unmatched_hardware_refs.values()),
+                len(self.unmatched_hardware_refs),
+            )
+        if self.unmatched_hardware_program_refs:
+            logger.debug(
+                "No application program found for %d devices (%d hardware program refs)",
+                sum(self.unmatched_hardware_program_refs.values()),
+                len(self.unmatched_hardware_program_refs),
+            )
+
+    def _resolve_com_object_ref_ids(self) -> None:
+        """Prefix the ComObjectInstanceRef ref ids of all devices with their application program ref."""
+        # devices of an application program share most of their ref ids
+        resolved_ref_ids: dict[tuple[str, str], str] = {}
+        for device in self.devices:
+            if (application_program_ref := device.application_program_ref) is None:
+                continue
+            for com_object in device.com_object_instance_refs:
+                key = (application_program_ref, com_object.ref_id)
+                if (ref_id := resolved_ref_ids.get(key)) is None:
+                    ref_id = resolved_ref_ids[key] = self.interner(
+                        resolve_com_object_ref_id(*key)
+                    )
+                com_object.ref_id = ref_id
+
+    def _index_group_address_links(self) -> None:
+        """Map group address identifiers to the ids of their linked communication objects."""
+        # ComObjectInstanceRef ids are not unique across devices - last one wins
+        links_by_com_object: dict[str, list[str]] = {}
+        for device in self.devices:
+            for com_object in device.com_object_instance_refs:
+                if com_object.links:
+                    links_by_com_object[com_object.ref_id] = com_object.links
+
+        links: dict[str, list[str]] = {}
+        for com_object_id, group_address_ids in links_by_com_object.items():
+            for group_address_id in group_address_ids:
+                com_object_ids = links.setdefault(group_address_id, [])
+                # a link may be listed twice for the same communication object
+                if not com_object_ids or com_object_ids[-1] != com_object_id:
+                    com_object_ids.append(com_object_id)
+        self.group_address_links = links
+
+    # method names - subclasses override the methods
+    _STAGE_LOADERS: Final = {
+        "project": "_load_project",
+        "master_data": "_load_master_data",
+        "hardware": "_load_hardware",
+        "application_programs": "_load_application_programs",
+    }
+    # stages loaded by several jobs in `load_async` - the others run in a single
+    # job; subclasses overriding a stage loader have to override these too
+    _ASYNC_STAGE_LOADERS: ClassVar[dict[str, str]] = {
+        "hardware": "_load_hardware_async",
+        "application_programs": "_load_application_programs_async",
+    }
+    _SECTION_CONVERTERS: Final = {
+        "communication_objects": "_convert_communication_objects",
+        "topology": "_convert_topology",
+        "devices": "_convert_devices",
+        "group_addresses": "_convert_group_addresses",
+        "locations": "_convert_locations",
+    }
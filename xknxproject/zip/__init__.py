@@ -1,4 +1,18 @@
 """Package for reading KNXProj ZIP."""
-from .extractor import KNXProjContents, extract
+from .extractor import (
+    ExtractionStrategy,
+    KNXProjContents,
+    check_password,
+    clear_zip_password_cache,
+    derive_zip_password,
+    extract,
+)
 
-__all__ = ["KNXProjContents", "extract"]
+__all__ = [
+    "ExtractionStrategy",
+    "KNXProjContents",
+    "check_password",
+    "clear_zip_password_cache",
+    "derive_zip_password",
+    "extract",
+]
@@ -2,19 +2,57 @@
 from __future__ import annotations
 
 import base64
+from collections import OrderedDict
 from collections.abc import Iterator
 from contextlib import contextmanager
+from enum import Enum
+import hmac
+import io
+import logging
+import mmap
 from pathlib import Path
-from typing import IO
+import secrets
+import shutil
+import tempfile
+import threading
+import time
+from typing import IO, Final, cast
 from zipfile import Path as ZipPath, ZipFile, ZipInfo
 
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC
 import pyzipper
 
-from xknxproject.const import ETS6_SCHEMA_VERSION
+from xknxproject import instrumentation
+from xknxproject.const import (
+    ETS6_SCHEMA_VERSION,
+    ETS6_ZIP_PASSWORD_CACHE_SIZE,
+    EXTRACT_IN_MEMORY_MAX_SIZE,
+)
 from xknxproject.exceptions import InvalidPasswordException, ProjectNotFoundException
 
+logger = logging.getLogger("xknxproject.log")
+
+# {HMAC of an ETS6 password: derived ZIP password} - least recently used first
+# the HMAC key is random per process so the memo holds no checkable password
+_ETS6_ZIP_PASSWORDS: OrderedDict[bytes, bytes] = OrderedDict()
+_ETS6_ZIP_PASSWORDS_KEY: Final = secrets.token_bytes(32)
+_ETS6_ZIP_PASSWORDS_LOCK: Final = threading.Lock()
+
+
+class ExtractionStrategy(Enum):
+    """How the protected project archive is read from the KNXProj file."""
+
+    # read the nested archive from the compressed entry stream - every seek
+    # backwards inflates the entry again from its start
+    STREAM = "stream"
+    # inflate the nested archive once into memory
+    MEMORY = "memory"
+    # inflate the nested archive once into a memory mapped temporary file
+    MMAP = "mmap"
+    # MEMORY up to EXTRACT_IN_MEMORY_MAX_SIZE, MMAP above
+    AUTO = "auto"
+
 
 class KNXProjContents:
     """Class for holding the contents of a KNXProj file."""
@@ -32,12 +70,26 @@ class KNXProjContents:
         """Open the project 0 archive."""
         return self._project_0_archive.open(self._project_0_name, mode="r")
 
+    def project_0_info(self) -> ZipInfo:
+        """Return the ZipInfo of 0.xml - from the protected archive if protected."""
+        return self._project_0_archive.getinfo(self._project_0_name)
+
 
 @contextmanager
 def extract(
-    archive_path: Path, password: str | None = None
+    archive_path: Path,
+    password: str | None = None,
+    zip_password: bytes | None = None,
+    strategy: ExtractionStrategy = ExtractionStrategy.AUTO,
 ) -> Iterator[KNXProjContents]:
-    """Provide the contents of a KNXProj file."""
+    """
+    Provide the contents of a KNXProj file.
+
+    `zip_password` is the password of the protected project archive as returned
+    by `derive_zip_password`. If given, `password` is not needed and ETS6 key
+    derivation is skipped. `strategy` selects how the protected project archive
+    is read.
+    """
     with ZipFile(archive_path, mode="r") as zip_archive:
         project_id = _get_project_id(zip_archive)
         password_protected: bool
@@ -54,13 +106,58 @@ def extract(
             return
         # Password protected project
         with _extract_protected_project_file(
-            zip_archive, protected_info, password
+            zip_archive, protected_info, password, zip_password, strategy
         ) as project_zip:
             # ZipPath is not supported by pyzipper thus we use string name
             project_0_name = "0.xml"
             yield KNXProjContents(zip_archive, project_zip, project_0_name)
 
 
+def check_password(
+    archive_path: Path, password: str | None = None, zip_password: bytes | None = None
+) -> None:
+    """
+    Check the password of a KNXProj file - raise InvalidPasswordException if wrong.
+
+    Only the first entry of the protected project archive is opened and the
+    nested archive isn't kept in memory. Unprotected projects always pass.
+    """
+    with extract(archive_path, password, zip_password, ExtractionStrategy.STREAM):
+        pass
+
+
+def clear_zip_password_cache() -> None:
+    """
+    Forget the derived ETS6 ZIP passwords memoised by `extract`.
+
+    Up to ETS6_ZIP_PASSWORD_CACHE_SIZE derived passwords are kept in memory to
+    open a project again without repeating the key derivation.
+    """
+    with _ETS6_ZIP_PASSWORDS_LOCK:
+        _ETS6_ZIP_PASSWORDS.clear()
+
+
+def derive_zip_password(archive_path: Path, password: str) -> bytes:
+    """
+    Derive the password of the protected project archive of a KNXProj file.
+
+    The result can be passed to `extract` to parse a project multiple times,
+    e.g. in other processes, without repeating the ETS6 key derivation.
+    """
+    with ZipFile(archive_path, mode="r") as zip_archive:
+        return _derive_zip_password(password, _is_ets6_project(zip_archive))
+
+
+def _derive_zip_password(password: str | None, ets6: bool) -> bytes:
+    """Derive the password of the protected project archive."""
+    if not password:
+        raise InvalidPasswordException()
+    if ets6:
+        with instrumentation.nested_stage("key_derivation"):
+            return _generate_ets6_zip_password(password)
+    return password.encode("utf-8")
+
+
 def _get_project_id(zip_archive: ZipFile) -> str:
     """Get the project id."""
     for info in zip_archive.infolist():
@@ -72,29 +169,125 @@ def _get_project_id(zip_archive: ZipFile) -> str:
 
 @contextmanager
 def _extract_protected_project_file(
-    archive_zip: ZipFile, info: ZipInfo, password: str | None
+    archive_zip: ZipFile,
+    info: ZipInfo,
+    password: str | None,
+    zip_password: bytes | None = None,
+    strategy: ExtractionStrategy = ExtractionStrategy.AUTO,
 ) -> Iterator[ZipFile]:
     """Unzip a protected ETS5/6 project file."""
-    if not password:
-        raise InvalidPasswordException()
+    if not info.file_size:
+        raise ProjectNotFoundException()
+    ets6 = _is_ets6_project(archive_zip)
+    if zip_password is None:
+        zip_password = _derive_zip_password(password, ets6)
 
-    project_archive: ZipFile
-    if not _is_ets6_project(archive_zip):
+    with _open_nested_archive(archive_zip, info, strategy) as nested_archive:
+        project_archive: ZipFile
+        if not ets6:
+            project_archive = ZipFile(nested_archive, mode="r")
+        else:
+            project_archive = pyzipper.AESZipFile(nested_archive, mode="r")
+        project_archive.setpassword(zip_password)
+        if not (project_entries := project_archive.infolist()):
+            raise ProjectNotFoundException()
         try:
-            project_archive = ZipFile(archive_zip.open(info, mode="r"), mode="r")
-            project_archive.setpassword(password.encode("utf-8"))
+            # fail fast on a wrong password - opening an entry checks the password
+            project_archive.open(project_entries[0], mode="r").close()
             yield project_archive
         except RuntimeError as exception:
             raise InvalidPasswordException from exception
-    else:
+
+
+@contextmanager
+def _open_nested_archive(
+    archive_zip: ZipFile, info: ZipInfo, strategy: ExtractionStrategy
+) -> Iterator[IO[bytes]]:
+    """Open a ZIP entry containing a nested ZIP archive according to `strategy`."""
+    if strategy is ExtractionStrategy.AUTO:
+        strategy = (
+            ExtractionStrategy.MEMORY
+            if info.file_size <= EXTRACT_IN_MEMORY_MAX_SIZE
+            else ExtractionStrategy.MMAP
+        )
+    if strategy is ExtractionStrategy.STREAM:
+        with archive_zip.open(info, mode="r") as entry:
+            yield entry
+        return
+
+    start_time = time.perf_counter()
+    if strategy is ExtractionStrategy.MEMORY:
+        with instrumentation.nested_stage("inflate"):
+            buffer = io.BytesIO(archive_zip.read(info))
+            instrumentation.count_decompressed(info.file_size)
+        _log_inflated(info, strategy, start_time)
+        yield buffer
+        return
+
+    with tempfile.TemporaryFile() as temp_file:
+        with instrumentation.nested_stage("inflate"):
+            with archive_zip.open(info, mode="r") as entry:
+                shutil.copyfileobj(entry, temp_file)
+            temp_file.flush()
+            instrumentation.count_decompressed(info.file_size)
+        with mmap.mmap(temp_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            _log_inflated(info, strategy, start_time)
+            yield cast(IO[bytes], _MappedFile(mapped))
+
+
+def _log_inflated(
+    info: ZipInfo, strategy: ExtractionStrategy, start_time: float
+) -> None:
+    """Log the time needed to inflate a nested archive."""
+    logger.debug(
+        "Inflated %s (%d bytes) using %s in %.3f s",
+        info.filename,
+        info.file_size,
+        strategy.value,
+        time.perf_counter() - start_time,
+    )
+
+
+class _MappedFile(io.RawIOBase):
+    """Read-only seekable file object over a memory map."""
+
+    def __init__(self, mapped: mmap.mmap):
+        """Initialize a _MappedFile."""
+        super().__init__()
+        self._mapped = mapped
+
+    def readable(self) -> bool:
+        """Return True - the file is readable."""
+        return True
+
+    def seekable(self) -> bool:
+        """Return True - the file is seekable."""
+        return True
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        """Change the stream position."""
         try:
-            project_archive = pyzipper.AESZipFile(
-                archive_zip.open(info, mode="r"), mode="r"
-            )
-            project_archive.setpassword(_generate_ets6_zip_password(password))
-            yield project_archive
-        except RuntimeError as exception:
-            raise InvalidPasswordException from exception
+            self._mapped.seek(offset, whence)  # type: ignore[arg-type]
+        except ValueError as err:
+            # like files - ZipFile handles OSError for archives smaller than a record
+            raise OSError(err) from err
+        return self._mapped.tell()
+
+    def tell(self) -> int:
+        """Return the current stream position."""
+        return self._mapped.tell()
+
+    def read(self, size: int | None = -1) -> bytes:
+        """Read up to `size` bytes - all remaining bytes if negative or None."""
+        if size is None or size < 0:
+            return self._mapped.read()
+        return self._mapped.read(size)
+
+    def readinto(self, buffer: bytearray | memoryview) -> int:  # type: ignore[override]
+        """Read bytes into a pre-allocated buffer."""
+        data = self._mapped.read(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
 
 
 def _is_ets6_project(project_zip: ZipFile) -> bool:
@@ -108,10 +301,29 @@ def _is_ets6_project(project_zip: ZipFile) -> bool:
 
 
 def _generate_ets6_zip_password(password: str | None) -> bytes:
-    """Generate ZIP archive password."""
+    """Generate ZIP archive password. Memoised as the key derivation is slow by design."""
     if not password:
         return b""
 
+    memo_key = hmac.digest(
+        _ETS6_ZIP_PASSWORDS_KEY, password.encode("utf-16-le"), "sha256"
+    )
+    with _ETS6_ZIP_PASSWORDS_LOCK:
+        if (zip_password := _ETS6_ZIP_PASSWORDS.get(memo_key)) is not None:
+            _ETS6_ZIP_PASSWORDS.move_to_end(memo_key)
+            return zip_password
+
+    # derived outside the lock - concurrent derivations of other passwords don't wait
+    zip_password = _derive_ets6_zip_password(password)
+    with _ETS6_ZIP_PASSWORDS_LOCK:
+        _ETS6_ZIP_PASSWORDS[memo_key] = zip_password
+        while len(_ETS6_ZIP_PASSWORDS) > ETS6_ZIP_PASSWORD_CACHE_SIZE:
+            _ETS6_ZIP_PASSWORDS.popitem(last=False)
+    return zip_password
+
+
+def _derive_ets6_zip_password(password: str) -> bytes:
+    """Derive the ZIP archive password of an ETS6 project."""
     return base64.b64encode(
         PBKDF2HMAC(
             algorithm=hashes.SHA256(),